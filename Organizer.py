@@ -81,26 +81,31 @@ FILE_MOVES_JSON = Path(CONFIG.get("file_moves_json", SCRIPT_DIR / "config" / "js
 FILE_HASHES_JSON = Path(CONFIG.get("file_hashes_json", SCRIPT_DIR / "config" / "json" / "file_hashes.json"))
 NOTIFICATION_HISTORY_JSON = Path(CONFIG.get("notification_history_json", SCRIPT_DIR / "notification_history.json"))
 
-# Load extension map from config if available and normalize to dot-prefixed lower-case
-if CONFIG.get("routes"):
-    EXTENSION_MAP = {}
-    for cat, exts in CONFIG["routes"].items():
-        normalized = [("." + e.lower().lstrip('.')) for e in exts]
-        EXTENSION_MAP[cat] = normalized
-else:
-    EXTENSION_MAP = {
-        "Images": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".svg", ".webp", ".heic"],
-        "Music": [".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"],
-        "Videos": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"],
-        "Documents": [".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt", ".xls", ".xlsx", ".ppt", ".pptx", ".csv"],
-        "Archives": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"],
-        "Executables": [".exe", ".msi", ".bat", ".cmd", ".ps1"],
-        "Shortcuts": [".lnk", ".url"],
-        "Scripts": [".py", ".js", ".html", ".css", ".json", ".xml", ".sh", ".ts", ".php"],
-        "Fonts": [".ttf", ".otf", ".woff", ".woff2"],
-        "Logs": [".log"],
-        "Other": []
-    }
+_BUNDLED_EXTENSION_MAP = {
+    "Images": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".svg", ".webp", ".heic"],
+    "Music": [".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"],
+    "Videos": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"],
+    "Documents": [".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt", ".xls", ".xlsx", ".ppt", ".pptx", ".csv"],
+    "Archives": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"],
+    "Executables": [".exe", ".msi", ".bat", ".cmd", ".ps1"],
+    "Shortcuts": [".lnk", ".url"],
+    "Scripts": [".py", ".js", ".html", ".css", ".json", ".xml", ".sh", ".ts", ".php"],
+    "Fonts": [".ttf", ".otf", ".woff", ".woff2"],
+    "Logs": [".log"],
+    "Other": []
+}
+
+# Load extension map from config if available and normalize to dot-prefixed
+# lower-case. EXTENSION_INDEX, its inverse for per-file lookups, is filled in
+# the same pass; the first category listing an extension wins, as with the
+# old scan in category order
+EXTENSION_MAP = {}
+EXTENSION_INDEX = {}
+for cat, exts in (CONFIG.get("routes") or _BUNDLED_EXTENSION_MAP).items():
+    normalized = [("." + e.lower().lstrip('.')) for e in exts]
+    EXTENSION_MAP[cat] = normalized
+    for e in normalized:
+        EXTENSION_INDEX.setdefault(e, cat)
 
 # Optional per-extension custom destination mapping: {"ext": "C:/Target/Folder"}
 CUSTOM_ROUTES = {}
@@ -451,11 +456,7 @@ def organize_file(file_path: str, base_path: Path = DOWNLOADS_PATH) -> None:
             category_label = "Custom"
         else:
             # Priority 3: Fallback to category-based routing inside Downloads
-            target_dir = "Other"
-            for category, extensions in EXTENSION_MAP.items():
-                if ext in extensions:
-                    target_dir = category
-                    break
+            target_dir = EXTENSION_INDEX.get(ext, "Other")
             dest_dir = base_path / target_dir
             category_label = target_dir
     dest_dir.mkdir(parents=True, exist_ok=True)
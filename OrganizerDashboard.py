@@ -1,6 +1,14 @@
+"""OrganizerDashboard
+
+Flask-based dashboard to monitor and control the DownloadsOrganizer service.
+This module exposes JSON endpoints used by the UI (AJAX) and renders a
+single-page dashboard with controls, logs, and configuration.
+"""
 
 import os
 import sys
+from functools import lru_cache
+from importlib import import_module
 
 # --- Package Name Collision Shim ---
 # When running this script directly as OrganizerDashboard.py, Python will prefer the file
@@ -14,96 +22,42 @@ _pkg_dir = os.path.join(_script_dir, _pkg_name)
 if _script_dir not in sys.path:
     sys.path.insert(0, _script_dir)
 
-# Force package resolution by setting up the package module
-if os.path.isdir(_pkg_dir):
-    if _pkg_name not in sys.modules:
-        import types
-        pkg = types.ModuleType(_pkg_name)
-        pkg.__path__ = [_pkg_dir]
-        pkg.__file__ = os.path.join(_pkg_dir, '__init__.py')
-        sys.modules[_pkg_name] = pkg
-
-from flask import Flask
-from flask_login import LoginManager, UserMixin
-from flask_wtf.csrf import CSRFProtect
-import json
+# Force package resolution by setting up the package module (checked against
+# sys.modules first, so re-executing this module skips the stat)
+if _pkg_name not in sys.modules and os.path.isdir(_pkg_dir):
+    import types
+    pkg = types.ModuleType(_pkg_name)
+    pkg.__path__ = [_pkg_dir]
+    pkg.__file__ = os.path.join(_pkg_dir, '__init__.py')
+    sys.modules[_pkg_name] = pkg
 
-"""OrganizerDashboard
+from flask import Flask, has_request_context, request, url_for
+from flask_login import LoginManager
+from flask_wtf.csrf import CSRFProtect
 
-Flask-based dashboard to monitor and control the DownloadsOrganizer service.
-This module exposes JSON endpoints used by the UI (AJAX) and renders a
-single-page dashboard with controls, logs, and configuration.
-"""
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 # --- Service and Config ---
-SERVICE_NAME = "DownloadsOrganizer"
-CONFIG_FILE = "organizer_config.json"
-DASHBOARD_CONFIG_FILE = "dashboard_config.json"
-
-DEFAULT_CONFIG = {
-    "routes": {
-        "Images": ["jpg", "jpeg", "png", "gif", "bmp", "tiff", "svg", "webp", "heic"],
-        "Music": ["mp3", "wav", "flac", "aac", "ogg", "wma", "m4a"],
-        "Videos": ["mp4", "mkv", "avi", "mov", "wmv", "flv", "webm"],
-        "Documents": ["pdf", "doc", "docx", "txt", "rtf", "odt", "xls", "xlsx", "ppt", "pptx", "csv"],
-        "Archives": ["zip", "rar", "7z", "tar", "gz", "bz2"],
-        "Executables": ["exe", "msi", "bat", "cmd", "ps1"],
-        "Shortcuts": ["lnk", "url"],
-        "Scripts": ["py", "js", "html", "css", "json", "xml", "sh", "ts", "php"],
-        "Fonts": ["ttf", "otf", "woff", "woff2"],
-        "Logs": ["log"],
-        "Other": []
-    },
-    "memory_threshold_mb": 200,
-    "cpu_threshold_percent": 60,
-    "logs_dir": r"C:\Scripts\service-logs",
-    "auth_method": "basic",
-    "auth_fallback_enabled": True,
-    "ldap_config": {
-        "server": "",
-        "base_dn": "",
-        "user_dn_template": "uid={username},{base_dn}",
-        "use_ssl": True,
-        "bind_dn": "",
-        "bind_password": "",
-        "search_filter": "(uid={username})",
-        "allowed_groups": []
-    },
-    "windows_auth_config": {
-        "domain": "",
-        "allowed_groups": []
-    },
-    # Per-extension custom destinations (absolute folder paths)
-    "custom_routes": {}
-}
+from OrganizerDashboard._defaults import (
+    SERVICE_NAME, CONFIG_FILE, DASHBOARD_CONFIG_FILE, DEFAULT_CONFIG,
+    resolve_admin_credentials, resolve_log_paths,
+)
 
-from OrganizerDashboard.config_runtime import initialize as rt_init, get_config, get_dashboard_config
+from OrganizerDashboard.config_runtime import initialize as rt_init, get_config, get_dashboard_config, save_dashboard_config
 rt_init(CONFIG_FILE, DASHBOARD_CONFIG_FILE, DEFAULT_CONFIG, {})
 config = get_config()
 
 # --- Authentication Globals ---
-ADMIN_USER = os.environ.get("DASHBOARD_USER", "admin")
-ADMIN_PASS = os.environ.get("DASHBOARD_PASS", "change_this_password")
-ADMIN_PASS_HASH = None
-
-# If credentials are stored in the config file, prefer them
-if isinstance(config, dict):
-    dashboard_user = config.get("dashboard_user")
-    dashboard_pass = config.get("dashboard_pass")
-    dashboard_pass_hash = config.get("dashboard_pass_hash")
-    if dashboard_user:
-        ADMIN_USER = dashboard_user
-    if dashboard_pass_hash:
-        ADMIN_PASS_HASH = dashboard_pass_hash.encode('utf-8')
-    elif dashboard_pass:
-        ADMIN_PASS = dashboard_pass
+# Environment defaults, overridden by credentials stored in the config file
+ADMIN_USER, ADMIN_PASS, ADMIN_PASS_HASH = resolve_admin_credentials(config)
 
 # --- Log Paths ---
 def update_log_paths():
     global LOGS_DIR, STDOUT_LOG, STDERR_LOG
-    LOGS_DIR = config.get("logs_dir", DEFAULT_CONFIG["logs_dir"])
-    STDOUT_LOG = os.path.join(LOGS_DIR, "organizer_stdout.log")
-    STDERR_LOG = os.path.join(LOGS_DIR, "organizer_stderr.log")
+    LOGS_DIR, STDOUT_LOG, STDERR_LOG = resolve_log_paths(config)
 
 update_log_paths()
 
@@ -169,13 +123,15 @@ DASHBOARD_CONFIG_DEFAULT = {
     }
 }
 
-from OrganizerDashboard.config_runtime import save_dashboard_config
 dashboard_config = get_dashboard_config()
-if not os.path.exists(DASHBOARD_CONFIG_FILE):
-    try:
-        save_dashboard_config()
-    except Exception:
-        pass
+try:
+    # Write the defaults out on first run; an existing file raises
+    # FileExistsError and is left alone
+    save_dashboard_config(create_only=True)
+except FileExistsError:
+    pass
+except OSError as e:
+    print(f"✗ Could not create {DASHBOARD_CONFIG_FILE}: {e}")
 
 # --- Populate Package Namespace ---
 # Routes import OrganizerDashboard and expect these attributes to be available
@@ -192,19 +148,118 @@ if _pkg_name in sys.modules:
         pass
 
 # --- Flask App and Blueprint Registration ---
+# (module, blueprint attribute, url_prefix), in registration order
+BLUEPRINTS = [
+    ('OrganizerDashboard.routes.dashboard', 'routes_dashboard', None),
+    ('OrganizerDashboard.routes.update_config', 'routes_update_config', '/api'),
+    ('OrganizerDashboard.routes.metrics', 'routes_metrics', None),
+    ('OrganizerDashboard.routes.service_name', 'routes_service_name', None),
+    ('OrganizerDashboard.routes.auth_check', 'routes_auth_check', None),
+    ('OrganizerDashboard.routes.restart_service', 'routes_restart_service', None),
+    ('OrganizerDashboard.routes.stop_service', 'routes_stop_service', None),
+    ('OrganizerDashboard.routes.start_service', 'routes_start_service', None),
+    ('OrganizerDashboard.routes.tail', 'routes_tail', None),
+    ('OrganizerDashboard.routes.stream', 'routes_stream', None),
+    ('OrganizerDashboard.routes.events', 'routes_events', None),
+    ('OrganizerDashboard.routes.clear_log', 'routes_clear_log', None),
+    ('OrganizerDashboard.routes.change_password', 'routes_change_password', None),
+    ('OrganizerDashboard.routes.drives', 'routes_drives', None),
+    ('OrganizerDashboard.routes.network', 'routes_network', None),
+    ('OrganizerDashboard.routes.tasks', 'routes_tasks', None),
+    ('OrganizerDashboard.routes.hardware', 'routes_hardware', None),
+    ('OrganizerDashboard.routes.dashboard_state', 'routes_dashboard_state', None),
+    ('OrganizerDashboard.routes.api_recent_files', 'routes_api_recent_files', None),
+    ('OrganizerDashboard.routes.api_open_file', 'routes_api_open_file', None),
+    ('OrganizerDashboard.routes.auth_settings', 'routes_auth_settings', None),
+    ('OrganizerDashboard.routes.dashboard_config', 'routes_dashboard_config', None),
+    ('OrganizerDashboard.routes.auth_session', 'routes_auth_session', None),
+    ('OrganizerDashboard.routes.service_install', 'routes_service_install', None),
+    ('OrganizerDashboard.routes.factory_reset', 'routes_factory_reset', None),
+    ('OrganizerDashboard.routes.setup', 'routes_setup', None),
+    ('OrganizerDashboard.routes.login', 'routes_login', None),
+    ('OrganizerDashboard.routes.admin_tools', 'routes_admin_tools', None),
+    ('OrganizerDashboard.routes.csrf_token', 'routes_csrf', None),
+    ('OrganizerDashboard.routes.branding', 'routes_branding', None),
+    ('OrganizerDashboard.routes.user_links', 'routes_user_links', None),
+    ('OrganizerDashboard.routes.reports', 'reports_bp', None),
+    ('OrganizerDashboard.routes.statistics', 'routes_statistics', None),
+    ('OrganizerDashboard.routes.notifications', 'routes_notifications', None),
+    ('OrganizerDashboard.routes.changelog', 'routes_changelog', None),
+    ('OrganizerDashboard.routes.config_backup', 'routes_config_backup', None),
+    ('OrganizerDashboard.routes.watch_folders', 'routes_watch_folders', None),
+    ('OrganizerDashboard.routes.docs', 'routes_docs', None),
+    ('OrganizerDashboard.routes.duplicates', 'routes_duplicates', None),
+    ('OrganizerDashboard.routes.dev_reset', 'routes_dev_reset', None),
+    ('OrganizerDashboard.routes.env_test', 'routes_env', None),
+    ('OrganizerDashboard.routes.unc_credentials', 'routes_unc_creds', None),
+]
+# Blueprints the dashboard can run without; a failed import is logged and skipped
+OPTIONAL_BLUEPRINTS = {'routes_api_recent_files'}
+# Blueprints exempt from CSRF checks
+CSRF_EXEMPT_BLUEPRINTS = {
+    # Setup and login run before a session exists
+    'routes_setup', 'routes_login',
+    'routes_dev_reset',  # Dev-only, no auth required
+    # Config update API relies on auth + basic rights
+    'routes_update_config',
+    # Service control endpoints are guarded by auth/rights server-side
+    'routes_start_service', 'routes_stop_service', 'routes_restart_service',
+    # Environment test utility endpoints (includes POST to run pytest)
+    'routes_env',
+}
+
+
+def cached_import(module_path, attr):
+    """Return module_path.attr, importing the module only if it isn't loaded yet.
+
+    Checks sys.modules first so building a second app (tests, reloads) doesn't
+    go back through the import machinery for every blueprint.
+    """
+    module = sys.modules.get(module_path)
+    spec = getattr(module, '__spec__', None)
+    if module is None or getattr(spec, '_initializing', False):
+        module = import_module(module_path)
+    return getattr(module, attr)
+
+
+@lru_cache(maxsize=512)
+def _user_role(user_id, version):
+    """Role of user_id in the dashboard config; version keys out stale entries."""
+    for u in get_dashboard_config().get('users', []):
+        if u.get('username') == user_id:
+            return u.get('role') or 'viewer'
+    return 'viewer'
+
+
+def load_user(user_id):
+    """Flask-Login user_loader: the session's user with its current role."""
+    from OrganizerDashboard.routes.login import User
+    try:
+        from OrganizerDashboard.config_runtime import get_dashboard_version
+        # Picks up external edits (bumping the version) before the lookup
+        get_dashboard_config()
+        return User(user_id, _user_role(user_id, get_dashboard_version()))
+    except Exception:
+        return User(user_id)
+
+
 def create_app():
     """Application factory to create and configure the Flask app.
     Ensures auth manager sees current config by setting __main__ to this module.
     """
-    # Make this module the __main__ for auth manager expectations
-    import sys as _sys
-    # Safely set __main__ for auth manager expectations, even when dynamically imported
-    try:
-        _sys.modules['__main__'] = sys.modules[__name__]
-    except KeyError:
-        _sys.modules['__main__'] = _sys.modules.get('__main__', sys.modules[__name__])
+    # Make this module the __main__ for auth manager expectations, even when
+    # dynamically imported
+    module = sys.modules.get(__name__)
+    if module is not None:
+        sys.modules['__main__'] = module
 
     app = Flask(__name__, template_folder='dash')
+    # jsonify()/get_json() through orjson (falls back to json when it's missing)
+    from OrganizerDashboard.helpers.helpers import OrjsonProvider
+    app.json = OrjsonProvider(app)
+    # Serve templates without their source indentation
+    from OrganizerDashboard.helpers.helpers import StripIndentExtension
+    app.jinja_env.add_extension(StripIndentExtension)
     # Basic secret key for session cookies; can be overridden via env
     app.secret_key = os.environ.get('DASHBOARD_SECRET_KEY', 'downloads_organizer_secret')
     
@@ -221,6 +276,65 @@ def create_app():
     app.config['PERMANENT_SESSION_LIFETIME'] = 14 * 24 * 60 * 60  # 14 days
     app.config['WTF_CSRF_TIME_LIMIT'] = None  # No token expiry for long sessions
 
+    # Static URLs carry the file's mtime (?v=...), so an edited asset gets a new
+    # URL and browsers may keep each version for a year without revalidating.
+    # Vendored assets live under version-stamped paths and qualify regardless.
+    # Like compiled templates, versions are looked up once unless templates
+    # auto-reload, so rendering a page doesn't stat every asset it links.
+    static_versions = {}
+
+    @app.url_defaults
+    def _version_static_urls(endpoint, values):
+        if endpoint == 'static' and 'filename' in values and 'v' not in values:
+            filename = values['filename']
+            version = None if app.jinja_env.auto_reload else static_versions.get(filename)
+            if version is None:
+                try:
+                    version = static_versions[filename] = int(os.stat(os.path.join(app.static_folder, filename)).st_mtime)
+                except (OSError, TypeError):
+                    return
+            values['v'] = version
+
+    # The finished static URLs are fixed just the same, so templates reuse
+    # each one rather than going through URL building on every render
+    static_urls = {}
+
+    def _template_url_for(endpoint, **values):
+        if (endpoint == 'static' and values.keys() == {'filename'}
+                and has_request_context() and not app.jinja_env.auto_reload):
+            key = (request.script_root, values['filename'])
+            url = static_urls.get(key)
+            if url is None:
+                url = static_urls[key] = url_for(endpoint, **values)
+            return url
+        return url_for(endpoint, **values)
+
+    app.jinja_env.globals['url_for'] = _template_url_for
+
+    @app.after_request
+    def _cache_vendor_assets(response):
+        if response.status_code == 200 and request.path.startswith('/static/') and (
+                'v' in request.args or request.path.startswith('/static/vendor/')):
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response
+
+    # Compress pages and JSON responses (Brotli when available, else gzip).
+    # Streaming responses (/stream, /tail) are left alone so they flush per line.
+    from OrganizerDashboard.helpers import static_assets
+    if Compress is not None:
+        app.config['COMPRESS_MIMETYPES'] = static_assets.COMPRESS_MIMETYPES
+        app.config['COMPRESS_LEVEL'] = 5
+        app.config['COMPRESS_BR_LEVEL'] = 5
+        app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+        app.config['COMPRESS_STREAMS'] = False
+        Compress(app)
+
+    # Static CSS/JS bypass Flask-Compress (send_file), so serve them from an
+    # in-memory Brotli/gzip cache instead
+    static_assets.install(app)
+    if Compress is None:
+        app.after_request(static_assets.compress_response)
+
     # Flask-Login setup
     login_manager = LoginManager()
     login_manager.init_app(app)
@@ -229,148 +343,71 @@ def create_app():
     _lm_any: _Any = login_manager
     _lm_any.login_view = 'routes_login.login_page'
 
-    class User(UserMixin):
-        def __init__(self, username, role='viewer'):
-            self.id = username
-            self.role = role
+    login_manager.user_loader(load_user)
 
-    @login_manager.user_loader
-    def load_user(user_id):
+    # Import and register all blueprints from routes
+    for module_path, attr, url_prefix in BLUEPRINTS:
         try:
-            from OrganizerDashboard.config_runtime import get_dashboard_config
-            dash_cfg = get_dashboard_config()
-            role = 'viewer'
-            for u in dash_cfg.get('users', []):
-                if u.get('username') == user_id:
-                    role = u.get('role') or 'viewer'
-                    break
-            return User(user_id, role)
-        except Exception:
-            return User(user_id)
+            bp = cached_import(module_path, attr)
+        except Exception as e:
+            if attr not in OPTIONAL_BLUEPRINTS:
+                raise
+            print(f"✗ Failed to import {attr}: {e}")
+            import traceback
+            traceback.print_exc()
+            continue
+        if url_prefix:
+            app.register_blueprint(bp, url_prefix=url_prefix)
+        else:
+            app.register_blueprint(bp)
+        if attr in CSRF_EXEMPT_BLUEPRINTS:
+            csrf.exempt(bp)
 
-    # Import and register all blueprints from routes
-    from OrganizerDashboard.routes.dashboard import routes_dashboard
-    from OrganizerDashboard.routes.update_config import routes_update_config
-    from OrganizerDashboard.routes.metrics import routes_metrics
-    from OrganizerDashboard.routes.service_name import routes_service_name
-    from OrganizerDashboard.routes.auth_check import routes_auth_check
-    from OrganizerDashboard.routes.restart_service import routes_restart_service
-    from OrganizerDashboard.routes.stop_service import routes_stop_service
-    from OrganizerDashboard.routes.start_service import routes_start_service
-    from OrganizerDashboard.routes.tail import routes_tail
-    from OrganizerDashboard.routes.stream import routes_stream
-    from OrganizerDashboard.routes.clear_log import routes_clear_log
-    from OrganizerDashboard.routes.change_password import routes_change_password
-    from OrganizerDashboard.routes.drives import routes_drives
-    from OrganizerDashboard.routes.network import routes_network
-    from OrganizerDashboard.routes.tasks import routes_tasks
-    from OrganizerDashboard.routes.hardware import routes_hardware
-    try:
-        from OrganizerDashboard.routes.api_recent_files import routes_api_recent_files
-        print("✓ api_recent_files imported successfully")
-    except Exception as e:
-        print(f"✗ Failed to import api_recent_files: {e}")
-        import traceback
-        traceback.print_exc()
-        routes_api_recent_files = None
-    from OrganizerDashboard.routes.api_open_file import routes_api_open_file
-    from OrganizerDashboard.routes.auth_settings import routes_auth_settings
-    from OrganizerDashboard.routes.dashboard_config import routes_dashboard_config
-    from OrganizerDashboard.routes.auth_session import routes_auth_session
-    from OrganizerDashboard.routes.service_install import routes_service_install
-    from OrganizerDashboard.routes.factory_reset import routes_factory_reset
-    from OrganizerDashboard.routes.setup import routes_setup
-    from OrganizerDashboard.routes.admin_tools import routes_admin_tools
-    from OrganizerDashboard.routes.login import routes_login
-    from OrganizerDashboard.routes.csrf_token import routes_csrf
-    from OrganizerDashboard.routes.user_links import routes_user_links
-    from OrganizerDashboard.routes.reports import reports_bp
-    from OrganizerDashboard.routes.branding import routes_branding
-    from OrganizerDashboard.routes.statistics import routes_statistics
-    from OrganizerDashboard.routes.notifications import routes_notifications
-    from OrganizerDashboard.routes.changelog import routes_changelog
-    from OrganizerDashboard.routes.config_backup import routes_config_backup
-    from OrganizerDashboard.routes.watch_folders import routes_watch_folders
-    from OrganizerDashboard.routes.duplicates import routes_duplicates
-    from OrganizerDashboard.routes.docs import routes_docs
-    from OrganizerDashboard.routes.dev_reset import routes_dev_reset
-    from OrganizerDashboard.routes.env_test import routes_env
-    from OrganizerDashboard.routes.unc_credentials import routes_unc_creds
-
-    app.register_blueprint(routes_dashboard)
-    app.register_blueprint(routes_update_config, url_prefix='/api')
-    app.register_blueprint(routes_metrics)
-    app.register_blueprint(routes_service_name)
-    app.register_blueprint(routes_auth_check)
-    app.register_blueprint(routes_restart_service)
-    app.register_blueprint(routes_stop_service)
-    app.register_blueprint(routes_start_service)
-    app.register_blueprint(routes_tail)
-    app.register_blueprint(routes_stream)
-    app.register_blueprint(routes_clear_log)
-    app.register_blueprint(routes_change_password)
-    app.register_blueprint(routes_drives)
-    app.register_blueprint(routes_network)
-    app.register_blueprint(routes_tasks)
-    app.register_blueprint(routes_hardware)
-    if routes_api_recent_files:
-        print("Registering routes_api_recent_files blueprint...")
-        app.register_blueprint(routes_api_recent_files)
-        print("✓ routes_api_recent_files registered")
-    else:
-        print("⚠ Skipping routes_api_recent_files (import failed)")
-    app.register_blueprint(routes_api_open_file)
-    app.register_blueprint(routes_auth_settings)
-    app.register_blueprint(routes_dashboard_config)
-    app.register_blueprint(routes_auth_session)
-    app.register_blueprint(routes_service_install)
-    app.register_blueprint(routes_factory_reset)
-    app.register_blueprint(routes_setup)
-    app.register_blueprint(routes_login)
-    app.register_blueprint(routes_admin_tools)
-    app.register_blueprint(routes_csrf)
-    app.register_blueprint(routes_branding)
-    app.register_blueprint(routes_user_links)
-    app.register_blueprint(reports_bp)
-    app.register_blueprint(routes_statistics)
-    app.register_blueprint(routes_notifications)
-    app.register_blueprint(routes_changelog)
-    app.register_blueprint(routes_config_backup)
-    app.register_blueprint(routes_watch_folders)
-    app.register_blueprint(routes_docs)
-    app.register_blueprint(routes_duplicates)
-    app.register_blueprint(routes_dev_reset)
-    app.register_blueprint(routes_env)
-    app.register_blueprint(routes_unc_creds)
-
-    # Exempt setup and login blueprints from CSRF (run before session exists)
-    csrf.exempt(routes_setup)
-    csrf.exempt(routes_login)
-    csrf.exempt(routes_dev_reset)  # Dev-only, no auth required
-    # Exempt config update API from CSRF; relies on auth + basic rights
-    csrf.exempt(routes_update_config)
-    # Exempt service control endpoints; guarded by auth/rights server-side
-    csrf.exempt(routes_start_service)
-    csrf.exempt(routes_stop_service)
-    csrf.exempt(routes_restart_service)
-    # Exempt environment test utility endpoints (includes POST to run pytest)
-    csrf.exempt(routes_env)
-
-    # Initialize authentication manager after all globals are set
-    from OrganizerDashboard.auth.auth import initialize_auth_manager
-    initialize_auth_manager()
-
-    # Debug: List all registered routes
-    print("\n=== Registered Routes ===")
-    for rule in app.url_map.iter_rules():
-        if 'recent_files' in rule.rule:
-            methods = ', '.join(rule.methods) if rule.methods else 'GET'
-            print(f"  {rule.rule} -> {rule.endpoint} [{methods}]")
-    print("========================\n")
+    # Initialize authentication manager after all globals are set; first-run
+    # password hashing happens off the start-up path
+    from OrganizerDashboard.auth.auth import initialize_auth_manager_async
+    initialize_auth_manager_async()
+
+    # Start the CPU/network samplers now so their first deltas are ready by the
+    # time the dashboard is opened
+    from OrganizerDashboard.helpers.samplers import prewarm
+    prewarm()
+    # The public IP lookup is an external round-trip and the host probes can
+    # hit the registry or DNS; keep both off requests
+    from OrganizerDashboard.helpers.helpers import start_public_ip_refresher, prewarm_host_info
+    start_public_ip_refresher()
+    prewarm_host_info()
+    from OrganizerDashboard.helpers.helpers import precompile_templates
+    precompile_templates(app)
+
+    # Debug: List registered routes (opt-in, kept off normal start-ups)
+    if os.environ.get("DASHBOARD_DEBUG_ROUTES") == "1":
+        print("\n=== Registered Routes ===")
+        for rule in app.url_map.iter_rules():
+            if 'recent_files' in rule.rule:
+                methods = ', '.join(rule.methods) if rule.methods else 'GET'
+                print(f"  {rule.rule} -> {rule.endpoint} [{methods}]")
+        print("========================\n")
 
     return app
 
 # --- Main Entry Point ---
 if __name__ == "__main__":
+    app = create_app()
     print("✅ Dashboard running at http://localhost:5000")
-    create_app().run(host="0.0.0.0", port=5000)
+    # Serve with waitress (multi-threaded, works on Windows) so one slow request
+    # such as a bcrypt verify doesn't hold up the others. Each open log/metrics
+    # stream keeps a thread busy, hence the generous default.
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+    if serve is not None and os.environ.get("DASHBOARD_DEV_SERVER") != "1":
+        serve(
+            app, host="0.0.0.0", port=5000,
+            threads=int(os.environ.get("DASHBOARD_THREADS", "16")),
+            # Keep-alive connections from several tabs count against this
+            connection_limit=int(os.environ.get("DASHBOARD_CONNECTION_LIMIT", "1000")),
+        )
+    else:
+        app.run(host="0.0.0.0", port=5000, threaded=True)
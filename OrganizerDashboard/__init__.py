@@ -1,64 +1,31 @@
 # Makes OrganizerDashboard a package
 # Export config and globals for use by routes and other modules
 
+import copy
 import os
-import json
+import threading
+from OrganizerDashboard.config_runtime import read_json
 
 # --- Service and Config ---
-SERVICE_NAME = "DownloadsOrganizer"
-CONFIG_FILE = "organizer_config.json"
+from OrganizerDashboard._defaults import (
+    SERVICE_NAME, CONFIG_FILE, DEFAULT_CONFIG, resolve_admin_credentials, resolve_log_paths,
+)
 
-DEFAULT_CONFIG = {
-    "routes": {
-        "Images": ["jpg", "jpeg", "png", "gif", "bmp", "tiff", "svg", "webp", "heic"],
-        "Music": ["mp3", "wav", "flac", "aac", "ogg", "wma", "m4a"],
-        "Videos": ["mp4", "mkv", "avi", "mov", "wmv", "flv", "webm"],
-        "Documents": ["pdf", "doc", "docx", "txt", "rtf", "odt", "xls", "xlsx", "ppt", "pptx", "csv"],
-        "Archives": ["zip", "rar", "7z", "tar", "gz", "bz2"],
-        "Executables": ["exe", "msi", "bat", "cmd", "ps1"],
-        "Shortcuts": ["lnk", "url"],
-        "Scripts": ["py", "js", "html", "css", "json", "xml", "sh", "ts", "php"],
-        "Fonts": ["ttf", "otf", "woff", "woff2"],
-        "Logs": ["log"],
-        "Other": []
-    },
-    "memory_threshold_mb": 200,
-    "cpu_threshold_percent": 60,
-    "logs_dir": r"C:\Scripts\service-logs"
-}
-
-config = DEFAULT_CONFIG.copy()
+config = copy.deepcopy(DEFAULT_CONFIG)
 if os.path.exists(CONFIG_FILE):
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            loaded = json.load(f)
-        config.update(loaded)
+        config.update(read_json(CONFIG_FILE))
     except Exception:
         pass
 
 # --- Authentication Globals ---
-ADMIN_USER = os.environ.get("DASHBOARD_USER", "admin")
-ADMIN_PASS = os.environ.get("DASHBOARD_PASS", "change_this_password")
-ADMIN_PASS_HASH = None
-
-# If credentials are stored in the config file, prefer them
-if isinstance(config, dict):
-    dashboard_user = config.get("dashboard_user")
-    dashboard_pass = config.get("dashboard_pass")
-    dashboard_pass_hash = config.get("dashboard_pass_hash")
-    if dashboard_user:
-        ADMIN_USER = dashboard_user
-    if dashboard_pass_hash:
-        ADMIN_PASS_HASH = dashboard_pass_hash.encode('utf-8')
-    elif dashboard_pass:
-        ADMIN_PASS = dashboard_pass
+# Environment defaults, overridden by credentials stored in the config file
+ADMIN_USER, ADMIN_PASS, ADMIN_PASS_HASH = resolve_admin_credentials(config)
 
 # --- Log Paths ---
 def update_log_paths():
     global LOGS_DIR, STDOUT_LOG, STDERR_LOG
-    LOGS_DIR = config.get("logs_dir", DEFAULT_CONFIG["logs_dir"])
-    STDOUT_LOG = os.path.join(LOGS_DIR, "organizer_stdout.log")
-    STDERR_LOG = os.path.join(LOGS_DIR, "organizer_stderr.log")
+    LOGS_DIR, STDOUT_LOG, STDERR_LOG = resolve_log_paths(config)
 
 LOGS_DIR = None
 STDOUT_LOG = None
@@ -70,21 +37,68 @@ __all__ = ['config', 'ADMIN_USER', 'ADMIN_PASS', 'ADMIN_PASS_HASH', 'SERVICE_NAM
 # --- App Factory Bridge ---
 # Tests import OrganizerDashboard and expect a create_app() symbol.
 # Provide a thin wrapper that delegates to the top-level OrganizerDashboard.py.
+# Building the app re-executes that whole module (config I/O, blueprint
+# registration, background samplers), so the first app is kept and returned
+# to every later caller; reset_app_cache() forces a fresh one.
+_app_cache = None
+_app_lock = threading.Lock()
+
 def create_app():
+    global _app_cache
+    if _app_cache is not None:
+        return _app_cache
+    with _app_lock:
+        if _app_cache is None:
+            _app_cache = _build_app()
+        return _app_cache
+
+def reset_app_cache():
+    """Drop the cached app and entry module so the next create_app() starts fresh."""
+    global _app_cache
+    import sys as _sys
+    with _app_lock:
+        _app_cache = None
+        _sys.modules.pop(_ENTRY_NAME, None)
+
+_ENTRY_NAME = 'OrganizerDashboard_entry'
+
+def _entry_module():
+    """OrganizerDashboard.py as a module, executing it only if nothing has yet.
+
+    When the dashboard runs as ``python OrganizerDashboard.py`` the script is
+    already loaded as __main__; running its top level a second time would
+    re-read both configs and reset the runtime state it set up.
+    """
     import importlib.util
     import sys as _sys
-    import os as _os
-    root = _os.path.dirname(_os.path.dirname(__file__))
-    entry = _os.path.join(root, 'OrganizerDashboard.py')
-    spec = importlib.util.spec_from_file_location('OrganizerDashboard_entry', entry)
-    if spec and spec.loader:
-        mod = importlib.util.module_from_spec(spec)
-        # Register the dynamic module name so OrganizerDashboard.py can reference sys.modules[__name__]
-        import sys as _sys
-        _sys.modules[spec.name] = mod
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    entry = os.path.join(root, 'OrganizerDashboard.py')
+    main = _sys.modules.get('__main__')
+    # Only the script itself: create_app() also aliases __main__ to the entry
+    # module, and that alias must not outlive reset_app_cache()
+    if (getattr(main, '__name__', None) == '__main__' and getattr(main, '__file__', None)
+            and os.path.abspath(main.__file__) == entry and hasattr(main, 'create_app')):
+        return main
+    mod = _sys.modules.get(_ENTRY_NAME)
+    if mod is not None:
+        return mod
+    spec = importlib.util.spec_from_file_location(_ENTRY_NAME, entry)
+    if not (spec and spec.loader):
+        return None
+    mod = importlib.util.module_from_spec(spec)
+    # Register the dynamic module name so OrganizerDashboard.py can reference sys.modules[__name__]
+    _sys.modules[spec.name] = mod
+    try:
         spec.loader.exec_module(mod)
-        if hasattr(mod, 'create_app'):
-            return mod.create_app()
+    except BaseException:
+        _sys.modules.pop(spec.name, None)
+        raise
+    return mod
+
+def _build_app():
+    mod = _entry_module()
+    if mod is not None and hasattr(mod, 'create_app'):
+        return mod.create_app()
     raise AttributeError('OrganizerDashboard.create_app not available')
 
-__all__.append('create_app')
\ No newline at end of file
+__all__ += ['create_app', 'reset_app_cache']
@@ -0,0 +1,79 @@
+"""Defaults and start-up helpers shared by OrganizerDashboard.py and the package.
+
+Both the script and the package __init__ load the organizer config and
+derive the admin credentials and log paths from it; they import the
+definitions from here so the two can't drift apart.
+"""
+import os
+
+# --- Service and Config ---
+SERVICE_NAME = "DownloadsOrganizer"
+CONFIG_FILE = "organizer_config.json"
+DASHBOARD_CONFIG_FILE = "dashboard_config.json"
+
+DEFAULT_CONFIG = {
+    "routes": {
+        "Images": ["jpg", "jpeg", "png", "gif", "bmp", "tiff", "svg", "webp", "heic"],
+        "Music": ["mp3", "wav", "flac", "aac", "ogg", "wma", "m4a"],
+        "Videos": ["mp4", "mkv", "avi", "mov", "wmv", "flv", "webm"],
+        "Documents": ["pdf", "doc", "docx", "txt", "rtf", "odt", "xls", "xlsx", "ppt", "pptx", "csv"],
+        "Archives": ["zip", "rar", "7z", "tar", "gz", "bz2"],
+        "Executables": ["exe", "msi", "bat", "cmd", "ps1"],
+        "Shortcuts": ["lnk", "url"],
+        "Scripts": ["py", "js", "html", "css", "json", "xml", "sh", "ts", "php"],
+        "Fonts": ["ttf", "otf", "woff", "woff2"],
+        "Logs": ["log"],
+        "Other": []
+    },
+    "memory_threshold_mb": 200,
+    "cpu_threshold_percent": 60,
+    "logs_dir": r"C:\Scripts\service-logs",
+    "auth_method": "basic",
+    "auth_fallback_enabled": True,
+    "ldap_config": {
+        "server": "",
+        "base_dn": "",
+        "user_dn_template": "uid={username},{base_dn}",
+        "use_ssl": True,
+        "bind_dn": "",
+        "bind_password": "",
+        "search_filter": "(uid={username})",
+        "allowed_groups": []
+    },
+    "windows_auth_config": {
+        "domain": "",
+        "allowed_groups": []
+    },
+    # Per-extension custom destinations (absolute folder paths)
+    "custom_routes": {}
+}
+
+
+def resolve_admin_credentials(config):
+    """Return (user, password, password_hash) from the environment and config.
+
+    Credentials stored in the config file take precedence over the
+    DASHBOARD_USER/DASHBOARD_PASS environment variables; a stored hash wins
+    over a plain password.
+    """
+    user = os.environ.get("DASHBOARD_USER", "admin")
+    password = os.environ.get("DASHBOARD_PASS", "change_this_password")
+    password_hash = None
+    if isinstance(config, dict):
+        if config.get("dashboard_user"):
+            user = config["dashboard_user"]
+        if config.get("dashboard_pass_hash"):
+            password_hash = config["dashboard_pass_hash"].encode('utf-8')
+        elif config.get("dashboard_pass"):
+            password = config["dashboard_pass"]
+    return user, password, password_hash
+
+
+def resolve_log_paths(config):
+    """Return (logs_dir, stdout_log, stderr_log) for the organizer service."""
+    logs_dir = config.get("logs_dir", DEFAULT_CONFIG["logs_dir"])
+    return (
+        logs_dir,
+        os.path.join(logs_dir, "organizer_stdout.log"),
+        os.path.join(logs_dir, "organizer_stderr.log"),
+    )
@@ -1,22 +1,29 @@
+import base64
+import binascii
 import bcrypt
+import hashlib
+import hmac
 import json
+import os
 import sys
 import platform
-from flask import Response, request, g
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from flask import Response, request, g, current_app, jsonify
 try:
-    from flask_login import current_user
+    from flask_login import current_user, login_user
 except Exception:
     current_user = None
-from functools import wraps
-from typing import Optional, Dict, Any
+    login_user = None
+from collections import deque, namedtuple
+from functools import lru_cache, wraps
+from importlib.util import find_spec
+from typing import Optional, Dict, Any, Tuple
 
-# Optional imports with graceful fallbacks
-try:
-    from ldap3 import Server, Connection, ALL, NTLM
-    from ldap3.core.exceptions import LDAPException
-    LDAP_AVAILABLE = True
-except ImportError:
-    LDAP_AVAILABLE = False
+# Optional imports with graceful fallbacks. ldap3 is a heavy import that only
+# LDAP logins need, so just check it is installed; it is loaded on first use.
+LDAP_AVAILABLE = find_spec('ldap3') is not None
 
 try:
     if platform.system() == 'Windows':
@@ -50,6 +57,84 @@ except ImportError:
     WINDOWS_AUTH_AVAILABLE = False
 
 
+def _bcrypt_cost() -> int:
+    # A malformed BCRYPT_COST must not keep the dashboard from starting
+    try:
+        cost = int(os.environ.get("BCRYPT_COST", "10"))
+    except ValueError:
+        cost = 10
+    return min(max(cost, 4), 31)
+
+# bcrypt work factor for newly created hashes (each +1 doubles hashing and
+# verification time). Existing hashes keep the cost they were created with.
+BCRYPT_COST = _bcrypt_cost()
+
+# bcrypt runs on a small dedicated pool so a burst of logins or password
+# changes can occupy at most BCRYPT_WORKERS cores, whatever the server's
+# thread count
+BCRYPT_WORKERS = 2
+_bcrypt_pool = ThreadPoolExecutor(max_workers=BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+
+
+def hash_password(password: str) -> bytes:
+    """Hash password with bcrypt at the configured BCRYPT_COST."""
+    salt = bcrypt.gensalt(rounds=BCRYPT_COST)
+    return _bcrypt_pool.submit(bcrypt.hashpw, password.encode('utf-8'), salt).result()
+
+
+def verify_password(password: str, hashed: bytes) -> bool:
+    """Check password against a bcrypt hash (any cost) on the bcrypt pool."""
+    return _bcrypt_pool.submit(bcrypt.checkpw, password.encode('utf-8'), hashed).result()
+
+
+_rate_limit_lock = threading.Lock()
+
+
+def rate_limit(max_calls: int, period: float):
+    """Allow each client address at most max_calls requests per period seconds.
+
+    Guards endpoints where every request can cost a bcrypt round; excess
+    requests get 429 with Retry-After. Counters are kept per app in memory.
+    """
+    def wrapper(f):
+        @wraps(f)
+        def inner(*args, **kwargs):
+            buckets = current_app.extensions.setdefault('rate_limits', {})
+            swept = current_app.extensions.setdefault('rate_limits_swept', {})
+            key = (request.endpoint, request.remote_addr)
+            now = time.monotonic()
+            with _rate_limit_lock:
+                # Once per period, drop this endpoint's buckets whose window has
+                # emptied, so clients that went away don't accumulate
+                if now - swept.get(request.endpoint, float('-inf')) >= period:
+                    swept[request.endpoint] = now
+                    idle = [k for k, h in buckets.items()
+                            if k[0] == request.endpoint and (not h or now - h[-1] >= period)]
+                    for k in idle:
+                        del buckets[k]
+                hits = buckets.setdefault(key, deque())
+                while hits and now - hits[0] >= period:
+                    hits.popleft()
+                if len(hits) >= max_calls:
+                    retry_after = max(1, int(period - (now - hits[0])) + 1)
+                    resp = jsonify({"status": "error", "message": "Too many attempts, try again later"})
+                    resp.status_code = 429
+                    resp.headers['Retry-After'] = str(retry_after)
+                    return resp
+                hits.append(now)
+            return f(*args, **kwargs)
+        return inner
+    return wrapper
+
+
+
+def _consteq(a: Optional[str], b: Optional[str]) -> bool:
+    """Constant-time string comparison (hmac.compare_digest on UTF-8 bytes)."""
+    if a is None or b is None:
+        return False
+    return hmac.compare_digest(a.encode('utf-8'), b.encode('utf-8'))
+
+
 class AuthProvider:
     """Base authentication provider interface."""
     
@@ -69,7 +154,10 @@ class BasicAuthProvider(AuthProvider):
         self.config = config
         self.admin_user = config.get('dashboard_user', 'admin')
         self.admin_pass_hash = None
-        self._initialize_password_hash()
+        from OrganizerDashboard.config_runtime import deferred_saves
+        # Migration may touch both files more than once; write each one once
+        with deferred_saves():
+            self._initialize_password_hash()
     
     def _initialize_password_hash(self):
         """Initialize the password hash from config or environment using runtime config."""
@@ -119,7 +207,7 @@ class BasicAuthProvider(AuthProvider):
         
         plain = get_config().get("dashboard_pass")
         if plain:
-            self.admin_pass_hash = bcrypt.hashpw(plain.encode('utf-8'), bcrypt.gensalt())
+            self.admin_pass_hash = hash_password(plain)
             try:
                 cfg = get_config()
                 cfg['dashboard_pass_hash'] = self.admin_pass_hash.decode('utf-8')
@@ -151,7 +239,12 @@ class BasicAuthProvider(AuthProvider):
         
         # Use default password from environment
         default_pass = getattr(main, 'ADMIN_PASS', 'change_this_password') if main is not None else 'change_this_password'
-        self.admin_pass_hash = bcrypt.hashpw(default_pass.encode('utf-8'), bcrypt.gensalt())
+        default_hash = hash_password(default_pass)
+        # Hashing may run on the start-up thread; a concurrent setup could
+        # have stored a real hash meanwhile, which must win over the default.
+        if get_config().get("dashboard_pass_hash"):
+            return self._initialize_password_hash()
+        self.admin_pass_hash = default_hash
         try:
             cfg = get_config()
             cfg['dashboard_user'] = self.admin_user
@@ -181,9 +274,9 @@ class BasicAuthProvider(AuthProvider):
     def authenticate(self, username: str, password: str) -> bool:
         """Verify username/password against stored bcrypt hash or dashboard_config users."""
         # Primary admin user
-        if username == self.admin_user and self.admin_pass_hash is not None:
+        if _consteq(username, self.admin_user) and self.admin_pass_hash is not None:
             try:
-                return bcrypt.checkpw(password.encode('utf-8'), self.admin_pass_hash)
+                return verify_password(password, self.admin_pass_hash)
             except Exception:
                 return False
 
@@ -193,17 +286,17 @@ class BasicAuthProvider(AuthProvider):
             dashboard_config = get_dashboard_config()
             users = dashboard_config.get('users', [])
             for u in users:
-                if u.get('username') == username:
+                if _consteq(u.get('username'), username):
                     pwd_hash = u.get('password_hash')
                     if pwd_hash:
                         try:
-                            return bcrypt.checkpw(password.encode('utf-8'), pwd_hash.encode('utf-8'))
+                            return verify_password(password, pwd_hash.encode('utf-8'))
                         except Exception:
                             return False
                     # Fallback: if this is the admin user and we have admin_pass_hash
-                    if username == self.admin_user and self.admin_pass_hash is not None:
+                    if _consteq(username, self.admin_user) and self.admin_pass_hash is not None:
                         try:
-                            return bcrypt.checkpw(password.encode('utf-8'), self.admin_pass_hash)
+                            return verify_password(password, self.admin_pass_hash)
                         except Exception:
                             return False
                     return False
@@ -235,6 +328,8 @@ class LDAPAuthProvider(AuthProvider):
         """Authenticate against LDAP server."""
         if not self.is_available():
             return False
+        from ldap3 import Server, Connection, ALL
+        from ldap3.core.exceptions import LDAPException
         
         try:
             # Create server connection
@@ -381,10 +476,51 @@ class AuthManager:
 # Global auth manager instance
 _auth_manager: Optional[AuthManager] = None
 
+# Verified-credential cache: the UI polls with Basic auth, and each bcrypt
+# verify costs tens of milliseconds. Entries are keyed by a keyed BLAKE2 digest
+# of (epoch, username, password); bumping the epoch invalidates everything.
+_AUTH_CACHE_TTL = 30.0  # seconds
+_AUTH_CACHE_MAX = 256
+_auth_cache: Dict[bytes, tuple] = {}
+_auth_cache_lock = threading.Lock()
+_auth_cache_key = os.urandom(32)
+_auth_epoch = 0
+# username -> HMAC-SHA256 (per-process key) of the last password that passed a
+# full verify, with when it expires; lets checks after the TTL expires skip
+# bcrypt too. Bounded so a password changed or revoked outside the dashboard
+# (LDAP, Windows) stops working without a restart.
+_VERIFIED_MAC_TTL = 15 * 60.0  # seconds
+_verified_macs: Dict[str, Tuple[bytes, float]] = {}
 
-def initialize_auth_manager():
-    """Initialize the global auth manager with config from main module."""
-    global _auth_manager
+# Set once an auth manager is available; cleared while start-up init runs
+_auth_ready = threading.Event()
+_auth_ready.set()
+
+
+def invalidate_auth_cache():
+    """Drop cached verification results (call after any credential change)."""
+    global _auth_epoch
+    with _auth_cache_lock:
+        _auth_epoch += 1
+        _auth_cache.clear()
+        _verified_macs.clear()
+    # Decoded headers hold plaintext passwords; don't keep old ones around
+    _parse_basic.cache_clear()
+
+
+def _password_mac(password: str) -> bytes:
+    return hmac.new(_auth_cache_key, password.encode('utf-8'), hashlib.sha256).digest()
+
+
+def _auth_digest(username: str, password: str) -> bytes:
+    h = hashlib.blake2b(key=_auth_cache_key, digest_size=16)
+    h.update(f"{_auth_epoch}\0{username}\0".encode('utf-8'))
+    h.update(password.encode('utf-8'))
+    return h.digest()
+
+
+def _build_auth_manager() -> AuthManager:
+    """Create an auth manager from the runtime config (or __main__ as fallback)."""
     try:
         from OrganizerDashboard.config_runtime import get_config
         cfg = get_config()
@@ -399,14 +535,34 @@ def initialize_auth_manager():
                 setattr(_main, 'ADMIN_PASS_HASH', dash_hash.encode('utf-8') if isinstance(dash_hash, str) else None)
         except Exception:
             pass
-        _auth_manager = AuthManager(cfg)
+        return AuthManager(cfg)
     except Exception:
         # Fallback to legacy behavior using __main__ if available
         try:
             main = sys.modules['__main__']
-            _auth_manager = AuthManager(getattr(main, 'config', {}))
+            return AuthManager(getattr(main, 'config', {}))
         except Exception:
-            _auth_manager = AuthManager({})
+            return AuthManager({})
+
+
+def initialize_auth_manager():
+    """Initialize the global auth manager with config from main module."""
+    global _auth_manager
+    invalidate_auth_cache()
+    try:
+        _auth_manager = _build_auth_manager()
+    finally:
+        _auth_ready.set()
+
+
+def initialize_auth_manager_async():
+    """Initialize the auth manager on a daemon thread.
+
+    First-run hashing of the default password costs a full bcrypt round, so
+    app start-up doesn't wait for it; check_auth blocks until it is ready.
+    """
+    _auth_ready.clear()
+    threading.Thread(target=initialize_auth_manager, name='auth-init', daemon=True).start()
 
 
 def initialize_password_hash():
@@ -415,11 +571,43 @@ def initialize_password_hash():
 
 
 def check_auth(username: str, password: str) -> bool:
-    """Verify username/password using configured auth manager."""
+    """Verify username/password using configured auth manager.
+
+    Results are cached for _AUTH_CACHE_TTL seconds so repeated polls with the
+    same credentials skip the password KDF. Past the TTL, a password that
+    already passed a full verify in the last _VERIFIED_MAC_TTL seconds is
+    recognised by a constant-time HMAC compare.
+    """
     global _auth_manager
+    _auth_ready.wait(timeout=30)
     if _auth_manager is None:
         initialize_auth_manager()
-    return _auth_manager.authenticate(username, password) if _auth_manager else False
+    if _auth_manager is None:
+        return False
+    digest = _auth_digest(username, password)
+    now = time.monotonic()
+    mac = _password_mac(password)
+    with _auth_cache_lock:
+        hit = _auth_cache.get(digest)
+        known = _verified_macs.get(username)
+        epoch = _auth_epoch
+    if hit is not None and now < hit[0]:
+        return hit[1]
+    verified = False
+    if known is not None and now < known[1] and hmac.compare_digest(known[0], mac):
+        result = True
+    else:
+        result = verified = _auth_manager.authenticate(username, password)
+    with _auth_cache_lock:
+        if verified and epoch == _auth_epoch:
+            _verified_macs[username] = (mac, now + _VERIFIED_MAC_TTL)
+        if len(_auth_cache) >= _AUTH_CACHE_MAX:
+            for k in [k for k, (exp, _) in _auth_cache.items() if exp <= now]:
+                del _auth_cache[k]
+            if len(_auth_cache) >= _AUTH_CACHE_MAX:
+                _auth_cache.clear()
+        _auth_cache[digest] = (now + _AUTH_CACHE_TTL, result)
+    return result
 
 
 def authenticate():
@@ -430,24 +618,85 @@ def authenticate():
     )
 
 
+def _session_user() -> Optional[str]:
+    """Return the username from the signed session cookie, if any."""
+    if current_user is None:
+        return None
+    try:
+        if current_user.is_authenticated:
+            return current_user.get_id()
+    except Exception:
+        pass
+    return None
+
+
+def _establish_session(username: str):
+    """Issue a signed session cookie after a successful Basic login.
+
+    Later requests then verify the cookie's HMAC signature instead of running
+    the password KDF again. No remember cookie: the session ends with the
+    browser session, and staying logged in is left to the /login choice.
+    """
+    if login_user is None:
+        return
+    try:
+        from OrganizerDashboard.routes.login import User, _resolve_role
+        login_user(User(username, _resolve_role(username)), remember=False)
+    except Exception:
+        pass
+
+
+BasicCredentials = namedtuple('BasicCredentials', 'username password')
+
+
+@lru_cache(maxsize=64)
+def _parse_basic(header: str) -> Optional[BasicCredentials]:
+    """Decode a Basic Authorization header; memoised per raw header value.
+
+    The UI repeats the same header on every poll, so the base64 decode runs
+    once per distinct credential pair.
+    """
+    scheme, _, token = header.partition(' ')
+    if scheme.lower() != 'basic' or not token:
+        return None
+    try:
+        decoded = base64.b64decode(token.strip(), validate=True).decode('utf-8')
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+    username, sep, password = decoded.partition(':')
+    if not sep:
+        return None
+    return BasicCredentials(username, password)
+
+
+def basic_auth() -> Optional[BasicCredentials]:
+    """Return the request's Basic credentials (username, password), if any."""
+    header = request.headers.get('Authorization')
+    return _parse_basic(header) if header else None
+
+
+def _request_user() -> Optional[str]:
+    """Resolve the caller: signed session first, then Basic credentials."""
+    auth = basic_auth()
+    username = _session_user()
+    # An explicit Basic header for a different account wins over the session
+    if username and (not auth or _consteq(auth.username or '', username)):
+        return username
+    if auth and check_auth(auth.username or '', auth.password or ''):
+        _establish_session(auth.username)
+        return auth.username
+    return None
+
+
 def requires_auth(f):
     """Decorator to require authentication for a route."""
     @wraps(f)
     def decorated(*args, **kwargs):
-        auth = request.authorization
-        # First, accept Basic auth if provided
-        if auth and check_auth(auth.username or '', auth.password or ''):
-            g.current_user = auth.username
-            return f(*args, **kwargs)
-        # Fallback to session-based authentication
-        if current_user is not None:
-            try:
-                if current_user.is_authenticated:
-                    g.current_user = current_user.get_id()
-                    return f(*args, **kwargs)
-            except Exception:
-                pass
-        return authenticate()
+        username = _request_user()
+        if not username:
+            return authenticate()
+        g.current_user = username
+        return f(*args, **kwargs)
     return decorated
 
 def requires_right(right_name: str):
@@ -455,17 +704,7 @@ def requires_right(right_name: str):
     def wrapper(f):
         @wraps(f)
         def inner(*args, **kwargs):
-            auth = request.authorization
-            username = None
-            # Try Basic auth first
-            if auth and check_auth(auth.username or '', auth.password or ''):
-                username = auth.username
-            elif current_user is not None:
-                try:
-                    if current_user.is_authenticated:
-                        username = current_user.get_id()
-                except Exception:
-                    username = None
+            username = _request_user()
             if not username:
                 return authenticate()
             g.current_user = username
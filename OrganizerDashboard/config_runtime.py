@@ -1,63 +1,338 @@
 """Runtime config accessor to decouple routes from __main__ module.
 Provides in-memory copies of organizer and dashboard configs and file paths.
 """
+import atexit
+import copy
 import json
-from typing import Dict, Any
+import mmap
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _config: Dict[str, Any] = {}
 _dashboard_config: Dict[str, Any] = {}
+# Bumped whenever the dashboard config may have changed (load, reload, save),
+# so callers can cache values derived from it keyed on the version
+_dashboard_version = 0
 _config_path: str = "organizer_config.json"
 _dash_config_path: str = "dashboard_config.json"
+_default_config: Dict[str, Any] = {}
+_default_dash: Dict[str, Any] = {}
+# st_mtime_ns of each config file as last read or written by this process
+_mtimes: Dict[str, Optional[int]] = {}
+# Saves requested inside deferred_saves() on this thread, flushed on exit
+_deferral = threading.local()
+# Serializes reloads from disk so two threads don't reparse the same edit
+_reload_lock = threading.Lock()
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _remember(path: str) -> None:
+    _mtimes[os.path.abspath(path)] = _mtime_ns(path)
+
+def _changed_on_disk(path: str) -> bool:
+    current = _mtime_ns(path)
+    return current is not None and _mtimes.get(os.path.abspath(path)) != current
+
+def read_json(path: str) -> Any:
+    """Parse the JSON file at path, using orjson when it is installed.
+
+    With orjson the file is memory-mapped and parsed straight from the mapped
+    bytes, skipping the read() copy; json falls back to a plain bytes read.
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped; let the parser report them
+                return orjson.loads(b'')
+            with mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+        return json.loads(f.read())
+
+def _load_file(path: str) -> Optional[Dict[str, Any]]:
+    _remember(path)
+    try:
+        loaded = read_json(path)
+    except Exception:
+        return None
+    return loaded if isinstance(loaded, dict) else None
+
+def _fresh_defaults(defaults: Dict[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
+    """Defaults to merge under loaded, deep-copied only where loaded doesn't override them."""
+    return {k: loaded[k] if k in loaded else copy.deepcopy(v) for k, v in defaults.items()}
 
 def initialize(config_path: str, dash_config_path: str, default_config: Dict[str, Any], default_dash: Dict[str, Any]):
-    global _config_path, _dash_config_path, _config, _dashboard_config
+    global _config_path, _dash_config_path, _config, _dashboard_config, _default_config, _default_dash, _dashboard_version
     _config_path = config_path
     _dash_config_path = dash_config_path
-    _config = default_config.copy()
-    _dashboard_config = default_dash.copy()
+    _default_config = default_config
+    _default_dash = default_dash
+    # Deep copies: the defaults' nested lists/dicts must never be edited through the live config
+    _config = copy.deepcopy(default_config)
+    _dashboard_config = copy.deepcopy(default_dash)
     try:
-        with open(_config_path, 'r', encoding='utf-8') as f:
-            loaded = json.load(f)
+        loaded = read_json(_config_path)
         if isinstance(loaded, dict):
             _config.update(loaded)
     except Exception:
         pass
     try:
-        with open(_dash_config_path, 'r', encoding='utf-8') as f:
-            loaded_dash = json.load(f)
+        loaded_dash = read_json(_dash_config_path)
         if isinstance(loaded_dash, dict):
             for k, v in default_dash.items():
                 if k not in loaded_dash:
-                    loaded_dash[k] = v
+                    loaded_dash[k] = copy.deepcopy(v)
             _dashboard_config = loaded_dash
     except Exception:
         pass
+    _remember(_config_path)
+    _remember(_dash_config_path)
+    _dashboard_version += 1
+
+def _replace_contents(target: Dict[str, Any], merged: Dict[str, Any]) -> None:
+    # Overwrite and then drop stale keys, never clear(): threads reading target
+    # meanwhile see old or new values, not a missing 'users' or 'folders'
+    target.update(merged)
+    for key in [k for k in target if k not in merged]:
+        del target[key]
+
+def _merged(defaults: Dict[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
+    merged = _fresh_defaults(defaults, loaded)
+    merged.update(loaded)
+    return merged
 
 def get_config() -> Dict[str, Any]:
+    """Return the organizer config, reparsing only if the file's mtime changed.
+
+    External edits are merged into the existing dict in place so modules
+    holding a reference to it see the new values.
+    """
+    if _changed_on_disk(_config_path):
+        with _reload_lock:
+            if _changed_on_disk(_config_path):
+                loaded = _load_file(_config_path)
+                if loaded is not None:
+                    _replace_contents(_config, _merged(_default_config, loaded))
     return _config
 
 def get_dashboard_config() -> Dict[str, Any]:
+    """Return the dashboard config, reparsing only if the file's mtime changed."""
+    global _dashboard_version
+    if _changed_on_disk(_dash_config_path):
+        with _reload_lock:
+            if _changed_on_disk(_dash_config_path):
+                loaded = _load_file(_dash_config_path)
+                if loaded is not None:
+                    _replace_contents(_dashboard_config, _merged(_default_dash, loaded))
+                    _dashboard_version += 1
     return _dashboard_config
 
 def reload_dashboard_config() -> Dict[str, Any]:
     """Reload dashboard config from disk into runtime cache and return it."""
-    global _dashboard_config
+    global _dashboard_version
+    with _reload_lock:
+        try:
+            loaded_dash = read_json(_dash_config_path)
+            if isinstance(loaded_dash, dict):
+                _replace_contents(_dashboard_config, _merged(_default_dash, loaded_dash))
+                _dashboard_version += 1
+        except Exception:
+            pass
+        _remember(_dash_config_path)
+    return _dashboard_config
+
+def _encode(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _same_contents(path: str, body: bytes) -> bool:
+    # A save that wouldn't change the file is skipped: reading a small config
+    # back is cheaper than rewriting it, and its mtime stays put
     try:
-        with open(_dash_config_path, 'r', encoding='utf-8') as f:
-            loaded_dash = json.load(f)
-        if isinstance(loaded_dash, dict):
-            _dashboard_config = loaded_dash
-    except Exception:
+        if os.path.getsize(path) != len(body):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == body
+    except OSError:
+        return False
+
+def _discard(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
         pass
-    return _dashboard_config
+
+def _write_temp(path: str, body: bytes) -> str:
+    """Write body to a new temp file beside path and return its name."""
+    # A temp file of its own per write: several threads may save one path at once
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(body)
+    except BaseException:
+        _discard(tmp)
+        raise
+    return tmp
+
+def _replace_file(path: str, body: bytes) -> None:
+    if _same_contents(path, body):
+        return
+    tmp = _write_temp(path, body)
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        _discard(tmp)
+        raise
+    _remember(path)
+
+def _bump_if_dashboard(path: str) -> None:
+    # Routes that edit users/roles write the dashboard file directly; since the
+    # recorded mtime means no reload follows, the write itself must bump
+    global _dashboard_version
+    if os.path.abspath(path) == os.path.abspath(_dash_config_path):
+        _dashboard_version += 1
+
+def write_json(path: str, data: Any) -> None:
+    """Serialize data to path, using orjson when it is installed.
+
+    Writes go to a temp file that is swapped in with os.replace, so readers
+    never see a half-written config; the new mtime is recorded so our own
+    writes don't trigger a reparse.
+    """
+    _bump_if_dashboard(path)
+    _replace_file(path, _encode(data))
+
+# Serialized configs waiting for the writer thread, latest snapshot per path
+_pending_writes: Dict[str, bytes] = {}
+_writes_cond = threading.Condition()
+_writes_busy = False
+_writer_thread: Optional[threading.Thread] = None
+
+def _writer() -> None:
+    global _writes_busy
+    while True:
+        with _writes_cond:
+            while not _pending_writes:
+                _writes_cond.wait()
+            batch = dict(_pending_writes)
+            _pending_writes.clear()
+            _writes_busy = True
+        try:
+            for path, body in batch.items():
+                try:
+                    _replace_file(path, body)
+                except OSError as e:
+                    print(f"Error saving {path}: {e}")
+        finally:
+            with _writes_cond:
+                _writes_busy = False
+                _writes_cond.notify_all()
+
+def write_json_async(path: str, data: Dict[str, Any]) -> None:
+    """Queue data to be written to path by a background thread.
+
+    The snapshot is serialized right away, so later in-memory changes can't
+    leak into it; only the file I/O leaves the request. Repeated saves of
+    one path before the writer gets to it collapse into the latest.
+    """
+    global _writer_thread
+    body = _encode(data)
+    _bump_if_dashboard(path)
+    with _writes_cond:
+        _pending_writes[path] = body
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer, name="config-writer", daemon=True)
+            _writer_thread.start()
+            # Don't lose a queued save when the dashboard shuts down
+            atexit.register(flush_writes, 5.0)
+        _writes_cond.notify_all()
+
+def flush_writes(timeout: Optional[float] = None) -> bool:
+    """Wait until queued writes are on disk; False if timeout expired first."""
+    with _writes_cond:
+        return _writes_cond.wait_for(lambda: not _pending_writes and not _writes_busy, timeout)
+
+def _dirty() -> Optional[set]:
+    return getattr(_deferral, 'dirty', None)
+
+def _flush_config(dirty: set) -> None:
+    if 'config' in dirty:
+        write_json(_config_path, _config)
+    if 'dashboard' in dirty:
+        write_json(_dash_config_path, _dashboard_config)
+    dirty.clear()
+
+@contextmanager
+def deferred_saves():
+    """Coalesce save_config()/save_dashboard_config() calls on this thread.
+
+    Start-up mutations may save the same file several times in a row; inside
+    this block they only mark it dirty and each file is written once on exit.
+    """
+    if _dirty() is not None:
+        yield
+        return
+    _deferral.dirty = set()
+    try:
+        yield
+    finally:
+        dirty = _deferral.dirty
+        _deferral.dirty = None
+        _flush_config(dirty)
 
 def save_config() -> None:
-    with open(_config_path, 'w', encoding='utf-8') as f:
-        json.dump(_config, f, indent=4)
+    dirty = _dirty()
+    if dirty is not None:
+        dirty.add('config')
+        return
+    write_json(_config_path, _config)
+
+def get_dashboard_version() -> int:
+    """Counter that changes whenever the dashboard config is loaded or saved."""
+    return _dashboard_version
+
+def save_dashboard_config(create_only: bool = False) -> None:
+    """Write the dashboard config to disk.
 
-def save_dashboard_config() -> None:
-    with open(_dash_config_path, 'w', encoding='utf-8') as f:
-        json.dump(_dashboard_config, f, indent=4)
+    With create_only the file is only created, never replaced: the body is
+    written to a temp file that is hard-linked into place, which fails with
+    FileExistsError when the file is already there, so no separate existence
+    check is needed and a crash mid-write can't leave a truncated config.
+    """
+    global _dashboard_version
+    if create_only:
+        tmp = _write_temp(_dash_config_path, _encode(_dashboard_config))
+        try:
+            os.link(tmp, _dash_config_path)
+        finally:
+            _discard(tmp)
+        _remember(_dash_config_path)
+        return
+    # Saving is how routes publish in-place edits (users, roles)
+    _dashboard_version += 1
+    dirty = _dirty()
+    if dirty is not None:
+        dirty.add('dashboard')
+        return
+    write_json(_dash_config_path, _dashboard_config)
 
 def get_paths() -> Dict[str, str]:
     return {"config_path": _config_path, "dash_config_path": _dash_config_path}
@@ -6,22 +6,131 @@ import platform
 import subprocess
 import socket
 import json
+import re
+import threading
+from collections import deque
+from functools import lru_cache, wraps
+from flask import Response, current_app, request
+from flask.json.provider import DefaultJSONProvider
+from jinja2.ext import Extension
+from OrganizerDashboard.config_runtime import read_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if sys.platform == "win32":
+    import winreg
+else:
+    winreg = None
+
+def ttl_cache(seconds: float):
+    """Memoise a no-argument function's result for ``seconds``.
+
+    Meant for probes that every poll repeats (process scans, ``sc query``);
+    concurrent callers wait for one refresh instead of each running the probe.
+    ``fn.cache_clear()`` forces the next call to probe again.
+    """
+    def decorator(fn):
+        lock = threading.Lock()
+        entry = {"value": None, "expires": 0.0}
+
+        @wraps(fn)
+        def wrapper():
+            with lock:
+                now = time.monotonic()
+                if now >= entry["expires"]:
+                    entry["value"] = fn()
+                    entry["expires"] = now + seconds
+                return entry["value"]
+
+        def cache_clear():
+            with lock:
+                entry["expires"] = 0.0
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+def compiled_template(name: str):
+    """Return the compiled Jinja template ``name``, resolved once per app.
+
+    Skips the loader lookup and up-to-date check on every render; when
+    template auto-reload is on (debug) the template is resolved each time so
+    edits still show up.
+    """
+    env = current_app.jinja_env
+    if env.auto_reload:
+        return env.get_template(name)
+    cache = current_app.extensions.setdefault("compiled_templates", {})
+    tmpl = cache.get(name)
+    if tmpl is None:
+        tmpl = cache[name] = env.get_template(name)
+    return tmpl
+
+_LEADING_WS = re.compile(r'^[ \t]+', re.MULTILINE)
+
+class StripIndentExtension(Extension):
+    """Drop leading indentation from .html template source before compiling.
+
+    Indentation is about a third of the rendered dashboard. Stripping it once
+    at compile time costs nothing per request; templates containing <pre> or
+    <textarea>, where whitespace is significant, are left untouched.
+    """
+
+    def preprocess(self, source, name, filename=None):
+        if not (name or '').endswith('.html') or '<pre' in source or '<textarea' in source:
+            return source
+        return _LEADING_WS.sub('', source)
+
+def precompile_templates(app):
+    """Compile every .html template into the compiled_template cache.
+
+    Runs on a daemon thread at start-up so the first request for each page
+    (and the modules it includes) doesn't pay the Jinja parse.
+    """
+    env = app.jinja_env
+    if env.auto_reload:
+        return
+
+    def _compile():
+        cache = app.extensions.setdefault("compiled_templates", {})
+        for name in env.list_templates(extensions=["html"]):
+            try:
+                cache.setdefault(name, env.get_template(name))
+            except Exception:
+                continue
+
+    threading.Thread(target=_compile, name="template-warmup", daemon=True).start()
 
 def update_log_paths():
     """Update global log paths based on config."""
-    import sys
     main = sys.modules['__main__']
     main.LOGS_DIR = main.config.get("logs_dir", main.DEFAULT_CONFIG["logs_dir"])  # type: ignore
     main.STDOUT_LOG = os.path.join(main.LOGS_DIR, "organizer_stdout.log")  # type: ignore
     main.STDERR_LOG = os.path.join(main.LOGS_DIR, "organizer_stderr.log")  # type: ignore
 
+PROC_TTL = 2.0  # seconds; matches the metrics cache
+
+@ttl_cache(PROC_TTL)
 def service_running() -> bool:
-    """Check if the DownloadsOrganizer service is running."""
-    import sys
+    """Check if the DownloadsOrganizer service is running.
+
+    On Windows the service manager is queried in-process through psutil;
+    ``sc query`` is only spawned if that API is unavailable.
+    """
     main = sys.modules['__main__']
     if sys.platform != "win32":
         proc = find_organizer_proc()
         return proc is not None
+    if hasattr(psutil, 'win_service_get'):
+        try:
+            return psutil.win_service_get(main.SERVICE_NAME).status() == 'running'
+        except psutil.NoSuchProcess:
+            return False
+        except Exception:
+            pass
     try:
         out = subprocess.check_output(["sc", "query", main.SERVICE_NAME], text=True)
         return "RUNNING" in out
@@ -33,11 +142,10 @@ def service_running() -> bool:
 def get_windows_version():
     if sys.platform == "win32":
         try:
-            import winreg
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion")
-            product_name, _ = winreg.QueryValueEx(key, "ProductName")
-            display_version, _ = winreg.QueryValueEx(key, "DisplayVersion")
-            build_number, _ = winreg.QueryValueEx(key, "CurrentBuildNumber")
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion") as key:
+                product_name, _ = winreg.QueryValueEx(key, "ProductName")
+                display_version, _ = winreg.QueryValueEx(key, "DisplayVersion")
+                build_number, _ = winreg.QueryValueEx(key, "CurrentBuildNumber")
             if int(build_number) >= 22000:
                 product_name = product_name.replace("Windows 10", "Windows 11")
             return f"{product_name} {display_version}"
@@ -49,9 +157,8 @@ def get_windows_version():
 def get_cpu_name():
     if sys.platform == "win32":
         try:
-            import winreg
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\\DESCRIPTION\\System\\CentralProcessor\\0")
-            cpu_name, _ = winreg.QueryValueEx(key, "ProcessorNameString")
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\\DESCRIPTION\\System\\CentralProcessor\\0") as key:
+                cpu_name, _ = winreg.QueryValueEx(key, "ProcessorNameString")
             return cpu_name.strip()
         except Exception:
             return platform.processor() or platform.machine()
@@ -65,77 +172,429 @@ def get_cpu_name():
             pass
         return platform.processor() or platform.machine()
 
+# Display adapter device class; each numbered subkey is one adapter
+_DISPLAY_CLASS_KEY = r"SYSTEM\\CurrentControlSet\\Control\\Class\\{4d36e968-e325-11ce-bfc1-08002be10318}"
+
+def _registry_gpus():
+    gpus = []
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _DISPLAY_CLASS_KEY) as cls:
+        index = 0
+        while True:
+            try:
+                sub = winreg.EnumKey(cls, index)
+            except OSError:
+                break
+            index += 1
+            if not sub.isdigit():
+                continue
+            try:
+                with winreg.OpenKey(cls, sub) as adapter:
+                    name, _ = winreg.QueryValueEx(adapter, "DriverDesc")
+            except OSError:
+                continue
+            name = (name or "").strip()
+            if name and name not in gpus:
+                gpus.append(name)
+    return gpus
+
 def get_gpus():
+    """Display adapter names, read from the registry on Windows.
+
+    Avoids spawning wmic (deprecated and slow to start); PowerShell's CIM
+    query is only tried if the registry lookup comes back empty.
+    """
+    if sys.platform != "win32":
+        return []
+    try:
+        gpus = _registry_gpus()
+        if gpus:
+            return gpus
+    except Exception:
+        pass
     try:
-        output = subprocess.check_output(
-            ['wmic', 'path', 'win32_VideoController', 'get', 'name'],
-            stderr=subprocess.STDOUT,
-            universal_newlines=True
-        )
-        gpus = [line.strip() for line in output.split('\n') if line.strip() and 'Name' not in line]
-        return gpus
+        output = subprocess.run(
+            ['powershell', '-NoProfile', '-Command',
+             'Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name'],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+        return [line.strip() for line in output.splitlines() if line.strip()]
     except Exception:
         return []
 
+@lru_cache(maxsize=1)
+def get_static_host_info():
+    """Host facts that are constant for the process lifetime, probed once.
+
+    The GPU, OS and CPU lookups hit the registry (or shell out as a fallback),
+    so these are resolved on first use instead of on every page load.
+    """
+    gpus = get_gpus()
+    total = psutil.virtual_memory().total
+    return {
+        "hostname": socket.gethostname(),
+        "os": get_windows_version(),
+        "cpu": get_cpu_name(),
+        "cpu_count": psutil.cpu_count(logical=True) or 1,
+        "ram_gb": round(total / (1024**3), 2),
+        "total_memory_gb": round(total / (1024 * 1024 * 1024), 2),
+        "gpu": gpus[0] if gpus else "N/A",
+        "is_windows": sys.platform == "win32",
+    }
+
+@lru_cache(maxsize=1)
 def get_private_ip():
+    """Resolve the host's IPv4 address once per process (can hit DNS on Windows)."""
     try:
         hostname = socket.gethostname()
-        return socket.gethostbyname(hostname)
+        addrs = [info[4][0] for info in socket.getaddrinfo(hostname, None, socket.AF_INET)]
+        for addr in addrs:
+            if not addr.startswith("127."):
+                return addr
+        return addrs[0] if addrs else "Unavailable"
     except Exception:
         return "Unavailable"
 
-def get_public_ip():
+def prewarm_host_info():
+    """Resolve the static host facts and private IP on a daemon thread.
+
+    Both are cached for the process lifetime, but the first lookup reads the
+    registry (or shells out) and may wait on DNS; doing it at start-up keeps
+    that wait off the first dashboard load and /hardware request.
+    """
+    def _warm():
+        get_static_host_info()
+        get_private_ip()
+
+    threading.Thread(target=_warm, name="host-info", daemon=True).start()
+
+_http = None
+_http_lock = threading.Lock()
+
+def http_session():
+    """Process-wide keep-alive session for outbound HTTPS (ipify, VirusTotal).
+
+    Repeat calls to the same host reuse the pooled TCP/TLS connection instead
+    of paying a fresh handshake each time.
+    """
+    global _http
+    if _http is None:
+        with _http_lock:
+            if _http is None:
+                import requests  # type: ignore
+                from requests.adapters import HTTPAdapter  # type: ignore
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+                _http = session
+    return _http
+
+PUBLIC_IP_INTERVAL = 300.0  # seconds
+_public_ip = {"value": None}
+_public_ip_thread = None
+_public_ip_lock = threading.Lock()
+
+def _refresh_public_ip():
+    """Look up the public IPv4 via ipify; a failure keeps the last known value."""
     try:
-        import requests  # type: ignore
-        response = requests.get("https://api.ipify.org", timeout=3)
+        response = http_session().get("https://api.ipify.org", timeout=3)
         if response.status_code == 200:
-            return response.text
-        return "Unavailable"
+            _public_ip["value"] = response.text.strip()
     except Exception:
-        return "Unavailable"
+        pass
+
+def _public_ip_loop():
+    while True:
+        _refresh_public_ip()
+        time.sleep(PUBLIC_IP_INTERVAL)
+
+def start_public_ip_refresher():
+    """Start the daemon thread that refreshes the public IP every PUBLIC_IP_INTERVAL."""
+    global _public_ip_thread
+    if _public_ip_thread is not None:
+        return
+    with _public_ip_lock:
+        if _public_ip_thread is None:
+            _public_ip_thread = threading.Thread(target=_public_ip_loop, name="public-ip", daemon=True)
+            _public_ip_thread.start()
+
+def get_public_ip():
+    """Last public IPv4 seen by the background refresher; never blocks on the network."""
+    start_public_ip_refresher()
+    return _public_ip["value"] or "Unavailable"
+
+# Last organizer process found; rechecked before falling back to a full scan
+_organizer_proc = {"proc": None}
 
+def _is_organizer(name, cmdline):
+    if not name or 'python' not in name.lower():
+        return False
+    return any('organizer.py' in str(a).lower() for a in cmdline or [])
+
+def _service_candidates():
+    """The Windows service's process and its children, per the service manager.
+
+    The service is installed through NSSM, so the registered PID is usually
+    the wrapper and Organizer.py runs as its child.
+    """
+    if not hasattr(psutil, 'win_service_get'):
+        return []
+    try:
+        pid = psutil.win_service_get(sys.modules['__main__'].SERVICE_NAME).pid()
+        if not pid:
+            return []
+        service = psutil.Process(pid)
+        return [service] + service.children(recursive=True)
+    except Exception:
+        return []
+
+@ttl_cache(PROC_TTL)
 def find_organizer_proc():
-    for proc in psutil.process_iter(['name', 'cmdline']):
+    """Return the running Organizer.py process, or None.
+
+    The previous match is revalidated first (is_running() also guards against
+    PID reuse). After a restart the service manager's PID is tried next on
+    Windows, so walking every process is the last resort.
+    """
+    proc = _organizer_proc["proc"]
+    if proc is not None:
+        try:
+            with proc.oneshot():
+                if proc.is_running() and _is_organizer(proc.name(), proc.cmdline()):
+                    return proc
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+        _organizer_proc["proc"] = None
+    for proc in _service_candidates():
         try:
-            if proc.info['name'] and 'python' in proc.info['name'].lower():
-                cmdline = proc.info['cmdline'] or []
-                if any('organizer.py' in str(a).lower() for a in cmdline):
+            with proc.oneshot():
+                if _is_organizer(proc.name(), proc.cmdline()):
+                    _organizer_proc["proc"] = proc
                     return proc
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
+    for proc in psutil.process_iter(['name', 'cmdline']):
+        try:
+            if _is_organizer(proc.info['name'], proc.info['cmdline']):
+                _organizer_proc["proc"] = proc
+                return proc
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
     return None
 
-def last_n_lines_normalized(path, n=200):
+TAIL_BLOCK = 64 * 1024
+
+def read_last_lines(path, n=200, block=TAIL_BLOCK):
+    """Return the last n lines of path, reading backwards from the end.
+
+    Only the trailing blocks that contain those lines are read, so the cost
+    is bounded by the tail size rather than the whole log. The read-back
+    window starts at ``block`` and doubles while more lines are needed, so a
+    typical 200-line tail is a single read. The start of the n-th last line
+    is then found with rfind, and only those bytes are decoded and split.
+    """
+    n = max(n, 0)
+    if n == 0:
+        return []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        chunks = deque()
+        newlines = 0
+        # One extra newline so the first kept line is complete
+        while pos > 0 and newlines <= n:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b'\n')
+            chunks.appendleft(chunk)
+            block *= 2
+    data = b''.join(chunks)
+    cut = len(data) - 1 if data.endswith(b'\n') else len(data)
+    for _ in range(n):
+        cut = data.rfind(b'\n', 0, cut)
+        if cut < 0:
+            break
+    lines = data[cut + 1:].decode('utf-8', errors='replace').splitlines()
+    return lines[-n:]
+
+def read_from_offset(path, offset, limit=1024 * 1024):
+    """Return (text, new_offset) for bytes of path past offset.
+
+    If the file shrank (rotated/cleared) reading restarts from the end window.
+    At most ``limit`` trailing bytes are returned.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if offset < 0 or offset > size:
+            offset = 0
+        start = max(offset, size - limit)
+        f.seek(start)
+        data = f.read(size - start)
+    return data.decode('utf-8', errors='replace'), size
+
+def iter_last_n_lines_normalized(path, n=200, chunk_size=TAIL_BLOCK):
+    """Yield the normalized last n lines of path, newline-separated.
+
+    Lines are sent in chunks of roughly chunk_size characters rather than one
+    write per line.
+    """
     if not os.path.exists(path):
-        return "(log file not found)"
-    with open(path, 'r', encoding='utf-8', errors='replace') as f:
-        lines = f.readlines()[-n:]
-    normalized = [line.replace('\n', ' ').replace('\r', '').strip() for line in lines]
-    return '\n'.join(normalized)
+        yield "(log file not found)"
+        return
+    batch = []
+    size = 0
+    sep = ''
+    for line in read_last_lines(path, n):
+        line = line.replace('\r', '').strip()
+        batch.append(line)
+        size += len(line) + 1
+        if size >= chunk_size:
+            yield sep + '\n'.join(batch)
+            batch = []
+            size = 0
+            sep = '\n'
+    if batch:
+        yield sep + '\n'.join(batch)
+
+def last_n_lines_normalized(path, n=200):
+    return ''.join(iter_last_n_lines_normalized(path, n))
+
+# Each open SSE stream pins a server thread for as long as the page stays
+# open; cap them below the waitress thread count so a few threads are always
+# free for /metrics, logins and the other short requests.
+MAX_STREAMS = max(1, int(os.environ.get("DASHBOARD_MAX_STREAMS",
+                                        int(os.environ.get("DASHBOARD_THREADS", "16")) - 4)))
+_stream_slots = threading.BoundedSemaphore(MAX_STREAMS)
+
+class _StreamSlot:
+    """Response body that gives its stream slot back when the server closes it."""
+
+    def __init__(self, iterable):
+        self._iterable = iterable
+        self._iter = iter(iterable)
+        self._released = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iter)
+
+    def close(self):
+        try:
+            close = getattr(self._iterable, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            if not self._released:
+                self._released = True
+                _stream_slots.release()
+
+def sse_response(iterable, headers=None):
+    """text/event-stream response for iterable, or 503 when MAX_STREAMS are open.
+
+    The browser's EventSource treats the 503 as an error; the dashboard then
+    falls back to polling or retries the log stream a little later.
+    """
+    if not _stream_slots.acquire(blocking=False):
+        close = getattr(iterable, 'close', None)
+        if close is not None:
+            close()
+        return Response("Too many open streams", status=503, headers={"Retry-After": "10"})
+    return Response(_StreamSlot(iterable), mimetype="text/event-stream", headers=headers)
 
 def sse_stream(path):
-    if not os.path.exists(path):
-        while not os.path.exists(path):
-            time.sleep(1)
-    with open(path, 'r', encoding='utf-8', errors='replace') as f:
-        f.seek(0, os.SEEK_END)
-        while True:
-            where = f.tell()
-            line = f.readline()
-            if not line:
-                try:
-                    cur_size = os.path.getsize(path)
-                    if cur_size < where:
-                        f.close()
-                        time.sleep(0.5)
-                        f = open(path, 'r', encoding='utf-8', errors='replace')
-                        f.seek(0, os.SEEK_END)
-                    else:
-                        time.sleep(0.5)
-                except Exception:
-                    time.sleep(0.5)
-                continue
-            yield f"data: {line.rstrip()}\n\n"
+    """SSE frames for lines appended to path, from the log's shared tailer."""
+    from OrganizerDashboard.helpers import log_tail
+    return log_tail.stream(path)
+
+def dumps_json(obj) -> str:
+    """Compact JSON text for obj, serialized with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+def ojsonify(obj, status=200):
+    """jsonify() replacement that serializes with orjson when it is installed."""
+    if orjson is not None:
+        body = orjson.dumps(obj)
+    else:
+        body = json.dumps(obj, separators=(',', ':'))
+    return Response(body, status=status, mimetype='application/json')
+
+# key -> (snapshot object, its serialized body)
+_snapshot_bodies = {}
+
+def ojsonify_snapshot(key, obj):
+    """ojsonify() for shared snapshots (sampler results, cached metrics).
+
+    The body is serialized once per snapshot object and reused until the
+    sampler or cache hands out a new one, so any number of polling tabs
+    cost one encode per refresh.
+    """
+    cached = _snapshot_bodies.get(key)
+    if cached is not None and cached[0] is obj:
+        body = cached[1]
+    else:
+        body = orjson.dumps(obj) if orjson is not None else json.dumps(obj, separators=(',', ':'))
+        _snapshot_bodies[key] = (obj, body)
+    return Response(body, mimetype='application/json')
+
+def revalidatable(response, max_age=60):
+    """Let the browser reuse response for max_age seconds, then revalidate it.
+
+    The ETag is a hash of the body, so a repeat fetch of unchanged data gets
+    an empty 304 instead of the full payload.
+    """
+    response.add_etag()
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() and request.get_json()
+    skip the stdlib encoder/decoder.
+
+    Output matches the default provider's (sorted keys, HTTP-date datetimes,
+    __html__ objects via ``default``); anything orjson rejects, such as ints
+    wider than 64 bits or extra json.dumps options, goes through the stdlib path.
+    """
+
+    def _options(self, indent=None):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _dumps_bytes(self, obj, **kwargs):
+        if orjson is None or set(kwargs) - {"indent", "separators"}:
+            return None
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options(kwargs.get("indent")))
+        except TypeError:
+            return None
+
+    def dumps(self, obj, **kwargs):
+        body = self._dumps_bytes(obj, **kwargs)
+        if body is None:
+            return super().dumps(obj, **kwargs)
+        return body.decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = self._dumps_bytes(obj, indent=2 if indent else None)
+        if body is None:
+            return super().response(obj)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
 
 def format_bytes(num):
     """Convert bytes to GB or TB as a string with 2 decimals."""
@@ -146,11 +605,21 @@ def format_bytes(num):
     tb = gb / 1024
     return f"{tb:.2f} TB"
 
+DASHBOARD_JSON = "C:\\Scripts\\downloads_dashboard.json"
+_dashboard_json_cache = {"mtime_ns": None, "data": {}}
+
 def load_dashboard_json():
-    DASHBOARD_JSON = "C:\\Scripts\\downloads_dashboard.json"
+    """Load the organizer's dashboard JSON, re-parsing only when its mtime changes."""
+    try:
+        mtime_ns = os.stat(DASHBOARD_JSON).st_mtime_ns
+    except OSError:
+        return {}
+    if mtime_ns == _dashboard_json_cache["mtime_ns"]:
+        return _dashboard_json_cache["data"]
     try:
-        with open(DASHBOARD_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data
+        data = read_json(DASHBOARD_JSON)
     except Exception:
         return {}
+    _dashboard_json_cache["mtime_ns"] = mtime_ns
+    _dashboard_json_cache["data"] = data
+    return data
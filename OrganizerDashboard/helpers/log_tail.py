@@ -0,0 +1,189 @@
+"""Shared, event-driven tails of the organizer logs for /stream.
+
+One watchdog observer per log file (inotify on Linux, ReadDirectoryChangesW on
+Windows) reads the appended bytes when the OS reports a write and fans the
+new lines out to every connected SSE client. Clients don't poll the file and
+don't each keep their own reader open, whatever their number.
+"""
+import os
+import queue
+import threading
+import time
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+HEARTBEAT = 15.0  # seconds between keep-alives on a quiet log
+POLL_MIN = 0.1  # seconds; shared poller when change events aren't available,
+POLL_MAX = 5.0  # backing off from POLL_MIN to POLL_MAX while the log is idle
+MAX_READ = 1024 * 1024  # cap on bytes published from a single burst
+QUEUE_SIZE = 1000  # lines buffered per client before a slow one drops lines
+COALESCE_WINDOW = 0.05  # seconds to gather a burst into one event...
+COALESCE_BYTES = 32 * 1024  # ...or until it reaches this size
+
+
+class _Handler(FileSystemEventHandler):
+    def __init__(self, tailer):
+        self.tailer = tailer
+
+    def on_any_event(self, event):
+        for p in (getattr(event, 'src_path', None), getattr(event, 'dest_path', None)):
+            if p and os.path.abspath(p) == self.tailer.path:
+                self.tailer.poll()
+                return
+
+
+class _Poller(threading.Thread):
+    """Stand-in for a watchdog observer: one thread polling for every client.
+
+    The interval doubles on every idle poll up to POLL_MAX and drops back to
+    POLL_MIN as soon as a write shows up, so a quiet log costs a stat every
+    few seconds while a busy one is followed closely.
+    """
+
+    def __init__(self, tailer):
+        super().__init__(name="log-poll", daemon=True)
+        self.tailer = tailer
+        self._stopped = threading.Event()
+
+    def run(self):
+        interval = POLL_MIN
+        while not self._stopped.wait(interval):
+            if self.tailer.poll():
+                interval = POLL_MIN
+            else:
+                interval = min(interval * 2, POLL_MAX)
+
+    def stop(self):
+        self._stopped.set()
+
+
+class LogTailer:
+    """Publish lines appended to one file to any number of subscriber queues.
+
+    Appends are picked up from watchdog change events, or by a single shared
+    poller when watchdog is missing or the log folder doesn't exist yet.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._observer = None
+        self._offset = None
+        self._partial = b''
+
+    def poll(self):
+        """Read bytes appended since the last poll and publish complete lines.
+
+        Returns True if the file grew or was truncated since the last poll.
+        """
+        with self._lock:
+            if self._offset is None:
+                return False
+            try:
+                with open(self.path, 'rb') as f:
+                    f.seek(0, os.SEEK_END)
+                    size = f.tell()
+                    if size < self._offset:
+                        # Truncated or rotated: start over from the top
+                        self._offset = 0
+                        self._partial = b''
+                    if size == self._offset:
+                        return False
+                    start = max(self._offset, size - MAX_READ)
+                    f.seek(start)
+                    data = f.read(size - start)
+            except OSError:
+                return False
+            self._offset = size
+            *lines, self._partial = (self._partial + data).split(b'\n')
+            subscribers = list(self._subscribers)
+        for raw in lines:
+            line = raw.decode('utf-8', errors='replace').rstrip()
+            for q in subscribers:
+                try:
+                    q.put_nowait(line)
+                except queue.Full:
+                    pass
+        return True
+
+    def subscribe(self):
+        """Return a queue of new lines, starting the observer for the first client."""
+        q = queue.Queue(maxsize=QUEUE_SIZE)
+        with self._lock:
+            if self._observer is None:
+                try:
+                    self._offset = os.path.getsize(self.path)
+                except OSError:
+                    self._offset = 0
+                self._partial = b''
+                folder = os.path.dirname(self.path)
+                if Observer is not None and os.path.isdir(folder):
+                    observer = Observer()
+                    observer.daemon = True
+                    observer.schedule(_Handler(self), folder, recursive=False)
+                else:
+                    observer = _Poller(self)
+                observer.start()
+                self._observer = observer
+            self._subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        """Drop a client's queue; the observer stops with the last client."""
+        with self._lock:
+            self._subscribers.discard(q)
+            if self._subscribers or self._observer is None:
+                return
+            observer, self._observer = self._observer, None
+            self._offset = None
+        observer.stop()
+
+
+_tailers = {}
+_tailers_lock = threading.Lock()
+
+
+def get_tailer(path):
+    key = os.path.abspath(path)
+    with _tailers_lock:
+        tailer = _tailers.get(key)
+        if tailer is None:
+            tailer = _tailers[key] = LogTailer(key)
+        return tailer
+
+
+def stream(path):
+    """Yield SSE ``data:`` frames for lines appended to path, with keep-alives."""
+    tailer = get_tailer(path)
+    q = tailer.subscribe()
+    try:
+        while True:
+            try:
+                line = q.get(timeout=HEARTBEAT)
+            except queue.Empty:
+                # Also catches writes whose change event was missed (e.g. shares)
+                tailer.poll()
+                yield ": keep-alive\n\n"
+                continue
+            # Coalesce a burst into one event: each line is its own data: field,
+            # which the browser joins with newlines into a single message
+            fields = [f"data: {line}\n"]
+            size = len(fields[0])
+            deadline = time.monotonic() + COALESCE_WINDOW
+            while size < COALESCE_BYTES:
+                remaining = deadline - time.monotonic()
+                try:
+                    line = q.get(timeout=remaining) if remaining > 0 else q.get_nowait()
+                except queue.Empty:
+                    break
+                fields.append(f"data: {line}\n")
+                size += len(fields[-1])
+            yield ''.join(fields) + "\n"
+    finally:
+        tailer.unsubscribe(q)
@@ -0,0 +1,294 @@
+"""Background samplers for system stats shown on the dashboard.
+
+Routes read the latest snapshot instead of querying psutil on the request
+thread. Each sampler takes its first sample synchronously on first use and then
+refreshes on a daemon thread.
+"""
+import heapq
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+import psutil
+
+
+class Sampler:
+    """Periodically run a sampling function and keep its latest result.
+
+    With max_interval set, the wait doubles (up to max_interval) each time a
+    sample comes back unchanged and drops back to interval on the next change.
+    """
+
+    def __init__(self, name, fn, interval, max_interval=None):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.max_interval = max_interval
+        self._value = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._ready = threading.Event()
+
+    def _sample(self):
+        """Take a sample; returns True if it differs from the previous one."""
+        try:
+            value = self.fn()
+            changed = value != self._value
+            self._value = value
+            return changed
+        except Exception:
+            return False
+        finally:
+            self._ready.set()
+
+    def _run(self, sample_first=False):
+        if sample_first:
+            self._sample()
+        interval = self.interval
+        while True:
+            time.sleep(interval)
+            if self._sample() or self.max_interval is None:
+                interval = self.interval
+            else:
+                interval = min(interval * 2, self.max_interval)
+
+    def _start(self, sample_first):
+        self._thread = threading.Thread(target=self._run, args=(sample_first,), name=f"sampler-{self.name}", daemon=True)
+        self._thread.start()
+
+    def start(self):
+        """Start sampling in the background, taking the first sample off-thread."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._start(sample_first=True)
+
+    def get(self):
+        """Return the latest sample, starting the sampler on first use."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._sample()
+                    self._start(sample_first=False)
+        # Started by start(): wait for its first sample rather than return None
+        self._ready.wait()
+        return self._value
+
+
+# Snap images, RAM disks and container layers aren't drives anyone fills up
+PSEUDO_FSTYPES = frozenset(('squashfs', 'tmpfs', 'devtmpfs', 'overlay'))
+
+def _skip_partition(part):
+    # Empty CD/removable drives report no filesystem; querying them can stall
+    # (or pop up "insert disk" on Windows), so only include them with media
+    if (part.fstype or '').lower() in PSEUDO_FSTYPES:
+        return True
+    opts = (part.opts or '').lower()
+    return ('cdrom' in opts or 'removable' in opts) and not part.fstype
+
+
+PARTITIONS_TTL = 60.0  # seconds; mounts rarely change, usage does
+_partitions = {"list": None, "expires": 0.0}
+
+def _mounted_partitions():
+    """(device, mountpoint) pairs worth reporting, re-enumerated every PARTITIONS_TTL."""
+    now = time.monotonic()
+    if _partitions["list"] is None or now >= _partitions["expires"]:
+        _partitions["list"] = [
+            (part.device, part.mountpoint)
+            for part in psutil.disk_partitions(all=False)
+            if not _skip_partition(part)
+        ]
+        _partitions["expires"] = now + PARTITIONS_TTL
+    return _partitions["list"]
+
+
+DISK_USAGE_TIMEOUT = 0.5  # seconds per sample; a stale network mount can block for minutes
+_usage_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="disk-usage")
+# mountpoint -> disk_usage call that outlived an earlier sample's timeout
+_pending_usage = {}
+
+def _sample_drives():
+    # disk_usage is a single GetDiskFreeSpaceExW / statvfs call per mount. The
+    # calls run on a small pool so a hung mount is left out of this sample
+    # instead of stalling it, and isn't queried again until its call returns.
+    futures = []
+    for device, mountpoint in _mounted_partitions():
+        future = _pending_usage.pop(mountpoint, None) or _usage_pool.submit(psutil.disk_usage, mountpoint)
+        futures.append((device, mountpoint, future))
+    deadline = time.monotonic() + DISK_USAGE_TIMEOUT
+    drives = []
+    for device, mountpoint, future in futures:
+        try:
+            usage = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeout:
+            _pending_usage[mountpoint] = future
+            continue
+        except Exception:
+            continue
+        drives.append({
+            "device": device,
+            "mountpoint": mountpoint,
+            "total": usage.total,
+            "used": usage.used,
+            "free": usage.free,
+            "percent": usage.percent
+        })
+    return drives
+
+
+_net_prev = {"counters": None, "ts": 0.0}
+
+def _sample_network():
+    now_net = psutil.net_io_counters()
+    now_ts = time.monotonic()
+    prev = _net_prev["counters"]
+    interval = now_ts - _net_prev["ts"]
+    if prev is not None and interval > 0:
+        upload_rate_b = (now_net.bytes_sent - prev.bytes_sent) / interval
+        download_rate_b = (now_net.bytes_recv - prev.bytes_recv) / interval
+    else:
+        upload_rate_b = download_rate_b = 0.0
+    _net_prev["counters"] = now_net
+    _net_prev["ts"] = now_ts
+    return {
+        "upload_rate_b": upload_rate_b,
+        "download_rate_b": download_rate_b,
+        "total_sent": now_net.bytes_sent,
+        "total_recv": now_net.bytes_recv
+    }
+
+
+TOP_PROCESSES = 5
+NUM_CPUS = psutil.cpu_count(logical=True) or 1
+
+# Linux: per-process CPU ticks come straight from /proc/<pid>/stat
+_PROC_STAT = os.path.isfile('/proc/self/stat')
+_CLK_TCK = os.sysconf('SC_CLK_TCK') if _PROC_STAT else 100
+_proc_prev = {"ticks": {}, "ts": None}
+
+def _proc_stat_ranking():
+    """(CPU%, pid) for every process from one read of each /proc/<pid>/stat.
+
+    CPU% is the utime+stime delta since the previous call, per core like
+    psutil's cpu_percent (0.0 the first time or for a new process).
+    """
+    now = time.monotonic()
+    ticks = {}
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry.name}/stat', 'rb') as f:
+                    data = f.read()
+                # comm may contain spaces or ')'; fields resume after the last ')'
+                fields = data[data.rfind(b')') + 2:].split()
+                ticks[int(entry.name)] = int(fields[11]) + int(fields[12])
+            except (OSError, IndexError, ValueError):
+                continue
+    prev, prev_ts = _proc_prev["ticks"], _proc_prev["ts"]
+    _proc_prev["ticks"], _proc_prev["ts"] = ticks, now
+    scale = 100.0 / (_CLK_TCK * (now - prev_ts)) if prev_ts is not None and now > prev_ts else 0.0
+    return [(max(0, t - prev.get(pid, t)) * scale, pid) for pid, t in ticks.items()]
+
+def _psutil_ranking():
+    # process_iter() reuses its Process objects between calls, so cpu_percent
+    # is the non-blocking delta since the previous sample (0.0 the first time)
+    return [(proc.info['cpu_percent'] or 0.0, proc) for proc in psutil.process_iter(['cpu_percent'])]
+
+# pid -> CPU% (per core) of every process over the last tasks sample
+_cpu_by_pid = {"map": {}}
+
+def _sample_top_processes():
+    # Only CPU is read for every process; the name, owner (a SID/uid lookup)
+    # and memory are fetched for the few processes actually shown.
+    ranked = None
+    if _PROC_STAT:
+        try:
+            ranked = _proc_stat_ranking()
+        except OSError:
+            ranked = None
+    if ranked is None:
+        ranked = _psutil_ranking()
+    _cpu_by_pid["map"] = {(p if isinstance(p, int) else p.pid): cpu for cpu, p in ranked}
+    procs = []
+    for cpu, proc in heapq.nlargest(TOP_PROCESSES, ranked, key=lambda r: r[0]):
+        try:
+            if isinstance(proc, int):
+                proc = psutil.Process(proc)
+            with proc.oneshot():
+                procs.append({
+                    "pid": proc.pid,
+                    "name": proc.name(),
+                    "user": _username(proc),
+                    "cpu": cpu / NUM_CPUS,
+                    "mem": proc.memory_info().rss / (1024 * 1024)
+                })
+        except psutil.Error:
+            continue
+    return procs
+
+
+def _username(proc):
+    try:
+        return proc.username() or 'N/A'
+    except (psutil.AccessDenied, KeyError):
+        return 'N/A'
+
+
+def _sample_cpu():
+    # Non-blocking: utilisation since the previous call, i.e. over the last interval
+    return psutil.cpu_percent(interval=None)
+
+
+DRIVES_INTERVAL = 10.0  # seconds
+DRIVES_MAX_INTERVAL = 60.0  # while free space isn't changing
+NETWORK_INTERVAL = 1.0
+TASKS_INTERVAL = 2.0
+CPU_INTERVAL = 1.0
+
+drives_sampler = Sampler("drives", _sample_drives, DRIVES_INTERVAL, DRIVES_MAX_INTERVAL)
+network_sampler = Sampler("network", _sample_network, NETWORK_INTERVAL)
+tasks_sampler = Sampler("tasks", _sample_top_processes, TASKS_INTERVAL)
+cpu_sampler = Sampler("cpu", _sample_cpu, CPU_INTERVAL)
+
+
+def prewarm():
+    """Start the samplers at app start-up.
+
+    The cheap delta-based ones sample now so the first request sees real
+    rates; the process and drive scans take their first sample in the
+    background so neither start-up nor the first page load pays for them.
+    """
+    cpu_sampler.get()
+    network_sampler.get()
+    tasks_sampler.start()
+    drives_sampler.start()
+
+
+def get_drives():
+    """Latest drive usage snapshot (list of dicts with raw byte counts)."""
+    return drives_sampler.get() or []
+
+
+def get_network():
+    """Latest network rates (bytes/s over the last sampler interval) and totals."""
+    return network_sampler.get() or {"upload_rate_b": 0.0, "download_rate_b": 0.0, "total_sent": 0, "total_recv": 0}
+
+
+def get_top_processes():
+    """Latest top processes by CPU (per-core normalised), highest first."""
+    return tasks_sampler.get() or []
+
+
+def get_process_cpu_percent(pid):
+    """CPU% of pid over the last tasks sample, per core like psutil's
+    cpu_percent; 0.0 for a process the sampler hasn't measured yet."""
+    tasks_sampler.get()
+    return _cpu_by_pid["map"].get(pid, 0.0)
+
+
+def get_cpu_percent():
+    """System-wide CPU utilisation over the last sampler interval."""
+    return cpu_sampler.get() or 0.0
@@ -0,0 +1,128 @@
+"""Serve static CSS/JS precompressed with Brotli or gzip.
+
+Flask-Compress leaves send_file responses alone, so static assets used to go
+out uncompressed. Each compressible file is compressed once at maximum
+quality and kept in memory (keyed by mtime, so edits are picked up); requests
+get the best encoding they accept.
+"""
+import gzip
+import mimetypes
+import os
+import threading
+from flask import current_app, request, send_from_directory
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = ('.css', '.js', '.svg', '.json', '.html')
+# Response types compressed on the fly, by Flask-Compress or compress_response
+COMPRESS_MIMETYPES = frozenset((
+    'text/html', 'application/json', 'text/css', 'application/javascript', 'text/javascript'
+))
+MIN_SIZE = 1024  # bytes; smaller files aren't worth an encoded variant
+
+# path -> (st_mtime_ns, {encoding: bytes})
+_variants_cache = {}
+_lock = threading.Lock()
+
+
+def _variants(path, st):
+    entry = _variants_cache.get(path)
+    if entry is not None and entry[0] == st.st_mtime_ns:
+        return entry[1]
+    with _lock:
+        entry = _variants_cache.get(path)
+        if entry is not None and entry[0] == st.st_mtime_ns:
+            return entry[1]
+        with open(path, 'rb') as f:
+            data = f.read()
+        variants = {'gzip': gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants['br'] = brotli.compress(data, quality=11)
+        variants = {enc: body for enc, body in variants.items() if len(body) < len(data)}
+        _variants_cache[path] = (st.st_mtime_ns, variants)
+        return variants
+
+
+def _eligible(path):
+    return path.endswith(COMPRESSIBLE) and os.path.isfile(path) and os.path.getsize(path) >= MIN_SIZE
+
+
+def send_static(filename):
+    """Replacement for Flask's static view that serves a precompressed body."""
+    folder = current_app.static_folder
+    path = safe_join(folder, filename)
+    if path is None or not _eligible(path):
+        return send_from_directory(folder, filename)
+    st = os.stat(path)
+    variants = _variants(path, st)
+    accepted = request.accept_encodings
+    encoding = next((enc for enc in ('br', 'gzip') if enc in variants and accepted[enc]), None)
+    if encoding is None:
+        response = send_from_directory(folder, filename)
+        response.vary.add('Accept-Encoding')
+        return response
+    response = current_app.response_class(
+        variants[encoding], mimetype=mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    )
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(f"{st.st_mtime_ns:x}-{st.st_size:x}-{encoding}")
+    response.last_modified = st.st_mtime
+    # Same revalidation policy Flask uses for static files
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def compress_response(response):
+    """after_request fallback that compresses pages and JSON without Flask-Compress.
+
+    Only complete 200 responses are touched; streams, already-encoded bodies
+    and anything under MIN_SIZE go out as they are.
+    """
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESS_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    accepted = request.accept_encodings
+    encoding = 'br' if brotli is not None and accepted['br'] else 'gzip' if accepted['gzip'] else None
+    data = response.get_data()
+    if encoding is None or len(data) < MIN_SIZE:
+        return response
+    if encoding == 'br':
+        response.set_data(brotli.compress(data, quality=5))
+    else:
+        response.set_data(gzip.compress(data, compresslevel=5))
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # Same content, different bytes: keep the validator but mark it weak
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def install(app):
+    """Route app's static endpoint through send_static and warm the cache.
+
+    Compressing every asset at maximum quality takes a moment, so it happens
+    on a daemon thread rather than on the first request for each file.
+    """
+    if app.static_folder is None:
+        return
+    app.view_functions['static'] = send_static
+
+    def _warm():
+        for root, _dirs, files in os.walk(app.static_folder):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if _eligible(path):
+                        _variants(path, os.stat(path))
+                except OSError:
+                    continue
+
+    threading.Thread(target=_warm, name="static-precompress", daemon=True).start()
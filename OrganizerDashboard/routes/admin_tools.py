@@ -1,6 +1,5 @@
 from flask import Blueprint, jsonify, request
-from OrganizerDashboard.auth.auth import requires_right
-import bcrypt
+from OrganizerDashboard.auth.auth import requires_right, hash_password
 
 routes_admin_tools = Blueprint('routes_admin_tools', __name__)
 
@@ -23,10 +22,10 @@ def repair_auth():
         if not existing_hash:
             # Create a temporary hash for default password
             default_pw = 'change_this_password'
-            existing_hash = bcrypt.hashpw(default_pw.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+            existing_hash = hash_password(default_pw).decode('utf-8')
         cfg['dashboard_pass_hash'] = existing_hash
     else:
-        cfg['dashboard_pass_hash'] = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        cfg['dashboard_pass_hash'] = hash_password(password).decode('utf-8')
 
     cfg['dashboard_user'] = target_user
 
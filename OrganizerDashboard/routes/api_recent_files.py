@@ -1,10 +1,10 @@
 from flask import Blueprint, jsonify, request
 from OrganizerDashboard.auth.auth import requires_right
 import os
-import json
 import hashlib
-import requests
 from pathlib import Path
+from OrganizerDashboard.helpers.helpers import http_session
+from OrganizerDashboard.config_runtime import read_json, write_json
 
 routes_api_recent_files = Blueprint('routes_api_recent_files', __name__)
 
@@ -24,8 +24,7 @@ def recent_files():
     try:
         if not os.path.exists(file_moves_path):
             return jsonify([])
-        with open(file_moves_path, 'r', encoding='utf-8') as f:
-            moves = json.load(f)
+        moves = read_json(file_moves_path)
         return jsonify(moves[:20])
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -35,8 +34,7 @@ def _load_organizer_config():
         base = Path(__file__).resolve().parents[2]
         cfg_path = base / 'organizer_config.json'
         if cfg_path.exists():
-            with cfg_path.open('r', encoding='utf-8') as f:
-                return json.load(f)
+            return read_json(cfg_path)
     except Exception:
         return {}
     return {}
@@ -52,8 +50,7 @@ def _vt_cache_get(sha256: str):
     try:
         cache_path = _vt_cache_paths()
         if cache_path.exists():
-            with cache_path.open('r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(cache_path)
             entry = data.get(sha256)
             # TTL 24h
             if entry and (int(entry.get('timestamp', 0)) + 24*3600) > int(__import__('time').time()):
@@ -67,14 +64,12 @@ def _vt_cache_set(sha256: str, response: dict):
         cache_path = _vt_cache_paths()
         cache = {}
         if cache_path.exists():
-            with cache_path.open('r', encoding='utf-8') as f:
-                cache = json.load(f)
+            cache = read_json(cache_path)
         cache[sha256] = {
             'timestamp': int(__import__('time').time()),
             'response': response
         }
-        with cache_path.open('w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2)
+        write_json(str(cache_path), cache)
     except Exception:
         # Fail silently; caching is optional
         pass
@@ -121,7 +116,7 @@ def virustotal_scan():
         # VT v3 API: get file report by hash
         url = f"https://www.virustotal.com/api/v3/files/{sha256}"
         headers = {"x-apikey": api_key}
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = http_session().get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             result = resp.json()
             _vt_cache_set(sha256, result)
@@ -143,8 +138,7 @@ def remove_recent_file(index):
         if not os.path.exists(file_moves_path):
             return jsonify({"error": "File moves log not found"}), 404
         
-        with open(file_moves_path, 'r', encoding='utf-8') as f:
-            moves = json.load(f)
+        moves = read_json(file_moves_path)
         
         if index < 0 or index >= len(moves):
             return jsonify({"error": "Invalid index"}), 400
@@ -153,8 +147,7 @@ def remove_recent_file(index):
         removed = moves.pop(index)
         
         # Write back to file
-        with open(file_moves_path, 'w', encoding='utf-8') as f:
-            json.dump(moves, f, indent=2)
+        write_json(file_moves_path, moves)
         
         return jsonify({"success": True, "removed": removed}), 200
     except Exception as e:
@@ -1,14 +1,15 @@
-from flask import Blueprint, jsonify, request
-from OrganizerDashboard.auth.auth import check_auth
+from flask import Blueprint, jsonify
+from OrganizerDashboard.auth.auth import check_auth, basic_auth, rate_limit
 from flask_login import current_user
 from OrganizerDashboard.config_runtime import get_dashboard_config
 
 routes_auth_check = Blueprint('routes_auth_check', __name__)
 
 @routes_auth_check.route('/auth_check')
+@rate_limit(30, 60)
 def auth_check():
     """Lightweight endpoint to validate Basic credentials sent in the Authorization header."""
-    auth = request.authorization
+    auth = basic_auth()
     # Prefer session if available
     if (not auth) and current_user.is_authenticated:
         username = current_user.get_id()
@@ -1,5 +1,5 @@
-from flask import Blueprint, jsonify, request
-from OrganizerDashboard.auth.auth import check_auth
+from flask import Blueprint, jsonify
+from OrganizerDashboard.auth.auth import check_auth, basic_auth
 from OrganizerDashboard.config_runtime import get_dashboard_config, get_config
 from flask_login import current_user
 
@@ -10,7 +10,7 @@ def auth_session():
     """Return current authenticated user's role, rights, and config_version.
     Uses Basic Auth each call; lightweight and cache-friendly on client.
     """
-    auth = request.authorization
+    auth = basic_auth()
     if (not auth) and current_user.is_authenticated:
         username = current_user.get_id()
         dashboard_config = get_dashboard_config()
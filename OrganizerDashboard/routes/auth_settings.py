@@ -1,8 +1,8 @@
 """Authentication settings route - view and update authentication configuration."""
 
 from flask import Blueprint, jsonify, request
-import json
 import sys
+from OrganizerDashboard.config_runtime import write_json
 
 routes_auth_settings = Blueprint('routes_auth_settings', __name__)
 
@@ -92,8 +92,7 @@ def update_auth_settings():
         
         # Save config
         try:
-            with open(main.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4)
+            write_json(main.CONFIG_FILE, config)
         except Exception as e:
             return jsonify({"error": f"Failed to save config: {str(e)}"}), 500
         
@@ -1,7 +1,7 @@
 from flask import Blueprint, request, jsonify
-import json
 import os
 from OrganizerDashboard.auth.auth import requires_auth
+from OrganizerDashboard.config_runtime import read_json, write_json
 
 routes_branding = Blueprint('routes_branding', __name__)
 
@@ -11,8 +11,7 @@ def load_branding():
     """Load branding configuration"""
     if os.path.exists(BRANDING_CONFIG_FILE):
         try:
-            with open(BRANDING_CONFIG_FILE, 'r') as f:
-                return json.load(f)
+            return read_json(BRANDING_CONFIG_FILE)
         except Exception:
             pass
     return {
@@ -25,8 +24,7 @@ def load_branding():
 def save_branding(branding):
     """Save branding configuration"""
     try:
-        with open(BRANDING_CONFIG_FILE, 'w') as f:
-            json.dump(branding, f, indent=4)
+        write_json(BRANDING_CONFIG_FILE, branding)
         return True
     except Exception as e:
         print(f"Error saving branding: {e}")
@@ -1,13 +1,13 @@
 from flask import Blueprint, jsonify, request
-from OrganizerDashboard.auth.auth import requires_auth
-import bcrypt
-import json
+from OrganizerDashboard.auth.auth import requires_auth, hash_password, rate_limit
+from OrganizerDashboard.config_runtime import write_json
 
 routes_change_password = Blueprint('routes_change_password', __name__)
 
 CONFIG_FILE = "organizer_config.json"
 
 @routes_change_password.route("/change_password", methods=["POST"])
+@rate_limit(5, 60)
 @requires_auth
 def change_password():
     import OrganizerDashboard
@@ -29,13 +29,12 @@ def change_password():
     if not new:
         return jsonify({"status": "error", "message": "Missing new_password"}), 400
     try:
-        hashed = bcrypt.hashpw(new.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        hashed = hash_password(new).decode('utf-8')
         config['dashboard_user'] = ADMIN_USER
         config['dashboard_pass_hash'] = hashed
         if 'dashboard_pass' in config:
             del config['dashboard_pass']
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4)
+        write_json(CONFIG_FILE, config)
         OrganizerDashboard.ADMIN_PASS_HASH = hashed.encode('utf-8')
         
         # Reinitialize auth manager with new password
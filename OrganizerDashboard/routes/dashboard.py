@@ -1,15 +1,14 @@
 from flask import Blueprint, render_template, request, jsonify, Response, redirect
-import socket
-import sys
 import psutil
 from OrganizerDashboard.helpers.helpers import (
-    get_windows_version, get_cpu_name, get_private_ip, get_public_ip, service_running, find_organizer_proc, format_bytes, last_n_lines_normalized, load_dashboard_json
+    get_static_host_info, get_private_ip, get_public_ip, service_running, find_organizer_proc, format_bytes, last_n_lines_normalized, load_dashboard_json,
+    compiled_template, dumps_json
 )
+from OrganizerDashboard.helpers.samplers import get_drives, get_top_processes, get_cpu_percent
 from OrganizerDashboard.auth.auth import check_auth, authenticate, requires_auth
 from flask_login import current_user
 import os
 import platform
-import json
 
 routes_dashboard = Blueprint('routes_dashboard', __name__)
 
@@ -40,56 +39,23 @@ def dashboard():
 
     dashboard_data = load_dashboard_json()
     
-    # Get top processes by CPU
-    top_processes = []
-    try:
-        num_cpus = psutil.cpu_count(logical=True)
-        procs = []
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_info']):
-            try:
-                cpu = proc.info['cpu_percent'] / num_cpus if num_cpus else proc.info['cpu_percent']
-                procs.append({
-                    "pid": proc.info['pid'],
-                    "name": proc.info['name'],
-                    "user": proc.info.get('username', 'N/A'),
-                    "cpu": cpu,
-                    "mem": round(proc.info['memory_info'].rss / (1024*1024), 1)
-                })
-            except Exception:
-                continue
-        procs.sort(key=lambda x: x['cpu'], reverse=True)
-        top_processes = procs[:5]
-    except Exception:
-        pass
+    # Top processes by CPU from the background sampler snapshot
+    top_processes = [dict(p, mem=round(p["mem"], 1)) for p in get_top_processes()]
     
-    # Get drive information
-    drives = []
-    try:
-        for part in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(part.mountpoint)
-                drives.append({
-                    "device": part.device,
-                    "mountpoint": part.mountpoint,
-                    "total": format_bytes(usage.total),
-                    "used": format_bytes(usage.used),
-                    "free": format_bytes(usage.free),
-                    "percent": round(usage.percent, 1)
-                })
-            except Exception:
-                continue
-    except Exception:
-        pass
+    # Get drive information from the background sampler snapshot
+    drives = [{
+        "device": d["device"],
+        "mountpoint": d["mountpoint"],
+        "total": format_bytes(d["total"]),
+        "used": format_bytes(d["used"]),
+        "free": format_bytes(d["free"]),
+        "percent": round(d["percent"], 1)
+    } for d in get_drives()]
     
     # Load config for settings display
     import OrganizerDashboard
     config = OrganizerDashboard.config
     
-    # Get GPU info
-    from OrganizerDashboard.helpers.helpers import get_gpus
-    gpus = get_gpus()
-    gpu_display = gpus[0] if gpus else "N/A"
-    
     # Derive basic client context from the request
     try:
         client_ip = request.headers.get('X-Forwarded-For', request.remote_addr)
@@ -98,13 +64,10 @@ def dashboard():
         client_ip = ''
         client_ua = ''
 
+    vm = psutil.virtual_memory()
     return render_template(
-        "dashboard.html",
-        hostname=socket.gethostname(),
-        os=get_windows_version(),
-        cpu=get_cpu_name(),
-        ram_gb=round(psutil.virtual_memory().total / (1024**3), 2),
-        gpu=gpu_display,
+        compiled_template("dashboard.html"),
+        **get_static_host_info(),
         private_ip=get_private_ip(),
         public_ip=get_public_ip(),
         upload_rate_kb=0,
@@ -112,10 +75,9 @@ def dashboard():
         service_status="Running" if service_running() else "Stopped",
         service_memory_mb=0,
         service_cpu_percent=0,
-        total_memory_mb=round(psutil.virtual_memory().used / (1024 * 1024), 2),
-        total_memory_gb=round(psutil.virtual_memory().total / (1024 * 1024 * 1024), 2),
-        total_cpu_percent=psutil.cpu_percent(interval=0.2),
-        ram_percent=psutil.virtual_memory().percent,
+        total_memory_mb=round(vm.used / (1024 * 1024), 2),
+        total_cpu_percent=get_cpu_percent(),
+        ram_percent=vm.percent,
         top_processes=top_processes,
         drives=drives,
         memory_threshold=config.get('memory_threshold_mb', 200),
@@ -124,21 +86,16 @@ def dashboard():
         watch_folder=config.get('watch_folder', ''),
         stdout_log="",
         stderr_log="",
-        is_windows=(sys.platform == "win32"),
-        routes=json.dumps({}),
-        custom_routes=json.dumps({}),
+        routes=config.get('routes', {}),
+        custom_routes="{}",
+        organizer_config_json=dumps_json(_organizer_config_payload(config)),
         client_ip=client_ip,
         client_ua=client_ua
     )
 
-@routes_dashboard.route("/api/organizer/config", methods=["GET"])
-@requires_auth
-def get_organizer_config():
-    """Return organizer configuration including routes and custom_routes."""
-    import OrganizerDashboard
-    config = OrganizerDashboard.config
-    
-    return jsonify({
+def _organizer_config_payload(config):
+    """Subset of the organizer config exposed to the dashboard UI."""
+    return {
         "routes": config.get("routes", {}),
         "custom_routes": config.get("custom_routes", {}),
         "tag_routes": config.get("tag_routes", {}),
@@ -151,4 +108,11 @@ def get_organizer_config():
         # Feature flags and VirusTotal API key for UI gating
         "features": config.get("features", {}),
         "vt_api_key": config.get("vt_api_key") or config.get("virustotal_api_key") or ""
-    })
+    }
+
+@routes_dashboard.route("/api/organizer/config", methods=["GET"])
+@requires_auth
+def get_organizer_config():
+    """Return organizer configuration including routes and custom_routes."""
+    import OrganizerDashboard
+    return jsonify(_organizer_config_payload(OrganizerDashboard.config))
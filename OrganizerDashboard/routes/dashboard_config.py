@@ -1,8 +1,9 @@
 from flask import Blueprint, jsonify, request, render_template, redirect, url_for
 from flask_login import current_user
-import json
 import sys
-import bcrypt
+from OrganizerDashboard.config_runtime import write_json
+from OrganizerDashboard.helpers.helpers import compiled_template
+from OrganizerDashboard.auth.auth import hash_password
 
 routes_dashboard_config = Blueprint('routes_dashboard_config', __name__)
 
@@ -10,8 +11,8 @@ routes_dashboard_config = Blueprint('routes_dashboard_config', __name__)
 def config_page():
     """Render dashboard configuration UI (users, roles, layout)."""
     # Check both session auth (Flask-Login) and Basic Auth header
-    from OrganizerDashboard.auth.auth import check_auth
-    auth = request.authorization
+    from OrganizerDashboard.auth.auth import check_auth, basic_auth
+    auth = basic_auth()
     is_authenticated = getattr(current_user, 'is_authenticated', False)
     has_basic_auth = auth and check_auth(str(auth.username), str(auth.password))
     
@@ -20,7 +21,7 @@ def config_page():
     
     main = sys.modules['__main__']
     dash_cfg = getattr(main, 'dashboard_config', {})
-    return render_template('dashboard_config.html', roles=dash_cfg.get('roles', {}))
+    return render_template(compiled_template('dashboard_config.html'), roles=dash_cfg.get('roles', {}))
 
 @routes_dashboard_config.route('/api/dashboard/config', methods=['GET'])
 def get_dashboard_config():
@@ -78,13 +79,13 @@ def add_or_update_user():
         if existing is None:
             entry = {'username': username, 'role': role}
             if password:
-                pw_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+                pw_hash = hash_password(password).decode('utf-8')
                 entry['password_hash'] = pw_hash
             users.append(entry)
         else:
             existing['role'] = role
             if password and password != '***':
-                pw_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+                pw_hash = hash_password(password).decode('utf-8')
                 existing['password_hash'] = pw_hash
         dash_cfg['users'] = users
         _persist_dashboard_config(dash_cfg, main)
@@ -134,8 +135,10 @@ def _persist_dashboard_config(dash_cfg, main_module):
         # Increment version
         current_version = dash_cfg.get('config_version', 1)
         dash_cfg['config_version'] = current_version + 1
-        with open(getattr(main_module, 'DASHBOARD_CONFIG_FILE', 'dashboard_config.json'), 'w', encoding='utf-8') as f:
-            json.dump(dash_cfg, f, indent=4)
+        write_json(getattr(main_module, 'DASHBOARD_CONFIG_FILE', 'dashboard_config.json'), dash_cfg)
         main_module.dashboard_config = dash_cfg
+        # User passwords may have changed; drop cached verifications
+        from OrganizerDashboard.auth.auth import invalidate_auth_cache
+        invalidate_auth_cache()
     except Exception:
         pass
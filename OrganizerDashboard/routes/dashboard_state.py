@@ -0,0 +1,28 @@
+from flask import Blueprint
+from OrganizerDashboard.auth.auth import requires_right
+from OrganizerDashboard.helpers.helpers import ojsonify_snapshot, ttl_cache
+from OrganizerDashboard.helpers.samplers import get_drives, get_top_processes
+from OrganizerDashboard.routes.metrics import collect_metrics, _METRICS_TTL
+from OrganizerDashboard.routes.network import network_payload
+
+routes_dashboard_state = Blueprint('routes_dashboard_state', __name__)
+
+@ttl_cache(_METRICS_TTL)
+def collect_dashboard_state():
+    """Merge metrics, network, drives and tasks into one payload.
+
+    The metrics fields stay at the top level so the same updaters handle
+    this response, /metrics and the /events stream. Cached like the metrics,
+    so polls from several tabs share one snapshot and one encode.
+    """
+    state = dict(collect_metrics())
+    state["network"] = network_payload()
+    state["drives"] = get_drives()
+    state["tasks"] = get_top_processes()
+    return state
+
+@routes_dashboard_state.route("/dashboard_state")
+@requires_right('view_metrics')
+def dashboard_state():
+    """Everything the dashboard refreshes, in a single round-trip."""
+    return ojsonify_snapshot('dashboard_state', collect_dashboard_state())
@@ -1,22 +1,9 @@
-from flask import Blueprint, jsonify
-import psutil
+from flask import Blueprint
+from OrganizerDashboard.helpers.helpers import ojsonify_snapshot
+from OrganizerDashboard.helpers.samplers import get_drives
 
 routes_drives = Blueprint('routes_drives', __name__)
 
 @routes_drives.route("/drives")
 def drives():
-    drives_info = []
-    for part in psutil.disk_partitions():
-        try:
-            usage = psutil.disk_usage(part.mountpoint)
-            drives_info.append({
-                "device": part.device,
-                "mountpoint": part.mountpoint,
-                "total": usage.total,
-                "used": usage.used,
-                "free": usage.free,
-                "percent": usage.percent
-            })
-        except Exception:
-            continue
-    return jsonify(drives_info)
+    return ojsonify_snapshot('drives', get_drives())
@@ -11,11 +11,11 @@ Routes:
 
 from flask import Blueprint, jsonify, request, render_template, redirect, url_for
 from pathlib import Path
-import json
 import logging
 import os
 from datetime import datetime
 from functools import wraps
+from OrganizerDashboard.config_runtime import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
@@ -45,8 +45,7 @@ def load_file_hashes():
     if not FILE_HASHES_JSON.exists():
         return {}
     try:
-        with FILE_HASHES_JSON.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return read_json(FILE_HASHES_JSON)
     except Exception as e:
         logger.error(f"Failed to load file hashes: {e}")
         return {}
@@ -60,8 +59,7 @@ def save_file_hashes(hashes):
     """
     try:
         FILE_HASHES_JSON.parent.mkdir(parents=True, exist_ok=True)
-        with FILE_HASHES_JSON.open("w", encoding="utf-8") as f:
-            json.dump(hashes, f, indent=2, ensure_ascii=False)
+        write_json(str(FILE_HASHES_JSON), hashes)
     except Exception as e:
         logger.error(f"Failed to save file hashes: {e}")
 
@@ -149,8 +147,7 @@ def get_duplicates():
         cfg_path = ROOT / 'organizer_config.json'
         try:
             if cfg_path.exists():
-                with cfg_path.open('r', encoding='utf-8') as f:
-                    cfg = json.load(f)
+                cfg = read_json(cfg_path)
                 feats = cfg.get('features') or {}
                 if feats.get('duplicates_enabled') is False:
                     return jsonify({"error": "Duplicate detection disabled"}), 400
@@ -242,8 +239,7 @@ def resolve_duplicates():
         cfg_path = ROOT / 'organizer_config.json'
         try:
             if cfg_path.exists():
-                with cfg_path.open('r', encoding='utf-8') as f:
-                    cfg = json.load(f)
+                cfg = read_json(cfg_path)
                 feats = cfg.get('features') or {}
                 if feats.get('duplicates_enabled') is False:
                     return jsonify({"error": "Duplicate detection disabled"}), 400
@@ -3,13 +3,14 @@ import subprocess
 import sys
 import os
 from OrganizerDashboard.auth.auth import requires_auth
+from OrganizerDashboard.helpers.helpers import compiled_template
 
 routes_env = Blueprint('routes_env', __name__)
 
 
 @routes_env.route('/env-test')
 def env_test_page():
-    return render_template('environment_test.html')
+    return render_template(compiled_template('environment_test.html'))
 
 
 @routes_env.route('/api/env/ping')
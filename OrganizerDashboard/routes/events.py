@@ -0,0 +1,32 @@
+from flask import Blueprint, stream_with_context
+import time
+from OrganizerDashboard.auth.auth import requires_right
+from OrganizerDashboard.helpers.helpers import dumps_json, sse_response
+from OrganizerDashboard.routes.metrics import collect_metrics
+
+routes_events = Blueprint('routes_events', __name__)
+
+EVENTS_INTERVAL = 2.0  # seconds; matches the metrics cache TTL
+
+def _metrics_events():
+    """Yield a ``metrics`` SSE event every EVENTS_INTERVAL seconds."""
+    last = None
+    while True:
+        body = dumps_json(collect_metrics())
+        # Unchanged snapshots go out as a comment so proxies keep the line open
+        yield f"event: metrics\ndata: {body}\n\n" if body != last else ": keep-alive\n\n"
+        last = body
+        time.sleep(EVENTS_INTERVAL)
+
+@routes_events.route("/events")
+@routes_events.route("/stream/metrics")
+@requires_right('view_metrics')
+def events():
+    """Push dashboard metrics over one Server-Sent Events connection.
+
+    Also served at /stream/metrics next to the /stream/<log> endpoints.
+    """
+    return sse_response(
+        stream_with_context(_metrics_events()),
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,9 +1,10 @@
 """Factory reset route - restore all configurations to defaults."""
 
 from flask import Blueprint, jsonify
-import json
+import copy
 import sys
 import os
+from OrganizerDashboard.config_runtime import write_json
 
 routes_factory_reset = Blueprint('routes_factory_reset', __name__)
 
@@ -19,12 +20,11 @@ def factory_reset():
             main = sys.modules['__main__']
             
             # Get default configs from main module
-            default_config = main.DEFAULT_CONFIG.copy()
-            default_dashboard_config = main.DASHBOARD_CONFIG_DEFAULT.copy()
+            default_config = copy.deepcopy(main.DEFAULT_CONFIG)
+            default_dashboard_config = copy.deepcopy(main.DASHBOARD_CONFIG_DEFAULT)
             
             # Reset organizer_config.json
-            with open(main.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(default_config, f, indent=4)
+            write_json(main.CONFIG_FILE, default_config)
             
             # Reset dashboard_config.json (preserve admin user)
             admin_user = getattr(main, 'ADMIN_USER', 'admin')
@@ -32,12 +32,11 @@ def factory_reset():
                 "users": [
                     {"username": admin_user, "role": "admin"}
                 ],
-                "roles": default_dashboard_config['roles'].copy(),
-                "layout": default_dashboard_config['layout'].copy()
+                "roles": default_dashboard_config['roles'],
+                "layout": default_dashboard_config['layout']
             }
             
-            with open(main.DASHBOARD_CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(reset_dashboard_config, f, indent=4)
+            write_json(main.DASHBOARD_CONFIG_FILE, reset_dashboard_config)
             
             # Update in-memory configs (use setattr for dynamic attributes)
             setattr(main, 'config', default_config.copy())
@@ -1,10 +1,14 @@
 from flask import Blueprint, render_template, request, redirect, url_for, jsonify
 from flask_login import login_user, logout_user, current_user, UserMixin
-from OrganizerDashboard.auth.auth import check_auth
+from OrganizerDashboard.auth.auth import check_auth, rate_limit
+from OrganizerDashboard.helpers.helpers import compiled_template
 
 routes_login = Blueprint('routes_login', __name__)
 
 class User(UserMixin):
+    """Session user; one is built per authenticated request by the user_loader."""
+    __slots__ = ('id', 'role')
+
     def __init__(self, username, role='viewer'):
         self.id = username
         self.role = role
@@ -29,15 +33,16 @@ def _resolve_role(username: str) -> str:
 def login_page():
     if current_user.is_authenticated:
         return redirect(url_for('routes_dashboard.dashboard'))
-    return render_template('login.html')
+    return render_template(compiled_template('login.html'))
 
 @routes_login.route('/login', methods=['POST'])
+@rate_limit(10, 60)
 def login_post():
     # Accept form or JSON
     username = request.form.get('username') or (request.json.get('username') if request.is_json else None)
     password = request.form.get('password') or (request.json.get('password') if request.is_json else None)
     if not username or not password:
-        return render_template('login.html', error='Missing username or password'), 400
+        return render_template(compiled_template('login.html'), error='Missing username or password'), 400
     if check_auth(username, password):
         role = _resolve_role(username)
         user = User(username, role)
@@ -50,7 +55,7 @@ def login_post():
             pass
         login_user(user, remember=remember)
         return redirect(url_for('routes_dashboard.dashboard'))
-    return render_template('login.html', error='Invalid credentials'), 401
+    return render_template(compiled_template('login.html'), error='Invalid credentials'), 401
 
 @routes_login.route('/logout', methods=['GET'])
 def logout():
@@ -1,21 +1,20 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint
 from OrganizerDashboard.auth.auth import requires_right
 import psutil
-import time
-from OrganizerDashboard.helpers.helpers import service_running, find_organizer_proc
+from OrganizerDashboard.helpers.helpers import service_running, find_organizer_proc, ojsonify_snapshot, ttl_cache
+from OrganizerDashboard.helpers.samplers import get_top_processes, get_cpu_percent, get_process_cpu_percent
 
 routes_metrics = Blueprint('routes_metrics', __name__)
 
-_METRICS_CACHE = {"data": None, "ts": 0.0}
 _METRICS_TTL = 2.0  # seconds
 
-@routes_metrics.route("/metrics")
-@requires_right('view_metrics')
-def metrics():
-    now = time.time()
-    if _METRICS_CACHE["data"] is not None and (now - _METRICS_CACHE["ts"]) < _METRICS_TTL:
-        return jsonify(_METRICS_CACHE["data"])
+@ttl_cache(_METRICS_TTL)
+def collect_metrics():
+    """Return the current metrics payload, reusing it for _METRICS_TTL seconds.
 
+    Overlapping requests from several tabs (and the /events streams) share a
+    single refresh instead of each probing psutil and the service.
+    """
     running = service_running()
     mem_mb = 0.0
     cpu_pct = 0.0
@@ -24,7 +23,8 @@ def metrics():
     proc = find_organizer_proc()
     if proc:
         try:
-            cpu_pct = proc.cpu_percent(interval=0.1)
+            # Measured by the tasks sampler's scan; nothing is probed here
+            cpu_pct = get_process_cpu_percent(proc.pid)
             mem_mb = proc.memory_info().rss / (1024 * 1024)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
@@ -34,10 +34,15 @@ def metrics():
         "total_memory_mb": ram.used / (1024 * 1024),
         "total_memory_gb": ram.total / (1024 * 1024 * 1024),
         "service_cpu_percent": cpu_pct,
-        "total_cpu_percent": psutil.cpu_percent(interval=0.1),
+        "total_cpu_percent": get_cpu_percent(),
         "ram_percent": ram_pct,
+        # Sidebar task manager rows
+        "top_processes": [dict(p, mem=round(p["mem"], 1)) for p in get_top_processes()[:3]],
         "cached": False
     }
-    _METRICS_CACHE["data"] = payload
-    _METRICS_CACHE["ts"] = now
-    return jsonify(payload)
+    return payload
+
+@routes_metrics.route("/metrics")
+@requires_right('view_metrics')
+def metrics():
+    return ojsonify_snapshot('metrics', collect_metrics())
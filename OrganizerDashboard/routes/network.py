@@ -1,33 +1,25 @@
-from flask import Blueprint, jsonify
-import psutil
-import time
+from flask import Blueprint
+from OrganizerDashboard.helpers.helpers import ojsonify
+from OrganizerDashboard.helpers.samplers import get_network
 
 routes_network = Blueprint('routes_network', __name__)
 
-last_net = psutil.net_io_counters()
-last_time = time.time()
+def network_payload():
+    """Return the current upload/download rates and totals."""
+    net = get_network()
+    upload_rate_b = net["upload_rate_b"]
+    download_rate_b = net["download_rate_b"]
+    return {
+        "upload_rate_b": upload_rate_b,
+        "download_rate_b": download_rate_b,
+        "upload_rate_kb": upload_rate_b / 1024,
+        "download_rate_kb": download_rate_b / 1024,
+        "upload_rate_mb": upload_rate_b / (1024 * 1024),
+        "download_rate_mb": download_rate_b / (1024 * 1024),
+        "total_sent": net["total_sent"],
+        "total_recv": net["total_recv"]
+    }
 
 @routes_network.route("/network")
 def network():
-    global last_net, last_time
-    now_net = psutil.net_io_counters()
-    now_time = time.time()
-    interval = now_time - last_time
-    upload_rate_b = (now_net.bytes_sent - last_net.bytes_sent) / interval if interval > 0 else 0
-    download_rate_b = (now_net.bytes_recv - last_net.bytes_recv) / interval if interval > 0 else 0
-    last_net = now_net
-    last_time = now_time
-    upload_rate_kb = upload_rate_b / 1024
-    download_rate_kb = download_rate_b / 1024
-    upload_rate_mb = upload_rate_b / (1024 * 1024)
-    download_rate_mb = download_rate_b / (1024 * 1024)
-    return jsonify({
-        "upload_rate_b": upload_rate_b,
-        "download_rate_b": download_rate_b,
-        "upload_rate_kb": upload_rate_kb,
-        "download_rate_kb": download_rate_kb,
-        "upload_rate_mb": upload_rate_mb,
-        "download_rate_mb": download_rate_mb,
-        "total_sent": now_net.bytes_sent,
-        "total_recv": now_net.bytes_recv
-    })
+    return ojsonify(network_payload())
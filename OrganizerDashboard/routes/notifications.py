@@ -1,10 +1,10 @@
 """Notification Center API endpoints for persistent notification history."""
 
-import json
 from pathlib import Path
 from datetime import datetime, timedelta
 from flask import Blueprint, jsonify, request
 from OrganizerDashboard.auth.auth import requires_auth
+from OrganizerDashboard.config_runtime import read_json, write_json
 
 routes_notifications = Blueprint('notifications', __name__)
 
@@ -16,8 +16,7 @@ def load_notifications():
     """Load notification history from JSON."""
     try:
         if NOTIFICATIONS_FILE.exists():
-            with NOTIFICATIONS_FILE.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return read_json(NOTIFICATIONS_FILE)
         return []
     except Exception as e:
         print(f"Error loading notifications: {e}")
@@ -27,8 +26,7 @@ def load_notifications():
 def save_notifications(notifications):
     """Save notification history to JSON."""
     try:
-        with NOTIFICATIONS_FILE.open("w", encoding="utf-8") as f:
-            json.dump(notifications, f, indent=2, ensure_ascii=False)
+        write_json(str(NOTIFICATIONS_FILE), notifications)
     except Exception as e:
         print(f"Error saving notifications: {e}")
 
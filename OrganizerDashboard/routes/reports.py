@@ -1,10 +1,10 @@
 from flask import Blueprint, jsonify, request
 import smtplib
 from email.message import EmailMessage
-import json
 import os
 from pathlib import Path
 from base64 import b64decode
+from OrganizerDashboard.config_runtime import read_json
 
 reports_bp = Blueprint('reports', __name__)
 
@@ -14,8 +14,7 @@ FILE_MOVES_JSON = Path('C:/Scripts/file_moves.json')
 
 def load_json(path: Path):
     try:
-        with path.open('r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(path)
     except Exception:
         return {}
 
@@ -108,8 +107,7 @@ def test_nas():
     # Load credentials if key provided
     cfg = {}
     try:
-        with CONFIG_PATH.open('r', encoding='utf-8') as f:
-            cfg = json.load(f)
+        cfg = read_json(CONFIG_PATH)
     except Exception:
         pass
 
@@ -1,20 +1,28 @@
 from flask import Blueprint, jsonify, request
 from OrganizerDashboard.auth.auth import requires_right
+from OrganizerDashboard.config_runtime import flush_writes
 import sys
 import subprocess
+import threading
 
 routes_restart_service = Blueprint('routes_restart_service', __name__)
 
 SERVICE_NAME = "DownloadsOrganizer"
 
+def _restart():
+    """Stop then start the service; runs off the request thread."""
+    # A config saved just before must be on disk when the service starts
+    flush_writes(5.0)
+    subprocess.run(["sc", "stop", SERVICE_NAME], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    subprocess.run(["sc", "start", SERVICE_NAME], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
 @routes_restart_service.route("/restart", methods=["POST"])
 @requires_right('manage_service')
 def restart_service():
     if sys.platform != "win32":
         return jsonify({"status": "error", "message": "Service control unsupported on this platform"}), 400
     try:
-        subprocess.run(["sc", "stop", SERVICE_NAME], capture_output=True, text=True)
-        subprocess.run(["sc", "start", SERVICE_NAME], capture_output=True, text=True)
-        return jsonify({"status": "success", "message": "Service restarted"}), 200
+        threading.Thread(target=_restart, daemon=True).start()
+        return jsonify({"status": "pending", "message": "Service restart requested"}), 202
     except Exception as e:
         return jsonify({"status": "error", "message": f"Restart failed: {e}"}), 500
@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify
+from OrganizerDashboard.helpers.helpers import revalidatable
 
 routes_service_name = Blueprint('routes_service_name', __name__)
 
@@ -7,4 +8,4 @@ SERVICE_NAME = "DownloadsOrganizer"
 @routes_service_name.route('/service_name')
 def service_name():
     """Return the configured Windows service name used by the dashboard/installer."""
-    return jsonify({"service_name": SERVICE_NAME})
+    return revalidatable(jsonify({"service_name": SERVICE_NAME}))
@@ -3,10 +3,11 @@
 from flask import Blueprint, render_template, request, jsonify, current_app
 import sys
 import json
-import bcrypt
 import os
 import subprocess
 from pathlib import Path
+from OrganizerDashboard.helpers.helpers import compiled_template
+from OrganizerDashboard.auth.auth import hash_password
 
 routes_setup = Blueprint('routes_setup', __name__)
 
@@ -68,7 +69,7 @@ def setup_page():
         features = { 'virustotal_enabled': False, 'duplicates_enabled': True, 'reports_enabled': True }
 
     return render_template(
-        'dashboard_setup.html',
+        compiled_template('dashboard_setup.html'),
         available_methods=available_methods,
         host_os=host_os,
         recommended_watch_folders=recommended,
@@ -151,6 +152,8 @@ def start_organizer_process():
         """Start the organizer service/process without requiring authentication."""
         from OrganizerDashboard.helpers.helpers import find_organizer_proc
 
+        # Never trust a cached miss here: it could spawn a second organizer
+        find_organizer_proc.cache_clear()
         existing = find_organizer_proc()
         if existing:
             return jsonify({
@@ -246,7 +249,7 @@ def setup_initialize():
 
     # Hash admin password
     try:
-        password_hash = bcrypt.hashpw(admin_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        password_hash = hash_password(admin_password).decode('utf-8')
     except Exception as e:
         return jsonify({'error': f'Failed to hash password: {e}'}), 500
 
@@ -328,13 +331,10 @@ def setup_initialize():
 
     # Optionally auto-login the new admin user
     try:
-        from flask_login import login_user, UserMixin
-        class _SetupUser(UserMixin):
-            def __init__(self, username, role='admin'):
-                self.id = username
-                self.role = role
+        from flask_login import login_user
+        from OrganizerDashboard.routes.login import User
         # Remember setup auto-login for convenience
-        login_user(_SetupUser(admin_username, role='admin'), remember=True)
+        login_user(User(admin_username, role='admin'), remember=True)
         return jsonify({'success': True, 'message': 'Setup completed. Logged in as admin.', 'auto_logged_in': True})
     except Exception:
         return jsonify({'success': True, 'message': 'Setup completed. Redirecting to login...', 'auto_logged_in': False})
@@ -13,7 +13,8 @@ def start_service():
     if sys.platform != "win32":
         return jsonify({"status": "error", "message": "Service control unsupported on this platform"}), 400
     try:
-        subprocess.run(["sc", "start", SERVICE_NAME], capture_output=True, text=True)
-        return jsonify({"status": "success", "message": "Service started"}), 200
+        # Fire-and-forget: `sc start` can take seconds; the UI polls /metrics for the transition
+        subprocess.Popen(["sc", "start", SERVICE_NAME], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return jsonify({"status": "pending", "message": "Service start requested"}), 202
     except Exception as e:
         return jsonify({"status": "error", "message": f"Start failed: {e}"}), 500
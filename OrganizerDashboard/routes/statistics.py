@@ -1,11 +1,12 @@
 """Statistics API endpoints for file organization analytics."""
 
-import json
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
-from flask import Blueprint, jsonify, render_template
+from flask import Blueprint, render_template
 from OrganizerDashboard.auth.auth import requires_auth
+from OrganizerDashboard.helpers.helpers import compiled_template, ojsonify
+from OrganizerDashboard.config_runtime import read_json
 import os
 
 routes_statistics = Blueprint('statistics', __name__)
@@ -22,16 +23,14 @@ def load_file_moves():
         cfg_path = ROOT / 'organizer_config.json'
         try:
             if cfg_path.exists():
-                with cfg_path.open('r', encoding='utf-8') as f:
-                    cfg = json.load(f)
+                cfg = read_json(str(cfg_path))
                 feats = cfg.get('features') or {}
                 if feats.get('reports_enabled') is False:
                     return []
         except Exception:
             pass
         if FILE_MOVES_JSON.exists():
-            with FILE_MOVES_JSON.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return read_json(str(FILE_MOVES_JSON))
         return []
     except Exception as e:
         print(f"Error loading file moves: {e}")
@@ -53,7 +52,7 @@ def get_statistics_overview():
     moves = load_file_moves()
     
     if not moves:
-        return jsonify({
+        return ojsonify({
             "total_files": 0,
             "total_categories": 0,
             "today_count": 0,
@@ -93,7 +92,7 @@ def get_statistics_overview():
     days_active = max((now - oldest_date).days, 1)
     avg_per_day = round(len(moves) / days_active, 1)
     
-    return jsonify({
+    return ojsonify({
         "total_files": len(moves),
         "total_categories": len(categories),
         "today_count": today_count,
@@ -122,7 +121,7 @@ def get_statistics_by_category():
         categories.append(cat)
         counts.append(count)
     
-    return jsonify({
+    return ojsonify({
         "labels": categories,
         "data": counts
     })
@@ -148,7 +147,7 @@ def get_statistics_by_extension():
         top_extensions.append(f".{ext}")
         top_counts.append(count)
     
-    return jsonify({
+    return ojsonify({
         "labels": top_extensions,
         "data": top_counts
     })
@@ -183,7 +182,7 @@ def get_statistics_timeline():
         counts.append(daily_counts.get(date_key, 0))
         current_date += timedelta(days=1)
     
-    return jsonify({
+    return ojsonify({
         "labels": dates,
         "data": counts
     })
@@ -205,7 +204,7 @@ def get_recent_files():
             "destination": move.get("destination_path", "")
         })
     
-    return jsonify({"files": recent})
+    return ojsonify({"files": recent})
 
 
 @routes_statistics.route("/api/statistics/hourly-activity", methods=["GET"])
@@ -223,7 +222,7 @@ def get_hourly_activity():
     
     labels = [f"{h:02d}:00" for h in range(24)]
     
-    return jsonify({
+    return ojsonify({
         "labels": labels,
         "data": hourly_counts
     })
@@ -233,4 +232,4 @@ def get_hourly_activity():
 @requires_auth
 def statistics_full_view():
     """Render a standalone full-view statistics page with charts."""
-    return render_template('statistics_full.html')
+    return render_template(compiled_template('statistics_full.html'))
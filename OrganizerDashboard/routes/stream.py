@@ -1,5 +1,5 @@
-from flask import Blueprint, Response
-from OrganizerDashboard.helpers.helpers import sse_stream
+from flask import Blueprint
+from OrganizerDashboard.helpers.helpers import sse_response, sse_stream
 import os
 
 routes_stream = Blueprint('routes_stream', __name__)
@@ -12,4 +12,4 @@ def stream(which):
     STDOUT_LOG = OrganizerDashboard.STDOUT_LOG
     STDERR_LOG = OrganizerDashboard.STDERR_LOG
     path = STDOUT_LOG if which == "stdout" else STDERR_LOG
-    return Response(sse_stream(path), mimetype="text/event-stream")
+    return sse_response(sse_stream(path))
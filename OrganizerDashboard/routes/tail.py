@@ -1,9 +1,11 @@
-from flask import Blueprint, request
-from OrganizerDashboard.helpers.helpers import last_n_lines_normalized
+from flask import Blueprint, Response, request, stream_with_context
+from OrganizerDashboard.helpers.helpers import iter_last_n_lines_normalized, read_from_offset
 import os
 
 routes_tail = Blueprint('routes_tail', __name__)
 
+MAX_TAIL_LINES = 10000  # bounds the memory a single /tail request can hold
+
 @routes_tail.route("/tail/<which>")
 def tail(which):
     if which not in ("stdout", "stderr"):
@@ -12,5 +14,19 @@ def tail(which):
     STDOUT_LOG = OrganizerDashboard.STDOUT_LOG
     STDERR_LOG = OrganizerDashboard.STDERR_LOG
     path = STDOUT_LOG if which == "stdout" else STDERR_LOG
-    lines = int(request.args.get("lines", "200"))
-    return last_n_lines_normalized(path, lines)
+    offset = request.args.get("offset")
+    if offset is not None:
+        # Incremental refresh: only the bytes written since the client's last read
+        if not os.path.exists(path):
+            return Response("", mimetype="text/plain", headers={"X-Log-Offset": "0"})
+        try:
+            text, end = read_from_offset(path, int(offset))
+        except ValueError:
+            return "Invalid offset", 400
+        return Response(text, mimetype="text/plain", headers={"X-Log-Offset": str(end)})
+    try:
+        lines = min(int(request.args.get("lines", "200")), MAX_TAIL_LINES)
+    except ValueError:
+        return "Invalid line count", 400
+    # Streamed in chunks so large tails are not built up as one string
+    return Response(stream_with_context(iter_last_n_lines_normalized(path, lines)), mimetype="text/plain")
@@ -4,7 +4,6 @@ from flask import Blueprint, jsonify, request
 import sys
 import os
 import subprocess
-import json
 from OrganizerDashboard.auth.auth import requires_right
 
 routes_unc_creds = Blueprint('routes_unc_creds', __name__)
@@ -161,10 +160,8 @@ def save_credentials():
         config['unc_credentials'][path_key] = cred_entry
         
         # Persist to file
-        from OrganizerDashboard.config_runtime import get_config_path
-        config_path = get_config_path()
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4)
+        from OrganizerDashboard.config_runtime import get_paths, write_json
+        write_json(get_paths()["config_path"], config)
         
         main.config = config
         return jsonify({'success': True, 'message': 'Credentials saved successfully'})
@@ -1,13 +1,16 @@
 from flask import Blueprint, request, jsonify
 from OrganizerDashboard.auth.auth import requires_right
-import json
+from OrganizerDashboard.config_runtime import write_json_async
 import os
+import re
 
 routes_update_config = Blueprint('routes_update_config', __name__)
 
 # Try to save to the same locations the Organizer checks
 CONFIG_FILES = ["organizer_config.json", "C:/Scripts/organizer_config.json"]
 
+_FOLDER_KEY_RE = re.compile(r"^folder_(\d+)$")
+
 @routes_update_config.route("/update", methods=["POST"])
 @requires_right('manage_config')
 def update_config():
@@ -74,19 +77,17 @@ def update_config():
             config['features'] = feats
     else:
         # Legacy form support (including feature toggles and vt_api_key)
+        # Pair folder_N/exts_N fields in one pass over the submitted keys
+        form = request.form
+        indexes = sorted(int(m.group(1)) for m in map(_FOLDER_KEY_RE.match, form) if m)
         new_routes = {}
-        i = 1
-        while True:
-            folder_key = f"folder_{i}"
-            exts_key = f"exts_{i}"
-            if folder_key in request.form and exts_key in request.form:
-                folder = request.form[folder_key].strip()
-                exts = [e.strip() for e in request.form[exts_key].split(",") if e.strip()]
-                if folder:
-                    new_routes[folder] = exts
-                i += 1
-            else:
-                break
+        for i in indexes:
+            exts_raw = form.get(f"exts_{i}")
+            if exts_raw is None:
+                continue
+            folder = form[f"folder_{i}"].strip()
+            if folder:
+                new_routes[folder] = [e.strip() for e in exts_raw.split(",") if e.strip()]
         new_folder = request.form.get("folder_new", "").strip()
         new_exts = request.form.get("exts_new", "").strip()
         if new_folder:
@@ -130,7 +131,10 @@ def update_config():
             feats['reports_enabled'] = _truthy(reports_enabled)
         config['features'] = feats
 
-    # Save to all config file locations to ensure service picks it up
+    # Save to all config file locations to ensure service picks it up. The
+    # writes happen on the config writer thread, which logs any that fail;
+    # only the directory check runs here so unwritable locations are still
+    # reported.
     saved_count = 0
     errors = []
     for config_path in CONFIG_FILES:
@@ -140,8 +144,7 @@ def update_config():
             if config_dir and not os.path.exists(config_dir):
                 os.makedirs(config_dir, exist_ok=True)
             
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=4)
+            write_json_async(config_path, config)
             saved_count += 1
         except Exception as e:
             errors.append(f"{config_path}: {str(e)}")
@@ -149,7 +152,7 @@ def update_config():
     update_log_paths()
     
     if saved_count > 0:
-        msg = f"Configuration saved to {saved_count} location(s). Restart the Organizer service for changes to take effect."
+        msg = f"Configuration queued for saving to {saved_count} location(s). Restart the Organizer service for changes to take effect."
         if errors:
             msg += f" Some locations failed: {'; '.join(errors)}"
         return jsonify({"status": "success", "message": msg}), 200
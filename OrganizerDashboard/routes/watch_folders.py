@@ -5,11 +5,11 @@ GET /api/watch_folders -> { folders: ["C:/Users/.../Downloads", ...] }
 """
 from flask import Blueprint, jsonify, request
 from pathlib import Path
-import json
 import os
 import sys
 from importlib import import_module
 from datetime import datetime
+from OrganizerDashboard.config_runtime import read_json, write_json
 
 routes_watch_folders = Blueprint('routes_watch_folders', __name__)
 
@@ -22,8 +22,7 @@ def load_config():
     for p in CONFIG_PATHS:
         if p.exists():
             try:
-                with p.open("r", encoding="utf-8") as f:
-                    cfg = json.load(f)
+                cfg = read_json(p)
                 break
             except Exception:
                 cfg = {}
@@ -39,17 +38,15 @@ def append_audit(entry: dict):
         }
         data = []
         if AUDIT_PATH.exists():
-            with AUDIT_PATH.open('r', encoding='utf-8') as f:
-                try:
-                    data = json.load(f)
-                    if not isinstance(data, list):
-                        data = []
-                except Exception:
+            try:
+                data = read_json(AUDIT_PATH)
+                if not isinstance(data, list):
                     data = []
+            except Exception:
+                data = []
         data.append(record)
         AUDIT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with AUDIT_PATH.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        write_json(str(AUDIT_PATH), data)
     except Exception:
         # best-effort; ignore audit failures
         pass
@@ -60,10 +57,9 @@ def get_config_actions():
     try:
         actions = []
         if AUDIT_PATH.exists():
-            with AUDIT_PATH.open('r', encoding='utf-8') as f:
-                actions = json.load(f)
-                if not isinstance(actions, list):
-                    actions = []
+            actions = read_json(AUDIT_PATH)
+            if not isinstance(actions, list):
+                actions = []
         # Return last 50 entries (most recent last)
         return jsonify(actions[-50:])
     except Exception as e:
@@ -124,8 +120,7 @@ def set_watch_folders():
             try:
                 # Only write to a real file path; skip non-existent parent
                 p.parent.mkdir(parents=True, exist_ok=True)
-                with p.open('w', encoding='utf-8') as f:
-                    json.dump(cfg, f, indent=4)
+                write_json(str(p), cfg)
                 return jsonify({ 'success': True, 'folders': valid, 'invalid': invalid })
             except Exception:
                 continue
@@ -0,0 +1,19 @@
+"""ASGI entry point for running the dashboard under uvicorn/hypercorn.
+
+Example:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5000 --workers 1
+
+For HTTP/2 (browsers require TLS for it), use hypercorn instead:
+
+    hypercorn asgi:app --bind 0.0.0.0:5000 --certfile cert.pem --keyfile key.pem
+
+The Flask app is wrapped with asgiref's WsgiToAsgi adapter, so the same
+application (including the /stream SSE endpoints) is served from one ASGI
+runtime alongside the regular JSON routes.
+"""
+from asgiref.wsgi import WsgiToAsgi
+
+from wsgi import app as wsgi_app
+
+app = WsgiToAsgi(wsgi_app)
@@ -0,0 +1,3948 @@
+// Global auth header storage
+let __authHeader = null;
+let __rights = {};
+let __configVersion = 0;
+let __rightsPollIntervalMs = 60000; // 60s polling
+let __csrfToken = null;
+let __organizerFeatures = { virustotal_enabled: true, duplicates_enabled: true, reports_enabled: true };
+let __vtApiKey = '';
+
+// Fetch CSRF token on page load
+async function fetchCSRFToken() {
+    try {
+        const resp = await fetch('/api/csrf-token', { credentials: 'include' });
+        if (resp.ok) {
+            const data = await resp.json();
+            __csrfToken = data.csrf_token;
+        }
+    } catch (e) {
+        console.warn('Failed to fetch CSRF token:', e);
+    }
+}
+
+// Sidebar resizer logic (top-level)
+function initSidebarResizer() {
+    const resizer = document.getElementById('sidebar-resizer');
+    const container = document.querySelector('.dashboard-container');
+    if (!resizer || !container) return;
+
+    // Restore saved width
+    const saved = localStorage.getItem('sidebarWidth');
+    if (saved) {
+        document.documentElement.style.setProperty('--sidebar-width', saved);
+    }
+
+    let startX = 0;
+    function onMouseDown(e) {
+        startX = e.clientX;
+        resizer.classList.add('active');
+        document.body.style.cursor = 'col-resize';
+        document.addEventListener('mousemove', onMouseMove);
+        document.addEventListener('mouseup', onMouseUp);
+    }
+
+    function onMouseMove(e) {
+        const rect = container.getBoundingClientRect();
+        const diffPx = e.clientX - rect.left;
+        let pct = (diffPx / rect.width) * 100;
+        pct = Math.max(15, Math.min(35, pct)); // clamp between 15% and 35%
+        const pctStr = pct.toFixed(1) + '%';
+        document.documentElement.style.setProperty('--sidebar-width', pctStr);
+    }
+
+    function onMouseUp() {
+        resizer.classList.remove('active');
+        document.body.style.cursor = '';
+        document.removeEventListener('mousemove', onMouseMove);
+        document.removeEventListener('mouseup', onMouseUp);
+        const current = getComputedStyle(document.documentElement).getPropertyValue('--sidebar-width').trim();
+        try { localStorage.setItem('sidebarWidth', current); } catch(e) {}
+    }
+
+    resizer.addEventListener('mousedown', onMouseDown);
+
+    // Double-click to cycle presets
+    const presets = [15, 20, 25, 30, 35];
+    resizer.addEventListener('dblclick', function() {
+        const currentStr = getComputedStyle(document.documentElement).getPropertyValue('--sidebar-width').trim() || '20%';
+        const current = parseFloat(currentStr);
+        let idx = presets.findIndex(p => Math.abs(p - current) < 0.51);
+        idx = (idx + 1) % presets.length;
+        const nextPct = presets[idx];
+        const pctStr = nextPct.toFixed(0) + '%';
+        document.documentElement.style.setProperty('--sidebar-width', pctStr);
+        try { localStorage.setItem('sidebarWidth', pctStr); } catch(e) {}
+    });
+}
+
+// Login functionality
+function promptLogin() {
+    document.getElementById('change-password-section').style.display = 'none';
+    document.getElementById('login-submit').style.display = 'inline-block';
+    document.getElementById('change-submit').style.display = 'none';
+    document.getElementById('login-error').style.display = 'none';
+    document.getElementById('login-password').value = '';
+    const modal = new bootstrap.Modal(document.getElementById('loginModal'));
+    modal.show();
+}
+
+function logout() {
+    __authHeader = null;
+    // Clear stored credentials
+    try {
+        sessionStorage.removeItem('authHeader');
+    } catch (e) {}
+    // Remove cookie
+    document.cookie = 'authHeader=; Max-Age=0; Path=/; SameSite=Lax' + (location.protocol === 'https:' ? '; Secure' : '');
+    document.getElementById('login-btn').classList.remove('d-none');
+    document.getElementById('logout-btn').classList.add('d-none');
+    document.getElementById('config-link').classList.add('d-none');
+    showNotification('Logged out successfully', 'info');
+}
+
+document.getElementById('login-submit').addEventListener('click', async function() {
+    const username = document.getElementById('login-username').value;
+    const password = document.getElementById('login-password').value;
+    const remember = document.getElementById('login-remember').checked;
+    const credentials = btoa(username + ':' + password);
+    __authHeader = 'Basic ' + credentials;
+    
+    // Store credentials in sessionStorage and cookie for persistence
+    try {
+        sessionStorage.setItem('authHeader', __authHeader);
+    } catch (e) {
+        console.warn('sessionStorage not available:', e);
+    }
+    // Persist for 14 days in cookie
+    document.cookie = 'authHeader=' + encodeURIComponent(__authHeader) + '; Max-Age=' + (14*24*60*60) + '; Path=/; SameSite=Lax' + (location.protocol === 'https:' ? '; Secure' : '');
+    
+    try {
+        // Also establish server-side session with remember cookie
+        try {
+            await fetch('/login', {
+                method: 'POST',
+                credentials: 'include',
+                headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
+                body: new URLSearchParams({ username, password, remember: remember ? 'on' : '' })
+            });
+        } catch (e) {}
+        const response = await fetch('/auth_check', {
+            credentials: 'include',
+            headers: { 'Authorization': __authHeader }
+        });
+        
+        if (response.ok) {
+            const data = await response.json();
+            __rights = data.rights || {};
+            __configVersion = data.config_version || 0;
+            
+            // Properly hide and clean up the modal
+            const modalEl = document.getElementById('loginModal');
+            if (modalEl) {
+                const modalInstance = bootstrap.Modal.getInstance(modalEl) || new bootstrap.Modal(modalEl);
+                modalInstance.hide();
+                
+                // Wait for modal to finish hiding, then clean up
+                setTimeout(() => {
+                    // Remove any lingering backdrops
+                    document.querySelectorAll('.modal-backdrop').forEach(el => el.remove());
+                    document.body.classList.remove('modal-open');
+                    document.body.style.overflow = '';
+                    document.body.style.paddingRight = '';
+                    modalEl.style.display = 'none';
+                    modalEl.setAttribute('aria-hidden', 'true');
+                    modalEl.classList.remove('show');
+                }, 300);
+            }
+            
+            const loginBtn = document.getElementById('login-btn');
+            const logoutBtn = document.getElementById('logout-btn');
+            if (loginBtn) loginBtn.classList.add('d-none');
+            if (logoutBtn) logoutBtn.classList.remove('d-none');
+            // Show config link if user has manage_config or modify_layout rights
+            if (__rights.manage_config || __rights.modify_layout) {
+                const cfg = document.getElementById('config-link');
+                if (cfg) cfg.classList.remove('d-none');
+            }
+            showNotification('Login successful', 'success');
+            applyRights();
+            // Show reset layout button after login
+            const resetBtn = document.getElementById('reset-layout-btn');
+            if (resetBtn) resetBtn.classList.remove('d-none');
+            // Reload user-specific layout and widgets
+            loadDashboardLayout();
+            loadCustomWidgets();
+            initResizableTables();
+            syncAuthButtons();
+            initSidebarResizer();
+            initMobileCollapsible();
+            updateServiceStatus();
+        } else {
+            document.getElementById('login-error').textContent = 'Invalid credentials';
+            document.getElementById('login-error').style.display = 'block';
+            __authHeader = null;
+        }
+    } catch (error) {
+        const le = document.getElementById('login-error');
+        if (le) {
+            le.textContent = 'Login failed: ' + error.message;
+            le.style.display = 'block';
+        }
+        __authHeader = null;
+    }
+});
+
+function getAuthHeaders() {
+    // Fallback: restore authHeader from cookie if missing
+    if (!__authHeader) {
+        try {
+            const match = document.cookie.match(/(?:^|; )authHeader=([^;]+)/);
+            if (match) {
+                __authHeader = decodeURIComponent(match[1]);
+            }
+        } catch (e) {}
+    }
+    const headers = __authHeader ? { 'Authorization': __authHeader } : {};
+    if (__csrfToken) {
+        headers['X-CSRFToken'] = __csrfToken;
+    }
+    return headers;
+}
+
+// Drag & Drop for Dashboard Modules with Visual Indicators
+let draggedElement = null;
+
+function initDragAndDrop() {
+    const modules = document.querySelectorAll('.dashboard-module[draggable="true"]');
+    modules.forEach(module => {
+        if (module.dataset.dragInit === 'true') return;
+        module.dataset.dragInit = 'true';
+        module.dataset.dragHandleActive = 'false';
+
+        module.addEventListener('mousedown', function(e) {
+            this.dataset.dragHandleActive = e.target.closest('.drag-handle') ? 'true' : 'false';
+        });
+        module.addEventListener('mouseup', function() {
+            this.dataset.dragHandleActive = 'false';
+        });
+        module.addEventListener('mouseleave', function() {
+            this.dataset.dragHandleActive = 'false';
+        });
+
+        module.addEventListener('dragstart', handleDragStart);
+        module.addEventListener('dragover', handleDragOver);
+        module.addEventListener('dragenter', handleDragEnter);
+        module.addEventListener('dragleave', handleDragLeave);
+        module.addEventListener('drop', handleDrop);
+        module.addEventListener('dragend', handleDragEnd);
+    });
+}
+
+function handleDragStart(e) {
+    if (this.dataset.dragHandleActive !== 'true') {
+        draggedElement = null;
+        e.preventDefault();
+        return false;
+    }
+    draggedElement = this;
+    this.classList.add('dragging');
+    this.dataset.dragHandleActive = 'false';
+    e.dataTransfer.effectAllowed = 'move';
+    e.dataTransfer.setData('text/html', this.innerHTML);
+    
+    // Add visual feedback to other modules
+    setTimeout(() => {
+        document.querySelectorAll('.dashboard-module:not(.dragging)').forEach(m => {
+            m.style.opacity = '0.7';
+        });
+    }, 0);
+}
+
+function handleDragOver(e) {
+    if (e.preventDefault) e.preventDefault();
+    e.dataTransfer.dropEffect = 'move';
+    return false;
+}
+
+function handleDragEnter(e) {
+    if (this === draggedElement) return;
+    this.classList.add('drag-over');
+}
+
+function handleDragLeave(e) {
+    if (this === draggedElement) return;
+    this.classList.remove('drag-over');
+}
+
+function handleDrop(e) {
+    if (e.stopPropagation) e.stopPropagation();
+    this.classList.remove('drag-over');
+    
+    if (draggedElement && draggedElement !== this) {
+        const grid = document.getElementById('dashboard-grid');
+        const allModules = Array.from(grid.children).filter(el => el.classList.contains('dashboard-module'));
+        const draggedIndex = allModules.indexOf(draggedElement);
+        const targetIndex = allModules.indexOf(this);
+        
+        if (draggedIndex < targetIndex) {
+            this.parentNode.insertBefore(draggedElement, this.nextSibling);
+        } else {
+            this.parentNode.insertBefore(draggedElement, this);
+        }
+        
+        saveDashboardLayout();
+    }
+    return false;
+}
+
+function handleDragEnd(e) {
+    this.classList.remove('dragging');
+    this.dataset.dragHandleActive = 'false';
+    
+    // Remove visual feedback
+    document.querySelectorAll('.dashboard-module').forEach(m => {
+        m.style.opacity = '1';
+        m.classList.remove('drag-over');
+    });
+}
+
+async function saveDashboardLayout() {
+    const grid = document.getElementById('dashboard-grid');
+    const layout = Array.from(grid.children).map(el => el.dataset.module).filter(m => m);
+    localStorage.setItem('dashboardLayout_' + (__authHeader || 'default'), JSON.stringify(layout));
+    // Also persist to server
+    try {
+        await fetch('/api/dashboard/layout', {
+            method: 'POST',
+            credentials: 'include',
+            headers: { ...getAuthHeaders(), 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                sections_order: layout,
+                hidden_sections: getHiddenModulesList(),
+                custom_widgets: getCustomWidgetsList()
+            })
+        });
+    } catch (e) { console.warn('Failed to persist layout to server:', e); }
+}
+
+async function loadDashboardLayout() {
+    // Try to load from server first
+    let layout = null, hidden = null, widgets = null;
+    try {
+        const resp = await fetch('/api/dashboard/config', {
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        if (resp.ok) {
+            const data = await resp.json();
+            if (data.layout) {
+                layout = data.layout.sections_order || null;
+                hidden = data.layout.hidden_sections || null;
+                widgets = data.layout.custom_widgets || null;
+            }
+        }
+    } catch (e) { console.warn('Failed to load layout from server:', e); }
+    // Fallback to localStorage if missing
+    if (!layout) {
+        const savedLayout = localStorage.getItem('dashboardLayout_' + (__authHeader || 'default'));
+        if (savedLayout) layout = JSON.parse(savedLayout);
+    }
+    const grid = document.getElementById('dashboard-grid');
+    if (layout && grid) {
+        layout.forEach(moduleId => {
+            const module = grid.querySelector(`[data-module="${moduleId}"]`);
+            if (module) grid.appendChild(module);
+        });
+    }
+    // Restore hidden modules
+    if (hidden) {
+        hidden.forEach(moduleId => {
+            const module = document.querySelector(`[data-module="${moduleId}"]`);
+            if (module) module.classList.add('hidden');
+        });
+    }
+    // Restore custom widgets
+    if (widgets) {
+        restoreCustomWidgets(widgets);
+    }
+}
+
+function resetDashboardLayout() {
+    if (confirm('Reset dashboard to default layout? This will reload the page and restore all settings.')) {
+        localStorage.removeItem('dashboardLayout_' + (__authHeader || 'default'));
+        localStorage.removeItem('hiddenModules_' + (__authHeader || 'default'));
+        localStorage.removeItem('customWidget_' + (__authHeader || 'default'));
+        location.reload();
+    }
+}
+
+// Custom Widget Functions
+// Custom Widget Functions - Multiple widgets support
+let customWidgetCounter = 0;
+
+function addCustomWidget() {
+    const container = document.getElementById('custom-widgets-container');
+    if (!container) return;
+    
+    customWidgetCounter++;
+    const widgetId = 'custom-widget-' + customWidgetCounter;
+    
+    const widgetHtml = `
+        <div class="dashboard-module" data-module="${widgetId}" draggable="true">
+            <div class="card">
+                <div class="card-header d-flex align-items-center">
+                    <b>Custom Widget ${customWidgetCounter}</b>
+                    <button class="btn btn-sm btn-outline-primary ms-2" onclick="editCustomWidget('${widgetId}')">
+                        <i class="bi bi-pencil"></i> Edit
+                    </button>
+                    <span class="hide-toggle" onclick="removeCustomWidget('${widgetId}')" title="Remove widget"><i class="bi bi-trash"></i></span>
+                    <span class="drag-handle ms-auto"><i class="bi bi-grip-vertical"></i></span>
+                </div>
+                <div class="card-body p-3 custom-widget-content" id="${widgetId}-content">
+                    <p class="text-muted text-center mb-0">Click Edit to add custom content, embeds, or widgets</p>
+                </div>
+            </div>
+        </div>
+    `;
+    
+    container.insertAdjacentHTML('beforeend', widgetHtml);
+    saveCustomWidgets();
+    initDragAndDrop(); // Re-init drag for new widget
+}
+
+function editCustomWidget(widgetId) {
+    const content = document.getElementById(widgetId + '-content');
+    if (!content) return;
+    
+    const currentHtml = content.innerHTML;
+    const newHtml = prompt('Enter custom HTML, embed code, or text:\n\n(Tip: You can use iframes, images, or any HTML)', currentHtml);
+    
+    if (newHtml !== null) {
+        content.innerHTML = newHtml;
+        saveCustomWidgets();
+    }
+}
+
+function removeCustomWidget(widgetId) {
+    if (!confirm('Remove this widget?')) return;
+    const widget = document.querySelector(`[data-module="${widgetId}"]`);
+    if (widget) {
+        widget.remove();
+        saveCustomWidgets();
+    }
+}
+
+async function saveCustomWidgets() {
+    const container = document.getElementById('custom-widgets-container');
+    if (!container) return;
+    const widgets = getCustomWidgetsList();
+    localStorage.setItem('customWidgets_' + (__authHeader || 'default'), JSON.stringify(widgets));
+    // Also persist to server
+    try {
+        await fetch('/api/dashboard/layout', {
+            method: 'POST',
+            credentials: 'include',
+            headers: { ...getAuthHeaders(), 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                custom_widgets: widgets
+            })
+        });
+    } catch (e) { console.warn('Failed to persist widgets to server:', e); }
+}
+
+async function loadCustomWidgets() {
+    // Try to load from server first
+    let widgets = null;
+    try {
+        const resp = await fetch('/api/dashboard/config', {
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        if (resp.ok) {
+            const data = await resp.json();
+            if (data.layout && data.layout.custom_widgets) {
+                widgets = data.layout.custom_widgets;
+            }
+        }
+    } catch (e) { console.warn('Failed to load widgets from server:', e); }
+    // Fallback to localStorage if missing
+    if (!widgets) {
+        const saved = localStorage.getItem('customWidgets_' + (__authHeader || 'default'));
+        if (saved) widgets = JSON.parse(saved);
+    }
+    restoreCustomWidgets(widgets);
+}
+
+function restoreCustomWidgets(widgets) {
+    if (!widgets) return;
+    const container = document.getElementById('custom-widgets-container');
+    if (!container) return;
+    container.innerHTML = '';
+    widgets.forEach(widget => {
+        const widgetNum = widget.id.replace('custom-widget-', '');
+        customWidgetCounter = Math.max(customWidgetCounter, parseInt(widgetNum) || 0);
+        const widgetHtml = `
+            <div class="dashboard-module" data-module="${widget.id}" draggable="true">
+                <div class="card">
+                    <div class="card-header d-flex align-items-center">
+                        <b>Custom Widget ${widgetNum}</b>
+                        <button class="btn btn-sm btn-outline-primary ms-2" onclick="editCustomWidget('${widget.id}')">
+                            <i class="bi bi-pencil"></i> Edit
+                        </button>
+                        <span class="hide-toggle" onclick="removeCustomWidget('${widget.id}')" title="Remove widget"><i class="bi bi-trash"></i></span>
+                        <span class="drag-handle ms-auto"><i class="bi bi-grip-vertical"></i></span>
+                    </div>
+                    <div class="card-body p-3 custom-widget-content" id="${widget.id}-content">
+                        ${widget.html}
+                    </div>
+                </div>
+            </div>
+        `;
+        container.insertAdjacentHTML('beforeend', widgetHtml);
+    });
+    initDragAndDrop();
+}
+
+function getCustomWidgetsList() {
+    const container = document.getElementById('custom-widgets-container');
+    if (!container) return [];
+    const widgets = [];
+    container.querySelectorAll('.dashboard-module').forEach(widget => {
+        const id = widget.dataset.module;
+        const content = document.getElementById(id + '-content');
+        if (content) {
+            widgets.push({ id, html: content.innerHTML });
+        }
+    });
+    return widgets;
+}
+
+function getHiddenModulesList() {
+    return Array.from(document.querySelectorAll('.dashboard-module.hidden')).map(el => el.dataset.module).filter(m => m);
+}
+// Resizable Table Columns
+function makeTableResizable(table) {
+    if (!table || table.classList.contains('resizable-init')) return;
+    table.classList.add('resizable-table', 'resizable-init');
+    
+    const thead = table.querySelector('thead');
+    if (!thead) return;
+    
+    const headers = thead.querySelectorAll('th');
+    headers.forEach((th, index) => {
+        // Skip last column
+        if (index === headers.length - 1) return;
+        
+        const handle = document.createElement('div');
+        handle.className = 'resize-handle';
+        th.style.position = 'relative';
+        th.appendChild(handle);
+        
+        let startX, startWidth, targetTh;
+        
+        handle.addEventListener('mousedown', function(e) {
+            e.preventDefault();
+            targetTh = this.parentElement;
+            startX = e.pageX;
+            startWidth = targetTh.offsetWidth;
+            
+            handle.classList.add('active');
+            document.body.style.cursor = 'col-resize';
+            document.body.style.userSelect = 'none';
+            
+            document.addEventListener('mousemove', onMouseMove);
+            document.addEventListener('mouseup', onMouseUp);
+        });
+        
+        function onMouseMove(e) {
+            if (!targetTh) return;
+            const diff = e.pageX - startX;
+            const newWidth = Math.max(50, startWidth + diff);
+            targetTh.style.width = newWidth + 'px';
+            targetTh.style.minWidth = newWidth + 'px';
+        }
+        
+        function onMouseUp() {
+            handle.classList.remove('active');
+            document.body.style.cursor = '';
+            document.body.style.userSelect = '';
+            document.removeEventListener('mousemove', onMouseMove);
+            document.removeEventListener('mouseup', onMouseUp);
+            targetTh = null;
+        }
+    });
+}
+
+// Make all tables resizable
+function initResizableTables() {
+    document.querySelectorAll('.dashboard-module table, .config-module table').forEach(table => {
+        makeTableResizable(table);
+    });
+}
+
+// Sync sidebar buttons with main buttons
+function syncAuthButtons() {
+    const loginBtn = document.getElementById('login-btn');
+    const logoutBtn = document.getElementById('logout-btn');
+    const configLink = document.getElementById('config-link');
+    
+    const loginBtnSidebar = document.getElementById('login-btn-sidebar');
+    const logoutBtnSidebar = document.getElementById('logout-btn-sidebar');
+    const configLinkSidebar = document.getElementById('config-link-sidebar');
+    
+    if (loginBtn && loginBtnSidebar) {
+        if (loginBtn.classList.contains('d-none')) {
+            loginBtnSidebar.classList.add('d-none');
+        } else {
+            loginBtnSidebar.classList.remove('d-none');
+        }
+    }
+    
+    if (logoutBtn && logoutBtnSidebar) {
+        if (logoutBtn.classList.contains('d-none')) {
+            logoutBtnSidebar.classList.add('d-none');
+        } else {
+            logoutBtnSidebar.classList.remove('d-none');
+        }
+    }
+    
+    if (configLink && configLinkSidebar) {
+        if (configLink.classList.contains('d-none')) {
+            configLinkSidebar.classList.add('d-none');
+        } else {
+            configLinkSidebar.classList.remove('d-none');
+        }
+    }
+    
+    // Ensure sidebar button onclicks are wired even if DOM updated
+    if (loginBtnSidebar) loginBtnSidebar.onclick = promptLogin;
+    if (logoutBtnSidebar) logoutBtnSidebar.onclick = logout;
+}
+    syncAuthButtons();
+
+// Hide/Show Module Functions
+function toggleHideModule(moduleId) {
+    const module = document.querySelector(`[data-module="${moduleId}"]`);
+    if (!module) return;
+    
+    module.classList.add('hidden');
+    saveHiddenModules();
+    updateShowHiddenButton();
+}
+
+function saveHiddenModules() {
+    const hiddenModules = Array.from(document.querySelectorAll('.dashboard-module.hidden'))
+        .map(el => el.dataset.module)
+        .filter(m => m);
+    localStorage.setItem('hiddenModules_' + (__authHeader || 'default'), JSON.stringify(hiddenModules));
+}
+
+function loadHiddenModules() {
+    const saved = localStorage.getItem('hiddenModules_' + (__authHeader || 'default'));
+    if (!saved) return;
+    
+    try {
+        const hiddenModules = JSON.parse(saved);
+        hiddenModules.forEach(moduleId => {
+            const module = document.querySelector(`[data-module="${moduleId}"]`);
+            if (module) module.classList.add('hidden');
+        });
+        updateShowHiddenButton();
+    } catch (e) {
+        console.error('Error loading hidden modules:', e);
+    }
+}
+
+function showHiddenModules() {
+    const hiddenModules = document.querySelectorAll('.dashboard-module.hidden');
+    if (hiddenModules.length === 0) {
+        alert('No hidden modules to show.');
+        return;
+    }
+    
+    const moduleNames = Array.from(hiddenModules).map(el => {
+        const title = el.querySelector('.card-header b');
+        return title ? title.textContent : el.dataset.module;
+    });
+    
+    const message = `Hidden modules:\n\n${moduleNames.map((n, i) => `${i + 1}. ${n}`).join('\n')}\n\nShow all hidden modules?`;
+    
+    if (confirm(message)) {
+        hiddenModules.forEach(module => module.classList.remove('hidden'));
+        saveHiddenModules();
+        updateShowHiddenButton();
+    }
+}
+
+function updateShowHiddenButton() {
+    const btn = document.getElementById('show-hidden-btn');
+    if (!btn) return;
+    
+    const hiddenCount = document.querySelectorAll('.dashboard-module.hidden').length;
+    if (hiddenCount > 0) {
+        btn.classList.remove('d-none');
+        btn.innerHTML = `<i class="bi bi-eye"></i> Show Hidden (${hiddenCount})`;
+    } else {
+        btn.classList.add('d-none');
+    }
+}
+
+// Public IP obfuscation
+let __publicIP = '•••.•••.•••.•••';
+let __publicIPRevealed = false;
+
+// Public IP Extraction from IPChicken
+function extractPublicIP() {
+    try {
+        const iframe = document.getElementById('ipchicken-frame');
+        const iframeDoc = iframe.contentDocument || iframe.contentWindow.document;
+        const bodyText = iframeDoc.body.innerText || iframeDoc.body.textContent;
+        
+        // IPChicken displays IP in format like "Current IP Address: X.X.X.X"
+        const ipMatch = bodyText.match(/\b(?:\d{1,3}\.){3}\d{1,3}\b/);
+        
+        if (ipMatch) {
+            __publicIP = ipMatch[0];
+        } else {
+            __publicIP = 'Unable to detect';
+        }
+    } catch (e) {
+        // CORS issue - fallback to API
+        fetch('https://api.ipify.org?format=json')
+            .then(response => response.json())
+            .then(data => {
+                __publicIP = data.ip;
+            })
+            .catch(() => {
+                __publicIP = 'Unavailable';
+            });
+    }
+}
+
+function revealPublicIP() {
+    if (!__publicIPRevealed && __publicIP) {
+        document.getElementById('public-ip-display').textContent = __publicIP;
+        __publicIPRevealed = true;
+    }
+}
+
+function hidePublicIP() {
+    if (__publicIPRevealed) {
+        document.getElementById('public-ip-display').textContent = '•••.•••.•••.•••';
+        __publicIPRevealed = false;
+    }
+}
+
+function copyPublicIP(el) {
+    if (__publicIP && __publicIP !== '•••.•••.•••.•••') {
+        copyToClipboard(__publicIP, el);
+    } else {
+        showNotification('Public IP not yet loaded', 'warning');
+    }
+}
+// Export public IP helpers to global for inline handlers and iframe load
+window.extractPublicIP = extractPublicIP;
+window.revealPublicIP = revealPublicIP;
+window.hidePublicIP = hidePublicIP;
+window.copyPublicIP = copyPublicIP;
+
+// Ensure these functions are globally accessible for inline event handlers
+window.revealPublicIP = revealPublicIP;
+window.hidePublicIP = hidePublicIP;
+window.copyPublicIP = copyPublicIP;
+
+// Generic copy to clipboard with visual feedback
+function copyToClipboard(text, el) {
+    navigator.clipboard.writeText(text).then(() => {
+        const original = el.textContent;
+        el.textContent = '✓ Copied!';
+        el.style.color = '#28a745';
+        setTimeout(() => {
+            el.textContent = original;
+            el.style.color = '';
+        }, 1500);
+        showNotification('Copied to clipboard', 'success');
+    }).catch(() => {
+        showNotification('Failed to copy', 'danger');
+    });
+}
+window.copyToClipboard = copyToClipboard;
+
+// Dev Reset to Setup
+function devResetToSetup() {
+    if (!confirm('⚠️ WARNING: This will DELETE all config, users, passwords, and state files.\n\nThis will force the setup wizard on next page load.\n\nAre you sure?')) {
+        return;
+    }
+    fetch('/dev/reset-to-setup', { method: 'POST' })
+        .then(r => r.json())
+        .then(data => {
+            if (data.success) {
+                showNotification('Reset complete! Reloading...', 'success');
+                setTimeout(() => { window.location.href = '/'; }, 1500);
+            } else {
+                showNotification('Reset failed: ' + (data.error || 'Unknown error'), 'danger');
+            }
+        })
+        .catch(err => {
+            showNotification('Error: ' + err.message, 'danger');
+        });
+}
+
+// --- Column width preferences for Custom Routes and Tag Routes ---
+function setColWidth(prefix, col, pct) {
+    const el = document.getElementById(`${prefix}-${col}-col`);
+    if (el) el.style.width = `${pct}%`;
+}
+
+function applyColumnPrefs(prefix, cols) {
+    cols.forEach(col => {
+        const key = `dor_${prefix}_${col}_width_pct`;
+        const val = localStorage.getItem(key);
+        if (val) {
+            const pct = parseInt(val, 10);
+            setColWidth(prefix, col, pct);
+            // Also update slider if present
+            const slider = document.getElementById(`${prefix}-${col}-width`);
+            if (slider) slider.value = pct;
+        }
+    });
+}
+
+function hookColumnSliders(prefix, cols) {
+    cols.forEach(col => {
+        const slider = document.getElementById(`${prefix}-${col}-width`);
+        if (!slider) return;
+        slider.addEventListener('input', (e) => {
+            const pct = parseInt(e.target.value, 10);
+            setColWidth(prefix, col, pct);
+        });
+    });
+}
+
+function saveCustomRoutesColumnPrefs() {
+    saveColumnPrefs('cr', ['ext','folder','action']);
+}
+
+function saveTagRoutesColumnPrefs() {
+    saveColumnPrefs('tr', ['tag','folder','action']);
+}
+
+// Organizer config rendered into the page by the dashboard view, so the initial
+// load skips the /api/organizer/config round trips. It ships as a JSON string:
+// JSON.parse is cheaper for the browser than parsing an object literal.
+let __organizerConfigSnapshot = (() => {
+    const raw = window.__organizerConfigJson;
+    try { return raw ? JSON.parse(raw) : null; } catch (e) { return null; }
+})();
+
+// Drop the embedded snapshot once the config has been changed from this page
+function invalidateOrganizerConfigSnapshot() {
+    __organizerConfigSnapshot = null;
+}
+
+async function fetchOrganizerConfig() {
+    if (__organizerConfigSnapshot) return __organizerConfigSnapshot;
+    const resp = await fetch('/api/organizer/config', {
+        credentials: 'include',
+        cache: 'no-store',
+        headers: getAuthHeaders()
+    });
+    return resp.ok ? resp.json() : null;
+}
+
+// Load organizer config and apply feature gating
+async function loadOrganizerConfig() {
+    try {
+        const cfg = await fetchOrganizerConfig();
+        if (!cfg) return;
+        const features = cfg.features || {};
+        __organizerFeatures = {
+            virustotal_enabled: features.virustotal_enabled !== false,
+            duplicates_enabled: features.duplicates_enabled !== false,
+            reports_enabled: features.reports_enabled !== false
+        };
+        __vtApiKey = cfg.vt_api_key || cfg.virustotal_api_key || '';
+        // Expose to window for template string evaluation
+        window.__organizerFeatures = __organizerFeatures;
+        window.__vtApiKey = __vtApiKey;
+        console.log('VT Config:', { enabled: __organizerFeatures.virustotal_enabled, hasKey: !!__vtApiKey });
+        applyFeatureGating();
+    } catch (e) {
+        console.warn('Failed to load organizer config:', e);
+    }
+}
+
+function applyFeatureGating() {
+    // Duplicates gating
+    const dupBanner = document.getElementById('duplicates-disabled-banner');
+    const dupBody = document.getElementById('duplicates-body');
+    if (dupBanner && dupBody) {
+        if (!__organizerFeatures.duplicates_enabled) {
+            dupBanner.classList.remove('d-none');
+            dupBody.style.display = 'none';
+            const b = document.getElementById('badge-duplicates-state');
+            if (b) { b.textContent = 'Off'; b.className = 'badge bg-secondary ms-2'; }
+        } else {
+            dupBanner.classList.add('d-none');
+            dupBody.style.display = '';
+            const b = document.getElementById('badge-duplicates-state');
+            if (b) { b.textContent = 'On'; b.className = 'badge bg-success ms-2'; }
+        }
+    }
+    // Reports/statistics gating
+    const repBanner = document.getElementById('reports-disabled-banner');
+    const statsBody = document.getElementById('statistics-body');
+    if (repBanner && statsBody) {
+        if (!__organizerFeatures.reports_enabled) {
+            repBanner.classList.remove('d-none');
+            statsBody.style.display = 'none';
+            const b = document.getElementById('badge-reports-state');
+            if (b) { b.textContent = 'Off'; b.className = 'badge bg-secondary ms-2'; }
+        } else {
+            repBanner.classList.add('d-none');
+            statsBody.style.display = '';
+            const b = document.getElementById('badge-reports-state');
+            if (b) { b.textContent = 'On'; b.className = 'badge bg-success ms-2'; }
+        }
+    }
+    // Virustotal gating in recent files (button visibility)
+    const vtButtons = document.querySelectorAll('[data-action="vt-scan"]');
+    vtButtons.forEach(btn => {
+        const enabled = __organizerFeatures.virustotal_enabled && !!__vtApiKey;
+        btn.style.display = enabled ? '' : 'none';
+        if (!enabled) btn.title = 'VirusTotal disabled or API key missing';
+    });
+}
+
+function applyRights() {
+    document.querySelectorAll('[data-right]').forEach(el => {
+        const need = el.getAttribute('data-right');
+        if (!__rights[need]) {
+            // Graceful message instead of hiding
+            const collapses = el.querySelectorAll('.collapse');
+            collapses.forEach(c => {
+                c.innerHTML = `<div class="ps-2 pe-2 pt-2 pb-1"><small class="text-muted">You lack rights (<code>${need}</code>) to view this section.</small></div>`;
+            });
+        }
+    });
+    // Service buttons gating
+    if (!__rights.manage_service) {
+        document.querySelectorAll('#collapseServiceStatus button').forEach(b => {
+            b.disabled = true;
+            b.title = 'Insufficient rights (manage_service)';
+        });
+    }
+    // Config save gating
+    if (!__rights.manage_config) {
+        const cfgBtn = document.querySelector('#config-form button.btn-primary');
+        if (cfgBtn) {
+            cfgBtn.disabled = true;
+            cfgBtn.title = 'Insufficient rights (manage_config)';
+        }
+        const setBtn = document.querySelector('#config-form-settings button.btn-primary');
+        if (setBtn) {
+            setBtn.disabled = true;
+            setBtn.title = 'Insufficient rights (manage_config)';
+        }
+    }
+    // Call page-specific rights application if available (e.g., for config page)
+    if (typeof applyConfigRights === 'function') {
+        applyConfigRights();
+    }
+}
+
+// Poll rights periodically to detect config changes
+async function pollRights() {
+    if (!__authHeader) return; // only when logged in
+    try {
+        const resp = await fetch('/auth/session', { headers: getAuthHeaders(), credentials: 'include' });
+        if (!resp.ok) return;
+        const data = await resp.json();
+        const newVersion = data.config_version || 0;
+        if (newVersion !== __configVersion) {
+            __configVersion = newVersion;
+            __rights = data.rights || {};
+            applyRights();
+            if (__rights.view_metrics) updateServiceStatus();
+            if (__rights.view_recent_files) refreshRecentFiles();
+        }
+    } catch (e) {
+        // Silent failures acceptable
+    }
+}
+
+// Service Control Functions
+async function startService() {
+    await serviceAction('start');
+}
+
+async function stopService() {
+    await serviceAction('stop');
+}
+
+async function restartService() {
+    await serviceAction('restart');
+}
+
+async function serviceAction(action) {
+    try {
+        if (!__authHeader) {
+            showNotification('Please login before performing service actions', 'warning');
+            return;
+        }
+        const response = await fetch(`/${action}`, {
+            method: 'POST',
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        const data = await response.json();
+        if (response.ok) {
+            if (response.status === 202) {
+                // Request accepted; the service transitions in the background
+                showNotification(data.message || `Service ${action} requested`, 'info');
+                refreshServiceStatusSoon([1000, 5000]);
+            } else {
+                const pastTense = { 'start': 'started', 'stop': 'stopped', 'restart': 'restarted' }[action] || `${action}ed`;
+                showNotification(`Service ${pastTense} successfully`, 'success');
+                refreshServiceStatusSoon([1000]);
+            }
+        } else {
+            showNotification(data.message || `Failed to ${action} service`, 'danger');
+        }
+    } catch (error) {
+        showNotification(`Error: ${error.message}`, 'danger');
+    }
+}
+
+// One /dashboard_state request serves every updater; callers arriving while
+// it is in flight share the same promise instead of issuing their own.
+let __dashboardStateRequest = null;
+
+function fetchDashboardState() {
+    if (!__dashboardStateRequest) {
+        __dashboardStateRequest = fetch('/dashboard_state', {
+            credentials: 'include',
+            headers: getAuthHeaders()
+        }).then((response) => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        }).finally(() => {
+            __dashboardStateRequest = null;
+        });
+    }
+    return __dashboardStateRequest;
+}
+
+// After a service action: the /events stream pushes the new status on its
+// own, so only schedule re-fetches when that stream isn't connected
+function refreshServiceStatusSoon(delays) {
+    if (__metricsEvents && __metricsEvents.readyState !== EventSource.CLOSED) return;
+    delays.forEach((ms) => setTimeout(updateServiceStatus, ms));
+}
+
+// Update service status
+async function updateServiceStatus() {
+    try {
+        applyServiceStatus(await fetchDashboardState());
+    } catch (error) {
+        console.error('Error updating service status:', error);
+    }
+}
+
+function applyServiceStatus(data) {
+    // Update both main and sidebar badges
+    const badge = document.getElementById('service-badge');
+    const badgeSidebar = document.getElementById('service-badge-sidebar');
+    const statusClass = data.service_status === 'Running' ? 'bg-success' : 'bg-danger';
+    
+    if (badge) {
+        badge.textContent = data.service_status;
+        badge.className = `badge ${statusClass} ms-1`;
+    }
+    
+    if (badgeSidebar) {
+        badgeSidebar.textContent = data.service_status;
+        badgeSidebar.className = `badge ${statusClass} ms-1`;
+        badgeSidebar.style.fontSize = '0.7rem';
+    }
+}
+
+// Fetch configured service name from server and display in header
+async function fetchServiceName() {
+    try {
+        const resp = await fetch('/service_name');
+        if (!resp.ok) return;
+        const data = await resp.json();
+        const name = data.service_name || '';
+        const el = document.getElementById('service-name');
+        const btn = document.getElementById('service-name-btn');
+        if (el) el.textContent = name;
+        if (btn) btn.style.display = name ? 'inline-block' : 'none';
+    } catch (err) {
+        console.error('Failed to fetch service name:', err);
+    }
+}
+
+function copyServiceName() {
+    const el = document.getElementById('service-name');
+    if (!el) return;
+    const name = el.textContent || '';
+    if (!name) return;
+    navigator.clipboard?.writeText(name).then(() => {
+        showNotification('Service name copied to clipboard', 'success');
+    }).catch(() => {
+        showNotification('Failed to copy service name', 'warning');
+    });
+}
+
+// Configuration Save
+async function saveConfiguration() {
+    const catForm = document.getElementById('config-form');
+    const customForm = document.getElementById('custom-routes-form');
+    const catData = new FormData(catForm);
+    const customData = new FormData(customForm);
+    
+    // Build routes dict from category form
+    const routes = {};
+    let i = 1;
+    let foundAny = true;
+    while (foundAny) {
+        const folder = catData.get(`folder_${i}`);
+        const exts = catData.get(`exts_${i}`);
+        if (folder !== null && exts !== null) {
+            const list = (exts || '').split(',').map(s => s.trim()).filter(Boolean);
+            if (folder.trim()) routes[folder.trim()] = list;
+            i++;
+        } else {
+            foundAny = false;
+        }
+    }
+
+    // Build custom_routes dict from custom form
+    const custom_routes = {};
+    if (customForm) {
+        let j = 1;
+        let foundAny = true;
+        while (foundAny) {
+            const ext = customData.get(`ext_${j}`);
+            const path = customData.get(`path_${j}`);
+            if (ext !== null || path !== null) {
+                if (ext && path && ext.trim() && path.trim()) {
+                    custom_routes[ext.trim()] = path.trim();
+                }
+                j++;
+            } else {
+                foundAny = false;
+            }
+        }
+    }
+
+    // Build tag_routes dict from tag form
+    const tagForm = document.getElementById('tag-routes-form');
+    const tag_routes = {};
+    if (tagForm) {
+        const tagData = new FormData(tagForm);
+        let k = 1;
+        let foundAny = true;
+        while (foundAny) {
+            const tag = tagData.get(`tag_${k}`);
+            const tagpath = tagData.get(`tagpath_${k}`);
+            if (tag !== null || tagpath !== null) {
+                if (tag && tagpath && tag.trim() && tagpath.trim()) {
+                    tag_routes[tag.trim()] = tagpath.trim();
+                }
+                k++;
+            } else {
+                foundAny = false;
+            }
+        }
+    }
+
+    // Prepare JSON payload
+    const payload = {
+        routes,
+        custom_routes,
+        tag_routes
+    };
+
+    if (!__authHeader) {
+        showNotification('Please login before saving configuration', 'warning');
+        return;
+    }
+    const saved = await scheduleConfigSave(payload, {
+        question: 'Configuration saved! Would you like to restart the Organizer service now to apply the changes?',
+        success: 'Service restart requested. File organization will resume momentarily.',
+        reminder: 'Remember to restart the service manually for changes to take effect.'
+    });
+    if (saved) {
+        // Reload the configuration to show the saved data
+        await initializeCustomRoutes();
+    }
+}
+
+async function saveSettings() {
+    const form = document.getElementById('config-form-settings');
+    const formData = new FormData(form);
+
+    if (!__authHeader) {
+        showNotification('Please login before saving settings', 'warning');
+        return;
+    }
+    // Blank fields keep their current values, as with the old form post
+    const settings = {};
+    const watchFolder = (formData.get('watch_folder') || '').trim();
+    if (watchFolder) settings.watch_folder = watchFolder;
+    const logsDir = (formData.get('logs_dir') || '').trim();
+    if (logsDir) settings.logs_dir = logsDir;
+    const mem = (formData.get('memory_threshold') || '').trim();
+    if (mem) settings.memory_threshold_mb = mem;
+    const cpu = (formData.get('cpu_threshold') || '').trim();
+    if (cpu) settings.cpu_threshold_percent = cpu;
+
+    await scheduleConfigSave(settings, watchFolder ? {
+        question: 'Watch folder setting saved! Would you like to restart the Organizer service now to apply the changes?',
+        success: 'Service restart requested. Now monitoring: ' + watchFolder,
+        reminder: 'Remember to restart the service manually for watch folder changes to take effect.'
+    } : null);
+}
+
+// saveConfiguration() and saveSettings() are often triggered back to back;
+// their fields are merged and sent to /api/update as one JSON POST, so the
+// config file is written once and the restart question is asked once.
+const CONFIG_SAVE_DELAY_MS = 250;
+let __pendingConfigSave = null;
+
+function scheduleConfigSave(fields, restartPrompt) {
+    if (!__pendingConfigSave) {
+        __pendingConfigSave = { fields: {}, prompts: [], waiters: [] };
+        setTimeout(flushConfigSave, CONFIG_SAVE_DELAY_MS);
+    }
+    Object.assign(__pendingConfigSave.fields, fields);
+    if (restartPrompt) __pendingConfigSave.prompts.push(restartPrompt);
+    return new Promise((resolve) => __pendingConfigSave.waiters.push(resolve));
+}
+
+async function flushConfigSave() {
+    const batch = __pendingConfigSave;
+    __pendingConfigSave = null;
+    let saved = false;
+    try {
+        const response = await fetch('/api/update', {
+            method: 'POST',
+            body: JSON.stringify(batch.fields),
+            credentials: 'include',
+            headers: { ...getAuthHeaders(), 'Content-Type': 'application/json' }
+        });
+        if (response.ok) {
+            const result = await response.json();
+            saved = true;
+            invalidateOrganizerConfigSnapshot();
+            showNotification(result.message || 'Configuration saved successfully', 'success');
+        } else {
+            const t = await response.text();
+            showNotification('Failed to save configuration: ' + t.substring(0,200), 'danger');
+        }
+    } catch (error) {
+        showNotification(`Error: ${error.message}`, 'danger');
+    }
+    batch.waiters.forEach((resolve) => resolve(saved));
+    if (saved && batch.prompts.length) {
+        await promptServiceRestart(batch.prompts[0]);
+    }
+}
+
+// Ask whether to restart the Organizer service so saved changes take effect
+async function promptServiceRestart(prompt) {
+    if (!confirm(prompt.question)) {
+        showNotification(prompt.reminder, 'info');
+        return;
+    }
+    try {
+        const restartResponse = await fetch('/restart', {
+            method: 'POST',
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        if (restartResponse.ok) {
+            showNotification(prompt.success, 'success');
+        } else {
+            showNotification('Failed to restart service. Please restart manually.', 'warning');
+        }
+    } catch (err) {
+        showNotification('Error restarting service: ' + err.message, 'warning');
+    }
+}
+
+// UNC Credentials Management Functions
+let __uncCurrentPath = '';
+
+function showUNCCredentialsModal() {
+    const watchFolderInput = document.getElementById('watch_folder');
+    const path = watchFolderInput.value.trim();
+    
+    if (!path) {
+        showNotification('Please enter a watch folder path first', 'warning');
+        return;
+    }
+    
+    __uncCurrentPath = path;
+    
+    // Validate UNC syntax
+    validateUNCSyntax(path);
+}
+
+async function validateUNCSyntax(path) {
+    try {
+        const response = await fetch('/api/unc/validate-syntax', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                ...getAuthHeaders()
+            },
+            credentials: 'include',
+            body: JSON.stringify({ unc_path: path })
+        });
+        
+        if (response.ok) {
+            const result = await response.json();
+            if (result.valid) {
+                // Load existing credentials if any
+                loadUNCCredentials(path);
+            } else {
+                clearUNCFields();
+                showUNCError(result.message || 'Invalid UNC path format');
+            }
+        } else {
+            const error = await response.json();
+            showUNCError(error.error || 'Failed to validate UNC path');
+        }
+    } catch (error) {
+        showUNCError(`Validation error: ${error.message}`);
+    }
+}
+
+async function loadUNCCredentials(path) {
+    try {
+        const response = await fetch(`/api/unc/get-credentials/${encodeURIComponent(path)}`, {
+            headers: getAuthHeaders(),
+            credentials: 'include'
+        });
+        
+        if (response.ok) {
+            const result = await response.json();
+            const creds = result.credentials || {};
+            
+            document.getElementById('unc-path-display').value = path;
+            document.getElementById('unc-username').value = creds.username || '';
+            document.getElementById('unc-password').value = ''; // Never pre-fill password for security
+            document.getElementById('unc-domain').value = creds.domain || '';
+            document.getElementById('unc-hostname').value = creds.hostname || '';
+            document.getElementById('unc-auth-type').value = creds.auth_type || 'windows';
+            
+            updateUNCAuthFields();
+            clearUNCMessage();
+            
+            const modal = new bootstrap.Modal(document.getElementById('uncCredsModal'));
+            modal.show();
+        } else {
+            // No existing credentials, initialize fresh form
+            document.getElementById('unc-path-display').value = path;
+            document.getElementById('unc-username').value = '';
+            document.getElementById('unc-password').value = '';
+            document.getElementById('unc-domain').value = '';
+            document.getElementById('unc-hostname').value = '';
+            document.getElementById('unc-auth-type').value = 'windows';
+            
+            updateUNCAuthFields();
+            clearUNCMessage();
+            
+            const modal = new bootstrap.Modal(document.getElementById('uncCredsModal'));
+            modal.show();
+        }
+    } catch (error) {
+        showUNCError(`Error loading credentials: ${error.message}`);
+    }
+}
+
+function updateUNCAuthFields() {
+    const authType = document.getElementById('unc-auth-type').value;
+    const windowsFields = document.getElementById('windows-auth-fields');
+    
+    if (authType === 'windows') {
+        windowsFields.style.display = 'block';
+    } else {
+        windowsFields.style.display = 'none';
+    }
+}
+
+async function testUNCCredentials() {
+    const path = document.getElementById('unc-path-display').value;
+    const username = document.getElementById('unc-username').value;
+    const password = document.getElementById('unc-password').value;
+    const domain = document.getElementById('unc-domain').value;
+    const hostname = document.getElementById('unc-hostname').value;
+    const authType = document.getElementById('unc-auth-type').value;
+    
+    if (!path || !username || !password) {
+        showUNCError('Username and password are required');
+        return;
+    }
+    
+    const testBtn = document.getElementById('btn-test-unc');
+    testBtn.disabled = true;
+    testBtn.innerHTML = '<span class="spinner-border spinner-border-sm me-2"></span>Testing...';
+    
+    try {
+        const response = await fetch('/api/unc/test-credentials', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                ...getAuthHeaders()
+            },
+            credentials: 'include',
+            body: JSON.stringify({
+                unc_path: path,
+                username: username,
+                password: password,
+                domain: domain,
+                hostname: hostname,
+                auth_type: authType
+            })
+        });
+        
+        if (response.ok) {
+            const result = await response.json();
+            showUNCMessage('✓ Connection successful! You can now save these credentials.', 'success');
+        } else {
+            const error = await response.json();
+            showUNCError(error.error || 'Connection failed');
+        }
+    } catch (error) {
+        showUNCError(`Test error: ${error.message}`);
+    } finally {
+        testBtn.disabled = false;
+        testBtn.innerHTML = '<i class="bi bi-plug"></i> Test Connection';
+    }
+}
+
+async function saveUNCCredentials() {
+    const path = document.getElementById('unc-path-display').value;
+    const username = document.getElementById('unc-username').value;
+    const password = document.getElementById('unc-password').value;
+    const domain = document.getElementById('unc-domain').value;
+    const hostname = document.getElementById('unc-hostname').value;
+    const authType = document.getElementById('unc-auth-type').value;
+    
+    if (!path || !username || !password) {
+        showUNCError('Username and password are required');
+        return;
+    }
+    
+    const saveBtn = document.getElementById('btn-save-unc');
+    saveBtn.disabled = true;
+    saveBtn.innerHTML = '<span class="spinner-border spinner-border-sm me-2"></span>Saving...';
+    
+    try {
+        const response = await fetch('/api/unc/save-credentials', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                ...getAuthHeaders()
+            },
+            credentials: 'include',
+            body: JSON.stringify({
+                unc_path: path,
+                username: username,
+                password: password,
+                domain: domain || undefined,
+                hostname: hostname || undefined,
+                auth_type: authType
+            })
+        });
+        
+        if (response.ok) {
+            const result = await response.json();
+            showUNCMessage('✓ Credentials saved successfully!', 'success');
+            setTimeout(() => {
+                bootstrap.Modal.getInstance(document.getElementById('uncCredsModal')).hide();
+                showNotification(`Credentials saved for ${path}`, 'success');
+            }, 1000);
+        } else {
+            const error = await response.json();
+            showUNCError(error.error || 'Failed to save credentials');
+        }
+    } catch (error) {
+        showUNCError(`Save error: ${error.message}`);
+    } finally {
+        saveBtn.disabled = false;
+        saveBtn.innerHTML = '<i class="bi bi-save"></i> Save Credentials';
+    }
+}
+
+function clearUNCFields() {
+    document.getElementById('unc-path-display').value = '';
+    document.getElementById('unc-username').value = '';
+    document.getElementById('unc-password').value = '';
+    document.getElementById('unc-domain').value = '';
+    document.getElementById('unc-hostname').value = '';
+    document.getElementById('unc-auth-type').value = 'windows';
+}
+
+function clearUNCMessage() {
+    document.getElementById('unc-message').style.display = 'none';
+    document.getElementById('unc-message').innerHTML = '';
+    document.getElementById('unc-error').style.display = 'none';
+    document.getElementById('unc-error').innerHTML = '';
+}
+
+function showUNCMessage(msg, type) {
+    const msgDiv = document.getElementById('unc-message');
+    msgDiv.className = 'alert alert-sm py-1 px-2 mb-2';
+    msgDiv.className += type === 'success' ? ' alert-success' : ' alert-info';
+    msgDiv.innerHTML = msg;
+    msgDiv.style.display = 'block';
+    document.getElementById('unc-error').style.display = 'none';
+}
+
+function showUNCError(msg) {
+    const errDiv = document.getElementById('unc-error');
+    errDiv.innerHTML = '<i class="bi bi-exclamation-circle"></i> ' + msg;
+    errDiv.style.display = 'block';
+    document.getElementById('unc-message').style.display = 'none';
+}
+
+// Detect UNC path in watch folder input and show credentials button
+document.addEventListener('DOMContentLoaded', function() {
+    const watchFolderInput = document.getElementById('watch_folder');
+    if (watchFolderInput) {
+        watchFolderInput.addEventListener('blur', function() {
+            const path = this.value.trim();
+            const uncWarning = document.getElementById('unc-warning');
+            const uncCredsBtn = document.getElementById('btn-unc-creds');
+            
+            if (path && path.startsWith('\\\\')) {
+                uncWarning.style.display = 'block';
+                uncCredsBtn.style.display = 'inline-block';
+            } else {
+                uncWarning.style.display = 'none';
+                uncCredsBtn.style.display = 'none';
+            }
+        });
+    }
+});
+
+function deleteRow(btn) {
+    btn.closest('tr').remove();
+}
+
+// Add new category row to File Categories table
+function addCategoryRow() {
+    const tbody = document.querySelector('#config-form tbody');
+    const rowCount = tbody.querySelectorAll('tr').length + 1;
+    const newRow = document.createElement('tr');
+    newRow.innerHTML = `
+        <td><input class="form-control form-control-sm" type="text" name="folder_${rowCount}" placeholder="Folder name"></td>
+        <td><input class="form-control form-control-sm" type="text" name="exts_${rowCount}" placeholder="ext1, ext2, ext3"></td>
+        <td><button class="btn btn-danger btn-sm" type="button" onclick="deleteRow(this)">Delete</button></td>
+    `;
+    tbody.appendChild(newRow);
+}
+
+// Add new custom route row to Custom Routes table
+function addCustomRouteRow() {
+    const tbody = document.getElementById('custom-routes-tbody');
+    const rowCount = tbody.querySelectorAll('tr').length + 1;
+    const newRow = document.createElement('tr');
+    newRow.innerHTML = `
+        <td><input class="form-control form-control-sm" type="text" name="ext_${rowCount}" placeholder="mp4"></td>
+        <td><input class="form-control form-control-sm" type="text" name="path_${rowCount}" placeholder="C:/Media/Videos"></td>
+        <td><button class="btn btn-danger btn-sm" type="button" onclick="deleteRow(this)">Delete</button></td>
+    `;
+    tbody.appendChild(newRow);
+}
+
+// Add new tag route row to Tag Routes table
+function addTagRouteRow() {
+    const tbody = document.getElementById('tag-routes-tbody');
+    const rowCount = tbody.querySelectorAll('tr').length + 1;
+    const newRow = document.createElement('tr');
+    newRow.innerHTML = `
+        <td><input class="form-control form-control-sm" type="text" name="tag_${rowCount}" placeholder="invoice"></td>
+        <td><input class="form-control form-control-sm" type="text" name="tagpath_${rowCount}" placeholder="C:/Documents/Invoices"></td>
+        <td><button class="btn btn-danger btn-sm" type="button" onclick="deleteRow(this)">Delete</button></td>
+    `;
+    tbody.appendChild(newRow);
+}
+
+// Load custom routes from config on page load
+function loadCustomRoutes(customRoutes) {
+    const tbody = document.getElementById('custom-routes-tbody');
+    if (!tbody) return; // Not on dashboard page
+    
+    tbody.innerHTML = ''; // Clear existing rows
+    
+    if (customRoutes && Object.keys(customRoutes).length > 0) {
+        let index = 1;
+        for (const [ext, path] of Object.entries(customRoutes)) {
+            const row = document.createElement('tr');
+            row.innerHTML = `
+                <td><input class="form-control form-control-sm" type="text" name="ext_${index}" value="${ext}"></td>
+                <td><input class="form-control form-control-sm" type="text" name="path_${index}" value="${path}"></td>
+                <td><button class="btn btn-danger btn-sm" type="button" onclick="deleteRow(this)">Delete</button></td>
+            `;
+            tbody.appendChild(row);
+            index++;
+        }
+    }
+}
+
+// Initialize custom routes table on page load
+async function loadFileCategories(routes) {
+    const tbody = document.querySelector('#config-form tbody');
+    if (!tbody) return;
+    
+    // Clear existing rows
+    tbody.innerHTML = '';
+    
+    // Populate rows from config
+    let rowNum = 1;
+    for (const [folder, extensions] of Object.entries(routes)) {
+        const row = document.createElement('tr');
+        row.innerHTML = `
+            <td><input class="form-control form-control-sm" type="text" name="folder_${rowNum}" value="${folder}"></td>
+            <td><input class="form-control form-control-sm" type="text" name="exts_${rowNum}" value="${extensions.join(', ')}"></td>
+            <td><button class="btn btn-danger btn-sm" type="button" onclick="deleteRow(this)">Delete</button></td>
+        `;
+        tbody.appendChild(row);
+        rowNum++;
+    }
+}
+
+async function initializeCustomRoutes() {
+    try {
+        const config = await fetchOrganizerConfig();
+        
+        if (config) {
+            // Load file categories
+            if (config.routes && Object.keys(config.routes).length > 0) {
+                loadFileCategories(config.routes);
+            }
+            
+            // Load custom routes
+            if (config.custom_routes && Object.keys(config.custom_routes).length > 0) {
+                loadCustomRoutes(config.custom_routes);
+            }
+            
+            // Load tag routes
+            if (config.tag_routes && Object.keys(config.tag_routes).length > 0) {
+                loadTagRoutes(config.tag_routes);
+            }
+        }
+    } catch (error) {
+        console.log('Could not load configuration:', error);
+    }
+}
+
+// Load tag routes from config on page load
+function loadTagRoutes(tagRoutes) {
+    const tbody = document.getElementById('tag-routes-tbody');
+    if (!tbody) return; // Not on dashboard page
+    
+    tbody.innerHTML = ''; // Clear existing rows
+    
+    if (tagRoutes && Object.keys(tagRoutes).length > 0) {
+        let index = 1;
+        for (const [tag, path] of Object.entries(tagRoutes)) {
+            const row = document.createElement('tr');
+            row.innerHTML = `
+                <td><input class="form-control form-control-sm" type="text" name="tag_${index}" value="${tag}"></td>
+                <td><input class="form-control form-control-sm" type="text" name="tagpath_${index}" value="${path}"></td>
+                <td><button class="btn btn-danger btn-sm" type="button" onclick="deleteRow(this)">Delete</button></td>
+            `;
+            tbody.appendChild(row);
+            index++;
+        }
+    }
+}
+
+// Log streaming
+function streamLog(which) {
+    const logElement = document.getElementById(`${which}-log`);
+    // Only stream if the log element exists (config page only)
+    if (!logElement) {
+        console.log(`Log element ${which}-log not found, skipping stream`);
+        return;
+    }
+    
+    const eventSource = new EventSource(`/stream/${which}`);
+    eventSource.onmessage = function(event) {
+        if (event.data && logElement) {
+            logElement.textContent += event.data + '\n';
+            logElement.scrollTop = logElement.scrollHeight;
+        }
+    };
+    eventSource.onerror = function() {
+        eventSource.close();
+        // Only retry if element still exists
+        if (document.getElementById(`${which}-log`)) {
+            setTimeout(() => streamLog(which), 5000);
+        }
+    };
+}
+
+// Clear log
+async function clearLog(which) {
+    try {
+        const response = await fetch(`/clear_log/${which}`, {
+            method: 'POST',
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        if (response.ok) {
+            const logElement = document.getElementById(`${which}-log`);
+            logElement.textContent = '';
+            showNotification(`${which.toUpperCase()} log cleared`, 'success');
+        } else {
+            showNotification(`Failed to clear ${which} log`, 'danger');
+        }
+    } catch (error) {
+        showNotification(`Error: ${error.message}`, 'danger');
+    }
+}
+
+// Show notification in fixed container
+function showNotification(message, type) {
+    const alertDiv = document.createElement('div');
+    alertDiv.className = `alert alert-${type} alert-dismissible fade show`;
+    alertDiv.innerHTML = `
+        ${message}
+        <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
+    `;
+    
+    const container = document.getElementById('notification-container');
+    if (container) {
+        container.appendChild(alertDiv);
+    } else {
+        // Fallback for pages without notification container
+        const mainContainer = document.querySelector('.container');
+        mainContainer.insertBefore(alertDiv, mainContainer.firstChild);
+    }
+    
+    setTimeout(() => {
+        alertDiv.remove();
+    }, 5000);
+
+    // Persist to Notification Center - ONLY for errors and warnings, skip success/info
+    if (type === 'danger' || type === 'warning') {
+        try {
+            fetch('/api/notifications', {
+                method: 'POST',
+                credentials: 'include',
+                headers: { 
+                    ...getAuthHeaders(),
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ message, type })
+            }).then(() => {
+                // Refresh notification badge/count
+                if (typeof loadNotificationCenter === 'function') {
+                    loadNotificationCenter();
+                }
+            }).catch(() => {});
+        } catch(e) {}
+    }
+}
+
+// Recent Files Functions
+async function refreshRecentFiles() {
+    const btn = document.getElementById('btn-recent-refresh');
+    const tbody = document.getElementById('recent-files-tbody');
+    const originalHtml = btn ? btn.innerHTML : '';
+    
+    try {
+        if (btn) {
+            btn.disabled = true;
+            btn.innerHTML = '<span class="spinner-border spinner-border-sm me-1"></span>Loading...';
+        }
+        
+        // Ensure VT config is loaded before displaying files
+        await loadOrganizerConfig();
+        
+        const response = await fetch('/api/recent_files', {
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        
+        if (!response.ok) {
+            throw new Error('Failed to fetch recent files');
+        }
+        
+        const files = await response.json();
+        displayRecentFiles(files);
+    } catch (error) {
+        console.error('Error fetching recent files:', error);
+        if (tbody) {
+            tbody.innerHTML = '<tr><td colspan="5" class="text-center text-danger">Error loading recent files</td></tr>';
+        }
+        showNotification('Failed to refresh recent files: ' + error.message, 'danger');
+    } finally {
+        if (btn) {
+            btn.disabled = false;
+            btn.innerHTML = originalHtml || '<i class="bi bi-arrow-clockwise"></i> Refresh';
+        }
+    }
+}
+
+function displayRecentFiles(files) {
+    const tbody = document.getElementById('recent-files-tbody');
+    if (!tbody) return; // not present on this page
+    
+    if (!files || files.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="5" class="text-center text-muted">No recent file movements</td></tr>';
+        return;
+    }
+    
+    tbody.innerHTML = files.map(file => {
+        const timestamp = new Date(file.timestamp);
+        const timeStr = timestamp.toLocaleString();
+        const categoryBadge = getCategoryBadge(file.category);
+        
+        const fileIndex = files.indexOf(file);
+        return `
+            <tr>
+                <td><small>${timeStr}</small></td>
+                <td>
+                    <small><strong>${escapeHtml(file.filename)}</strong></small>
+                    <br><small class="text-muted">${escapeHtml(file.destination_path)}</small>
+                </td>
+                <td>${categoryBadge}</td>
+                <td>
+                    <div class="d-flex flex-wrap gap-1" style="min-width: fit-content;">
+                        <button class="btn btn-sm btn-outline-primary" onclick='openFile(${JSON.stringify(file.destination_path)}, "open")' title="Open file">
+                            <i class="bi bi-folder2-open"></i> Open
+                        </button>
+                        <button class="btn btn-sm btn-outline-secondary" onclick='openFile(${JSON.stringify(file.destination_path)}, "reveal")' title="Show in folder">
+                            <i class="bi bi-folder"></i> Show
+                        </button>
+                        ${(window.__organizerFeatures?.virustotal_enabled && window.__vtApiKey) ? `<button class="btn btn-sm btn-outline-info" onclick='scanVirusTotal(${JSON.stringify(file.destination_path)}, ${JSON.stringify(file.filename)})' title="Scan with VirusTotal"><i class="bi bi-shield-check"></i> VT</button>` : ''}
+                        <button class="btn btn-sm btn-outline-danger" onclick='removeRecentFile(${fileIndex})' title="Remove from recent">
+                            <i class="bi bi-x-lg"></i>
+                        </button>
+                    </div>
+                </td>
+            </tr>
+        `;
+    }).join('');
+}
+
+function getCategoryBadge(category) {
+    const categories = {
+        'Images': { class: 'bg-success', icon: 'bi-image' },
+        'Videos': { class: 'bg-primary', icon: 'bi-camera-video' },
+        'Music': { class: 'bg-info', icon: 'bi-music-note-beamed' },
+        'Documents': { class: 'bg-warning text-dark', icon: 'bi-file-text' },
+        'Archives': { class: 'bg-secondary', icon: 'bi-file-zip' },
+        'Executables': { class: 'bg-danger', icon: 'bi-file-binary' },
+        'Scripts': { class: 'bg-purple text-light', icon: 'bi-code-slash' },
+        'Fonts': { class: 'bg-indigo text-light', icon: 'bi-fonts' },
+        'Shortcuts': { class: 'bg-cyan text-dark', icon: 'bi-link-45deg' },
+        'Logs': { class: 'bg-dark text-light', icon: 'bi-file-earmark-text' },
+        'Other': { class: 'bg-secondary', icon: 'bi-question-circle' }
+    };
+    const categoryData = categories[category] || { class: 'bg-secondary', icon: 'bi-file' };
+    return `<span class="badge ${categoryData.class}"><i class="bi ${categoryData.icon}"></i> ${escapeHtml(category)}</span>`;
+}
+
+async function openFile(filePath, action = 'open') {
+    try {
+        const response = await fetch('/api/open_file', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                ...getAuthHeaders()
+            },
+            credentials: 'include',
+            body: JSON.stringify({
+                file_path: filePath,
+                action: action
+            })
+        });
+        
+        const data = await response.json();
+        
+        if (response.ok) {
+            showNotification(data.message || `File ${action === 'reveal' ? 'revealed' : 'opened'}`, 'success');
+        } else {
+            showNotification(data.error || 'Failed to open file', 'danger');
+        }
+    } catch (error) {
+        showNotification(`Error: ${error.message}`, 'danger');
+    }
+}
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+async function removeRecentFile(index) {
+    if (!confirm('Remove this file from recent files list?')) {
+        return;
+    }
+    
+    try {
+        const response = await fetch(`/api/recent_files/${index}`, {
+            method: 'DELETE',
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        
+        if (response.ok) {
+            showNotification('File removed from recent files', 'success');
+            refreshRecentFiles();
+        } else {
+            const data = await response.json();
+            showNotification(data.error || 'Failed to remove file', 'danger');
+        }
+    } catch (error) {
+        showNotification(`Error: ${error.message}`, 'danger');
+    }
+}
+
+// Developer Mode Management
+async function loadDeveloperMode() {
+    try {
+        const config = await fetchOrganizerConfig();
+        
+        if (config) {
+            const features = config.features || {};
+            const developerMode = features.developer_mode === true;
+            
+            // Apply developer mode class to body
+            if (developerMode) {
+                document.body.classList.add('developer-mode');
+            } else {
+                document.body.classList.remove('developer-mode');
+            }
+        }
+    } catch (error) {
+        console.log('Could not load developer mode setting:', error);
+    }
+}
+
+// Sidebar Updates
+let sidebarStatsChart = null;
+
+async function updateSidebarMetrics() {
+    // Only run if sidebar elements exist (not on config page)
+    if (!document.getElementById('sidebar-ram-bar')) return;
+    
+    try {
+        const data = await fetchDashboardState();
+        applySidebarMetrics(data);
+        applyServiceStatus(data);
+    } catch (error) {
+        console.log('Could not update sidebar metrics:', error);
+    }
+}
+
+// Push metrics over /events (Server-Sent Events) instead of polling /metrics.
+// Falls back to the 5s poll if EventSource is unavailable or the stream drops.
+let __metricsEvents = null;
+let __metricsPollTimer = null;
+
+function startMetricsPolling() {
+    if (__metricsPollTimer) return;
+    updateSidebarMetrics();
+    __metricsPollTimer = setInterval(updateSidebarMetrics, 5000);
+}
+
+function startMetricsEvents() {
+    if (!window.EventSource) {
+        startMetricsPolling();
+        return;
+    }
+    __metricsEvents = new EventSource('/events');
+    __metricsEvents.addEventListener('metrics', (e) => {
+        try {
+            const data = JSON.parse(e.data);
+            applySidebarMetrics(data);
+            applyServiceStatus(data);
+        } catch (err) {
+            console.log('Bad metrics event:', err);
+        }
+    });
+    __metricsEvents.onerror = () => {
+        if (__metricsEvents) {
+            __metricsEvents.close();
+            __metricsEvents = null;
+        }
+        startMetricsPolling();
+    };
+}
+
+function applySidebarMetrics(data) {
+    // Update RAM
+    const ramBar = document.getElementById('sidebar-ram-bar');
+    const ramText = document.getElementById('sidebar-ram-text');
+    if (ramBar && data.ram_percent !== undefined) {
+        ramBar.style.width = data.ram_percent + '%';
+        ramBar.textContent = data.ram_percent + '%';
+        ramBar.className = 'progress-bar ' + 
+            (data.ram_percent < 50 ? 'bg-success' : 
+             data.ram_percent < 80 ? 'bg-warning' : 'bg-danger');
+    }
+    if (ramText && data.total_memory_mb && data.total_memory_gb) {
+        ramText.textContent = `${data.total_memory_mb}/${data.total_memory_gb}GB`;
+    }
+    
+    // Update CPU
+    const cpuBar = document.getElementById('sidebar-cpu-bar');
+    const cpuText = document.getElementById('sidebar-cpu-text');
+    if (cpuBar && data.total_cpu_percent !== undefined) {
+        cpuBar.style.width = data.total_cpu_percent + '%';
+        cpuBar.textContent = data.total_cpu_percent + '%';
+        cpuBar.className = 'progress-bar ' + 
+            (data.total_cpu_percent < 50 ? 'bg-success' : 
+             data.total_cpu_percent < 80 ? 'bg-warning' : 'bg-danger');
+    }
+    if (cpuText && data.total_cpu_percent !== undefined) {
+        cpuText.textContent = `System: ${data.total_cpu_percent}%`;
+    }
+    
+    // Update task manager
+    if (data.top_processes && data.top_processes.length > 0) {
+        const tbody = document.getElementById('sidebar-tasks-body');
+        if (tbody) {
+            tbody.innerHTML = data.top_processes.slice(0, 3).map(proc => `
+                <tr>
+                    <td style="padding: 0.15rem 0.25rem;">${proc.name.substring(0, 15)}</td>
+                    <td style="padding: 0.15rem 0.25rem;">${proc.cpu.toFixed(1)}</td>
+                    <td style="padding: 0.15rem 0.25rem;">${proc.mem}M</td>
+                </tr>
+            `).join('');
+        }
+    }
+}
+
+async function updateSidebarStats() {
+    // Only run if sidebar elements exist (not on config page)
+    if (!document.getElementById('sidebar-stat-total')) return;
+    
+    try {
+        const response = await fetch('/api/statistics/overview', {
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        
+        if (response.ok) {
+            const data = await response.json();
+            
+            const totalEl = document.getElementById('sidebar-stat-total');
+            const todayEl = document.getElementById('sidebar-stat-today');
+            
+            if (totalEl) totalEl.textContent = data.total_files || 0;
+            if (todayEl) todayEl.textContent = data.today_count || 0;
+            
+            // Update mini chart
+            const chartCanvas = document.getElementById('sidebar-stats-chart');
+            if (chartCanvas) {
+                const categoryRes = await fetch('/api/statistics/by-category', {
+                    credentials: 'include',
+                    headers: getAuthHeaders()
+                });
+                
+                if (categoryRes.ok) {
+                    const categoryData = await categoryRes.json();
+                    
+                    if (sidebarStatsChart) {
+                        sidebarStatsChart.destroy();
+                    }
+                    
+                    sidebarStatsChart = new Chart(chartCanvas, {
+                        type: 'doughnut',
+                        data: {
+                            labels: categoryData.labels || [],
+                            datasets: [{
+                                data: categoryData.values || [],
+                                backgroundColor: [
+                                    '#FF6384', '#36A2EB', '#FFCE56', '#4BC0C0', 
+                                    '#9966FF', '#FF9F40', '#FF6384', '#C9CBCF'
+                                ]
+                            }]
+                        },
+                        options: {
+                            responsive: true,
+                            maintainAspectRatio: true,
+                            plugins: {
+                                legend: {
+                                    display: false
+                                }
+                            }
+                        }
+                    });
+                }
+            }
+        }
+    } catch (error) {
+        console.log('Could not update sidebar stats:', error);
+    }
+}
+
+function openStatsWindow() {
+    const featuresEnabled = __organizerFeatures && __organizerFeatures.reports_enabled !== false;
+    if (!featuresEnabled) {
+        showNotification('Reports & Analytics are disabled in Features.', 'warning');
+        return;
+    }
+    const w = Math.min(screen.width - 100, 1280);
+    const h = Math.min(screen.height - 100, 900);
+    const left = Math.max(0, (screen.width - w) / 2);
+    const top = Math.max(0, (screen.height - h) / 2);
+    window.open('/statistics/full', 'StatisticsFullView', `width=${w},height=${h},left=${left},top=${top},resizable=yes,scrollbars=yes`);
+}
+
+// Initialize on page load
+document.addEventListener('DOMContentLoaded', function() {
+    loadCustomWidgets();
+    loadDashboardLayout();
+    initDragAndDrop();
+    loadHiddenModules();
+    initResizableTables();
+    syncAuthButtons();
+    initSidebarResizer();
+    
+    // Initialize notification center (only once on page load)
+    loadNotificationCenter();
+    // Clear any existing notification polling interval
+    if (notificationPollingInterval) {
+        clearInterval(notificationPollingInterval);
+    }
+    // Start notification polling every 30 seconds
+    notificationPollingInterval = setInterval(loadNotificationCenter, 30000);
+    
+    // Check if we should show intro
+    checkShowIntro();
+    
+    // Load developer mode setting
+    loadDeveloperMode();
+    
+    // Initialize sidebar updates (only if sidebar exists)
+    if (document.getElementById('sidebar')) {
+        updateSidebarMetrics();
+        updateSidebarStats();
+        
+        // Metrics are pushed over SSE; stats still refresh periodically
+        startMetricsEvents();
+        setInterval(updateSidebarStats, 30000); // Every 30 seconds
+    }
+
+    // Cookie-based auth persistence helpers
+    function setCookie(name, value, days) {
+        const d = new Date();
+        d.setTime(d.getTime() + (days*24*60*60*1000));
+        const expires = 'expires=' + d.toUTCString();
+        const secure = location.protocol === 'https:' ? '; Secure' : '';
+        document.cookie = name + '=' + encodeURIComponent(value) + '; ' + expires + '; Path=/' + '; SameSite=Lax' + secure;
+    }
+    function getCookie(name) {
+        const decoded = decodeURIComponent(document.cookie || '');
+        const ca = decoded.split(';');
+        name = name + '=';
+        for (let c of ca) {
+            while (c.charAt(0) === ' ') c = c.substring(1);
+            if (c.indexOf(name) === 0) return c.substring(name.length, c.length);
+        }
+        return null;
+    }
+    function deleteCookie(name) {
+        const secure = location.protocol === 'https:' ? '; Secure' : '';
+        document.cookie = name + '=; expires=Thu, 01 Jan 1970 00:00:00 GMT; Path=/; SameSite=Lax' + secure;
+    }
+
+    // Restore auth from sessionStorage or cookie if available
+    try {
+        let storedAuth = sessionStorage.getItem('authHeader');
+        if (!storedAuth) {
+            storedAuth = getCookie('authHeader');
+        }
+        if (storedAuth) {
+            __authHeader = storedAuth;
+            // Verify stored auth is still valid
+            fetch('/auth_check', {
+                credentials: 'include',
+                headers: { 'Authorization': __authHeader }
+            }).then(response => {
+                if (response.ok) {
+                    return response.json();
+                } else {
+                    __authHeader = null;
+                    sessionStorage.removeItem('authHeader');
+                    deleteCookie('authHeader');
+                    throw new Error('Stored auth invalid');
+                }
+            }).then(data => {
+                __rights = data.rights || {};
+                __configVersion = data.config_version || 0;
+                document.getElementById('login-btn').classList.add('d-none');
+                document.getElementById('logout-btn').classList.remove('d-none');
+                if (__rights.manage_config || __rights.modify_layout) {
+                    document.getElementById('config-link').classList.remove('d-none');
+                }
+                applyRights();
+                if (__rights.view_recent_files) refreshRecentFiles();
+                if (__rights.view_metrics) {
+                    updateServiceStatus();
+                    streamLog('stdout');
+                    streamLog('stderr');
+                }
+                // Initialize custom routes table if present
+                initializeCustomRoutes();
+            }).catch(err => {
+                console.log('Auth restoration failed:', err);
+            });
+        }
+    } catch (e) {
+        console.warn('sessionStorage not available:', e);
+    }
+    
+    // Initialize custom routes table on dashboard load
+    initializeCustomRoutes();
+    
+    // Intercept config link clicks to use fetch with auth header
+    const configLink = document.getElementById('config-link');
+    if (configLink) {
+        configLink.addEventListener('click', function(e) {
+            e.preventDefault();
+            if (!__authHeader) {
+                showNotification('Please login first', 'warning');
+                return;
+            }
+            // Navigate to config page
+            window.location.href = '/config';
+        });
+    }
+    
+    fetchServiceName();
+    // Fetch CSRF token
+    fetchCSRFToken();
+    // Start polling rights periodically
+    setInterval(pollRights, __rightsPollIntervalMs);
+    // Load dashboard data with feature gating
+    if (__organizerFeatures.reports_enabled) {
+        loadStatistics();
+    } else {
+        const el = document.getElementById('chart-category');
+        if (el) {
+            const parent = el.closest('.card-body');
+            if (parent) parent.insertAdjacentHTML('afterbegin', '<div class="alert alert-warning alert-sm py-1 px-2"><small>Reports & Analytics are disabled in Features.</small></div>');
+        }
+    }
+    if (__organizerFeatures.duplicates_enabled) {
+        loadDuplicates();
+    } else {
+        showNotification('Duplicate Detection is disabled in Features.', 'warning');
+    }
+    loadWatchedFolders();
+});
+
+// Statistics Charts
+
+// Duplicate Files Management
+async function loadDuplicates() {
+    const btn = document.getElementById('btn-duplicates-refresh');
+    const originalHtml = btn ? btn.innerHTML : '';
+    const container = document.getElementById('duplicates-container');
+    const countBadge = document.getElementById('duplicates-count');
+    const wastedBadge = document.getElementById('wasted-space');
+    
+    try {
+        if (btn) {
+            btn.disabled = true;
+            btn.innerHTML = '<span class="spinner-border spinner-border-sm me-1"></span>Scanning...';
+        }
+        if (container) {
+            container.innerHTML = `
+                <div class="text-center text-muted py-4">
+                    <div class="spinner-border text-primary mb-2"></div>
+                    <p class="mb-0">Scanning for duplicates...</p>
+                </div>`;
+        }
+        
+        const res = await fetch('/api/duplicates', {
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        
+        if (!res.ok) {
+            let message = 'Failed to load duplicates';
+            try {
+                const err = await res.json();
+                message = err.error || message;
+            } catch (_) {}
+            throw new Error(message);
+        }
+        
+        const data = await res.json();
+        window.duplicatesData = data;
+        
+        if (countBadge) {
+            countBadge.textContent = `${data.total_duplicates} duplicate group${data.total_duplicates === 1 ? '' : 's'}`;
+        }
+        if (wastedBadge) {
+            wastedBadge.textContent = `${data.wasted_space_human} wasted`;
+        }
+        if (!container) return;
+        
+        if (!data.duplicates || data.duplicates.length === 0) {
+            container.innerHTML = `
+                <div class="text-center text-success py-4">
+                    <i class="bi bi-check-circle fs-1"></i>
+                    <p class="mb-0">No duplicate files found!</p>
+                </div>`;
+            return;
+        }
+        
+        const cards = data.duplicates.map((group, index) => {
+            const files = Array.isArray(group.files) ? group.files : [];
+            const fileCount = group.count || files.length;
+            const totalSizeLabel = escapeHtml(group.total_size_human || '');
+            const hashPreviewRaw = (group.hash || '').substring(0, 12);
+            const hashPreview = hashPreviewRaw ? escapeHtml(hashPreviewRaw) : '';
+            const hashDisplay = hashPreview ? `${hashPreview}...` : 'n/a';
+            const fileRows = files.map((file, fileIndex) => {
+                const safePath = escapeHtml(file.path || '');
+                const deletePath = JSON.stringify(file.path || '');
+                const sizeLabel = escapeHtml(file.size_human || '');
+                const modifiedLabel = escapeHtml(file.modified_human || '');
+                return `
+                    <tr>
+                        <td style="width: 30px;"><input type="checkbox" data-group="${index}" data-file="${fileIndex}" data-path="${safePath}"></td>
+                        <td style="max-width: 250px; word-wrap: break-word; word-break: break-word;"><i class="bi bi-file-earmark"></i> ${escapeHtml(file.name || 'Unknown')}</td>
+                        <td style="min-width: 70px; white-space: nowrap;">${sizeLabel || '—'}</td>
+                        <td style="min-width: 130px; white-space: nowrap;"><small>${modifiedLabel || '—'}</small></td>
+                        <td style="word-wrap: break-word; word-break: break-word;"><small class="text-muted">${safePath}</small></td>
+                        <td style="min-width: 80px; text-align: center;">
+                            <button class="btn btn-sm btn-outline-danger" onclick="deleteSingleFile(${deletePath})" title="Delete this file">
+                                <i class="bi bi-trash"></i>
+                            </button>
+                        </td>
+                    </tr>
+                `;
+            }).join('');
+            
+            return `
+                <div class="card mb-3">
+                    <div class="card-header" style="background-color: var(--bg-secondary);">
+                        <div class="d-flex flex-column flex-lg-row justify-content-between align-items-lg-center gap-2">
+                            <div>
+                                <strong>${fileCount} files</strong> - ${totalSizeLabel || 'Unknown size'}
+                                <small class="text-muted">(Hash: ${hashDisplay})</small>
+                            </div>
+                            <div class="d-flex flex-wrap gap-2">
+                                <button class="btn btn-sm btn-outline-primary" onclick="keepNewest(${index})" title="Keep newest file, delete older duplicates">
+                                    <i class="bi bi-clock"></i> Keep Newest
+                                </button>
+                                <button class="btn btn-sm btn-outline-success" onclick="keepLargest(${index})" title="Keep largest file, delete smaller duplicates">
+                                    <i class="bi bi-file-earmark"></i> Keep Largest
+                                </button>
+                                <button class="btn btn-sm btn-outline-danger" onclick="deleteAllDuplicates(${index})" title="Delete all files in this group">
+                                    <i class="bi bi-trash"></i> Delete All
+                                </button>
+                            </div>
+                        </div>
+                    </div>
+                    <div class="card-body p-0">
+                        <div class="table-responsive">
+                            <table class="table table-sm table-hover mb-0" style="table-layout: auto; width: 100%;">
+                                <thead>
+                                    <tr>
+                                        <th style="width: 30px;"><input type="checkbox" onchange="toggleGroupSelection(${index}, this.checked)" title="Select all files in group"></th>
+                                        <th style="width: 25%;">Name</th>
+                                        <th style="width: 8%; min-width: 70px;">Size</th>
+                                        <th style="width: 15%; min-width: 130px;">Modified</th>
+                                        <th style="width: auto;">Path</th>
+                                        <th style="width: 80px; min-width: 80px; text-align: center;">Actions</th>
+                                    </tr>
+                                </thead>
+                                <tbody>
+                                    ${fileRows || '<tr><td colspan="6" class="text-center text-muted">No file details available</td></tr>'}
+                                </tbody>
+                            </table>
+                        </div>
+                    </div>
+                </div>
+            `;
+        }).join('');
+        
+        container.innerHTML = cards;
+    } catch (error) {
+        console.error('Error loading duplicates:', error);
+        if (container) {
+            container.innerHTML = `
+                <div class="alert alert-danger mb-0">
+                    <i class="bi bi-exclamation-triangle"></i> ${escapeHtml(error.message || 'Failed to load duplicates')}
+                </div>`;
+        }
+        showNotification('Failed to load duplicates: ' + error.message, 'danger');
+    } finally {
+        if (btn) {
+            btn.disabled = false;
+            btn.innerHTML = originalHtml || '<i class="bi bi-arrow-clockwise"></i> Refresh';
+        }
+    }
+}
+
+async function loadWatchedFolders() {
+    try {
+        const res = await fetch('/api/watch_folders', {
+            credentials: 'include',
+            headers: { 'Authorization': __authHeader }
+        });
+        if (!res.ok) return;
+        const data = await res.json();
+        const folders = Array.isArray(data.folders) ? data.folders : [];
+        const badge = document.getElementById('watched-folders-badge');
+        const list = document.getElementById('watched-folders-list');
+        const ul = document.getElementById('watched-folders-ul');
+        if (badge) badge.textContent = `watching ${folders.length}`;
+        if (ul) {
+            ul.innerHTML = folders.map(f => `<li><small class="text-muted">${f}</small></li>`).join('');
+        }
+        if (list) list.style.display = folders.length ? 'block' : 'none';
+    } catch (e) {
+        console.error('Failed to load watched folders', e);
+    }
+}
+
+function toggleGroupSelection(groupIndex, checked) {
+    document.querySelectorAll(`input[data-group="${groupIndex}"]`).forEach(checkbox => {
+        checkbox.checked = checked;
+    });
+}
+
+async function keepNewest(groupIndex) {
+    if (!window.duplicatesData) return;
+    
+    const group = window.duplicatesData.duplicates[groupIndex];
+    if (!group || group.files.length < 2) return;
+    
+    // Keep first file (newest by sort), delete rest
+    const filesToDelete = group.files.slice(1).map(f => f.path);
+    
+    if (!confirm(`Delete ${filesToDelete.length} older duplicate(s) and keep the newest?`)) {
+        return;
+    }
+    
+    await resolveDuplicates(filesToDelete);
+}
+
+async function keepLargest(groupIndex) {
+    if (!window.duplicatesData) return;
+    
+    const group = window.duplicatesData.duplicates[groupIndex];
+    if (!group || group.files.length < 2) return;
+    
+    // Find largest file
+    let largest = group.files[0];
+    group.files.forEach(f => {
+        if (f.size > largest.size) largest = f;
+    });
+    
+    // Delete all except largest
+    const filesToDelete = group.files.filter(f => f.path !== largest.path).map(f => f.path);
+    
+    if (!confirm(`Delete ${filesToDelete.length} duplicate(s) and keep the largest (${largest.size_human})?`)) {
+        return;
+    }
+    
+    await resolveDuplicates(filesToDelete);
+}
+
+async function deleteAllDuplicates(groupIndex) {
+    if (!window.duplicatesData) return;
+    
+    const group = window.duplicatesData.duplicates[groupIndex];
+    if (!group) return;
+    
+    const filesToDelete = group.files.map(f => f.path);
+    
+    if (!confirm(`Delete ALL ${filesToDelete.length} files in this duplicate group? This cannot be undone!`)) {
+        return;
+    }
+    
+    await resolveDuplicates(filesToDelete);
+}
+
+async function deleteSingleFile(filePath) {
+    if (!confirm(`Delete this file?\n${filePath}\n\nThis cannot be undone!`)) {
+        return;
+    }
+    
+    await resolveDuplicates([filePath]);
+}
+
+async function deleteSelectedFiles() {
+    const selected = Array.from(document.querySelectorAll('input[data-path]:checked')).map(cb => cb.dataset.path);
+    
+    if (selected.length === 0) {
+        showToast('No files selected', 'warning');
+        return;
+    }
+    
+    if (!confirm(`Delete ${selected.length} selected file(s)? This cannot be undone!`)) {
+        return;
+    }
+    
+    await resolveDuplicates(selected);
+}
+
+async function resolveDuplicates(filePaths) {
+    try {
+        const res = await fetch('/api/duplicates/resolve', {
+            method: 'POST',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json',
+                ...getAuthHeaders()
+            },
+            body: JSON.stringify({
+                action: 'delete',
+                files: filePaths
+            })
+        });
+        
+        if (res.ok) {
+            const result = await res.json();
+            showToast(result.message, 'success');
+            
+            // Reload duplicates
+            loadDuplicates();
+        } else {
+            const error = await res.json();
+            showToast('Failed to delete files: ' + (error.error || 'Unknown error'), 'error');
+        }
+    } catch (error) {
+        console.error('Error resolving duplicates:', error);
+        showNotification('Error: ' + error.message, 'danger');
+    }
+}
+
+async function scanVirusTotal(filePath, fileName) {
+    try {
+        console.log('Scanning file with VT:', filePath);
+        const res = await fetch('/api/recent_files/virustotal', {
+            method: 'POST',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json',
+                ...getAuthHeaders()
+            },
+            body: JSON.stringify({ path: filePath })
+        });
+        console.log('VT Response status:', res.status);
+        if (!res.ok && res.status === 404) {
+            showNotification('VirusTotal endpoint not found. Please restart the dashboard service.', 'warning');
+            return;
+        }
+        const data = await res.json().catch(() => ({}));
+        if (res.ok) {
+            const attrs = data.data && data.data.attributes;
+            const stats = attrs && attrs.last_analysis_stats;
+            // Notification summary
+            if (stats) {
+                showNotification(`VT: ${fileName} clean:${stats.undetected} malicious:${stats.malicious} suspicious:${stats.suspicious||0}`, 'info');
+            } else {
+                showNotification('VirusTotal scan requested. Check VT for detailed report.', 'info');
+            }
+            // Populate modal details
+            try {
+                const engines = attrs && attrs.last_analysis_results ? attrs.last_analysis_results : {};
+                const rows = Object.keys(engines).map(name => {
+                    const r = engines[name] || {};
+                    const c = r.category || 'unknown';
+                    const verdict = r.result || '';
+                    const badge = c === 'malicious' ? 'badge bg-danger' : c === 'suspicious' ? 'badge bg-warning text-dark' : 'badge bg-success';
+                    return `<tr><td><small>${name}</small></td><td><span class="${badge}">${c}</span></td><td><small>${verdict}</small></td></tr>`;
+                }).join('');
+                const sha256 = attrs && attrs.sha256 ? attrs.sha256 : '';
+                const link = sha256 ? `https://www.virustotal.com/gui/file/${sha256}` : '#';
+                const bodyHtml = `
+                    <div class="mb-2"><strong>${escapeHtml(fileName)}</strong></div>
+                    ${stats ? `<div class="mb-3">Malicious: ${stats.malicious} • Suspicious: ${stats.suspicious||0} • Undetected: ${stats.undetected} • Harmless: ${stats.harmless||0}</div>` : ''}
+                    <div class="table-responsive">
+                        <table class="table table-sm">
+                            <thead><tr><th>Engine</th><th>Status</th><th>Verdict</th></tr></thead>
+                            <tbody>${rows || '<tr><td colspan="3" class="text-muted">No engine results</td></tr>'}</tbody>
+                        </table>
+                    </div>`;
+                const modalBody = document.getElementById('vtModalBody');
+                const modalLink = document.getElementById('vtReportLink');
+                if (modalBody) modalBody.innerHTML = bodyHtml;
+                if (modalLink) modalLink.href = link;
+                // Show modal
+                const modalEl = document.getElementById('vtModal');
+                if (modalEl && typeof bootstrap !== 'undefined') {
+                    const modal = bootstrap.Modal.getOrCreateInstance(modalEl);
+                    modal.show();
+                }
+            } catch (e) {
+                console.warn('Failed to render VT modal:', e);
+            }
+        } else {
+            showNotification('VirusTotal error: ' + (data.error || res.status), 'danger');
+        }
+    } catch (e) {
+        showNotification('VirusTotal request failed: ' + e.message, 'danger');
+    }
+}
+// Statistics Charts
+let chartCategory, chartExtensions, chartTimeline, chartHourly;
+
+async function loadStatistics() {
+    try {
+        // Load overview stats
+        const overviewRes = await fetch('/api/statistics/overview', {
+            credentials: 'include',
+            headers: { 'Authorization': __authHeader }
+        });
+        
+        if (overviewRes.ok) {
+            const overview = await overviewRes.json();
+            const setTextIfExists = (id, value) => {
+                const el = document.getElementById(id);
+                if (el) el.textContent = value;
+            };
+            setTextIfExists('stat-total-files', overview.total_files || 0);
+            setTextIfExists('stat-today', overview.today_count || 0);
+            setTextIfExists('stat-week', overview.week_count || 0);
+            setTextIfExists('stat-month', overview.month_count || 0);
+            setTextIfExists('stat-categories', overview.total_categories || 0);
+            setTextIfExists('stat-avg-day', overview.avg_per_day || 0);
+        }
+        
+        // Load category chart
+        const categoryRes = await fetch('/api/statistics/by-category', {
+            credentials: 'include',
+            headers: { 'Authorization': __authHeader }
+        });
+        
+        if (categoryRes.ok) {
+            const categoryData = await categoryRes.json();
+            const ctx = document.getElementById('chart-category');
+            if (ctx) {
+                if (chartCategory) chartCategory.destroy();
+                chartCategory = new Chart(ctx, {
+                    type: 'doughnut',
+                    data: {
+                        labels: categoryData.labels || [],
+                        datasets: [{
+                            data: categoryData.data || [],
+                            backgroundColor: [
+                                '#0d6efd', '#6610f2', '#6f42c1', '#d63384', '#dc3545',
+                                '#fd7e14', '#ffc107', '#198754', '#20c997', '#0dcaf0'
+                            ]
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        plugins: {
+                            legend: {
+                                position: 'right'
+                            }
+                        }
+                    }
+                });
+            }
+        }
+        
+        // Load extensions chart
+        const extRes = await fetch('/api/statistics/by-extension', {
+            credentials: 'include',
+            headers: { 'Authorization': __authHeader }
+        });
+        
+        if (extRes.ok) {
+            const extData = await extRes.json();
+            const ctx = document.getElementById('chart-extensions');
+            if (ctx) {
+                if (chartExtensions) chartExtensions.destroy();
+                chartExtensions = new Chart(ctx, {
+                    type: 'bar',
+                    data: {
+                        labels: extData.labels || [],
+                        datasets: [{
+                            label: 'Files',
+                            data: extData.data || [],
+                            backgroundColor: '#0d6efd'
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        plugins: {
+                            legend: {
+                                display: false
+                            }
+                        },
+                        scales: {
+                            y: {
+                                beginAtZero: true,
+                                ticks: {
+                                    stepSize: 1
+                                }
+                            }
+                        }
+                    }
+                });
+            }
+        }
+        
+        // Load timeline chart
+        const timelineRes = await fetch('/api/statistics/timeline', {
+            credentials: 'include',
+            headers: { 'Authorization': __authHeader }
+        });
+        
+        if (timelineRes.ok) {
+            const timelineData = await timelineRes.json();
+            const ctx = document.getElementById('chart-timeline');
+            if (ctx) {
+                if (chartTimeline) chartTimeline.destroy();
+                chartTimeline = new Chart(ctx, {
+                    type: 'line',
+                    data: {
+                        labels: timelineData.labels || [],
+                        datasets: [{
+                            label: 'Files Organized',
+                            data: timelineData.data || [],
+                            borderColor: '#198754',
+                            backgroundColor: 'rgba(25, 135, 84, 0.1)',
+                            fill: true,
+                            tension: 0.4
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        plugins: {
+                            legend: {
+                                display: false
+                            }
+                        },
+                        scales: {
+                            y: {
+                                beginAtZero: true,
+                                ticks: {
+                                    stepSize: 1
+                                }
+                            },
+                            x: {
+                                ticks: {
+                                    maxRotation: 45,
+                                    minRotation: 45
+                                }
+                            }
+                        }
+                    }
+                });
+            }
+        }
+        
+        // Load hourly activity chart
+        const hourlyRes = await fetch('/api/statistics/hourly-activity', {
+            credentials: 'include',
+            headers: { 'Authorization': __authHeader }
+        });
+        
+        if (hourlyRes.ok) {
+            const hourlyData = await hourlyRes.json();
+            const ctx = document.getElementById('chart-hourly');
+            if (ctx) {
+                if (chartHourly) chartHourly.destroy();
+                chartHourly = new Chart(ctx, {
+                    type: 'bar',
+                    data: {
+                        labels: hourlyData.labels || [],
+                        datasets: [{
+                            label: 'Files',
+                            data: hourlyData.data || [],
+                            backgroundColor: '#0dcaf0'
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        plugins: {
+                            legend: {
+                                display: false
+                            }
+                        },
+                        scales: {
+                            y: {
+                                beginAtZero: true,
+                                ticks: {
+                                    stepSize: 1
+                                }
+                            }
+                        }
+                    }
+                });
+            }
+        }
+        
+    } catch (err) {
+        console.error('Failed to load statistics:', err);
+    }
+}
+
+// Notification Center Functions
+let notificationCenterOpen = false;
+let notificationPollingInterval = null;
+
+async function loadNotificationCenter() {
+    try {
+        const response = await fetch('/api/notifications', {
+            credentials: 'include',
+            headers: { 'Authorization': __authHeader }
+        });
+        
+        if (response.ok) {
+            const data = await response.json();
+            updateNotificationBadge(data.unread);
+            renderNotifications(data.notifications);
+        }
+    } catch (err) {
+        console.error('Failed to load notifications:', err);
+    }
+}
+
+function updateNotificationBadge(count) {
+    const badge = document.getElementById('notification-badge');
+    if (badge) {
+        if (count > 0) {
+            badge.textContent = count > 99 ? '99+' : count;
+            badge.style.display = 'flex';
+        } else {
+            badge.style.display = 'none';
+        }
+    }
+}
+
+function renderNotifications(notifications) {
+    const body = document.getElementById('notification-body');
+    if (!body) return;
+    
+    if (notifications.length === 0) {
+        body.innerHTML = `
+            <div class="notification-empty">
+                <i class="bi bi-bell-slash"></i>
+                <p>No notifications</p>
+            </div>
+        `;
+        return;
+    }
+    
+    body.innerHTML = notifications.map(notif => {
+        const unreadClass = notif.read ? '' : 'unread';
+        const typeIcon = getNotificationIcon(notif.type);
+        const time = formatNotificationTime(notif.timestamp);
+        
+        return `
+            <div class="notification-item ${unreadClass}" onclick="markNotificationRead('${notif.id}')">
+                <div class="notification-message">
+                    <i class="bi ${typeIcon}"></i> ${notif.message}
+                </div>
+                <div class="notification-time">${time}</div>
+                <i class="bi bi-x-circle notification-delete" onclick="event.stopPropagation(); deleteNotification('${notif.id}')"></i>
+            </div>
+        `;
+    }).join('');
+}
+
+function getNotificationIcon(type) {
+    const icons = {
+        'success': 'bi-check-circle-fill text-success',
+        'danger': 'bi-exclamation-triangle-fill text-danger',
+        'warning': 'bi-exclamation-circle-fill text-warning',
+        'info': 'bi-info-circle-fill text-info'
+    };
+    return icons[type] || icons.info;
+}
+
+function formatNotificationTime(timestamp) {
+    try {
+        const date = new Date(timestamp);
+        const now = new Date();
+        const diffMs = now - date;
+        const diffMins = Math.floor(diffMs / 60000);
+        const diffHours = Math.floor(diffMs / 3600000);
+        const diffDays = Math.floor(diffMs / 86400000);
+        
+        if (diffMins < 1) return 'Just now';
+        if (diffMins < 60) return `${diffMins}m ago`;
+        if (diffHours < 24) return `${diffHours}h ago`;
+        if (diffDays < 7) return `${diffDays}d ago`;
+        return date.toLocaleDateString();
+    } catch (err) {
+        return '';
+    }
+}
+
+function toggleNotificationCenter() {
+    const dropdown = document.getElementById('notification-dropdown');
+    if (!dropdown) return;
+    
+    notificationCenterOpen = !notificationCenterOpen;
+    
+    if (notificationCenterOpen) {
+        dropdown.classList.add('show');
+        loadNotificationCenter();
+        // Close when clicking outside
+        setTimeout(() => {
+            document.addEventListener('click', closeNotificationCenter);
+        }, 100);
+    } else {
+        dropdown.classList.remove('show');
+        document.removeEventListener('click', closeNotificationCenter);
+    }
+}
+
+function closeNotificationCenter(event) {
+    const dropdown = document.getElementById('notification-dropdown');
+    const bell = document.querySelector('.notification-bell');
+    
+    if (dropdown && bell && !dropdown.contains(event.target) && !bell.contains(event.target)) {
+        dropdown.classList.remove('show');
+        notificationCenterOpen = false;
+        document.removeEventListener('click', closeNotificationCenter);
+    }
+}
+
+async function markNotificationRead(notificationId) {
+    try {
+        await fetch(`/api/notifications/${notificationId}/read`, {
+            method: 'POST',
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        loadNotificationCenter();
+    } catch (err) {
+        console.error('Failed to mark notification as read:', err);
+    }
+}
+
+async function markAllNotificationsRead() {
+    try {
+        await fetch('/api/notifications/mark-all-read', {
+            method: 'POST',
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        loadNotificationCenter();
+        showNotification('All notifications marked as read', 'success');
+    } catch (err) {
+        console.error('Failed to mark all as read:', err);
+    }
+}
+
+async function clearAllNotifications() {
+    if (!confirm('Clear all notifications? This cannot be undone.')) return;
+    
+    try {
+        await fetch('/api/notifications/clear', {
+            method: 'POST',
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        loadNotificationCenter();
+        showNotification('All notifications cleared', 'success');
+    } catch (err) {
+        console.error('Failed to clear notifications:', err);
+    }
+}
+
+async function deleteNotification(notificationId) {
+    try {
+        await fetch(`/api/notifications/${notificationId}`, {
+            method: 'DELETE',
+            credentials: 'include',
+            headers: getAuthHeaders()
+        });
+        loadNotificationCenter();
+    } catch (err) {
+        console.error('Failed to delete notification:', err);
+    }
+}
+
+// Enhanced showNotification with notification center integration
+// (Note: original showNotification is defined earlier in the script)
+function showNotificationWithHistory(message, type) {
+    // Base showNotification already persists to Notification Center.
+    // Call it directly to avoid duplicate entries or toasts.
+    showNotification(message, type);
+}
+
+// Keyboard Shortcuts and Command Palette
+const commands = [
+    { name: 'Toggle Dark Mode', icon: 'bi-moon-stars', shortcut: 'Ctrl+D', action: () => toggleTheme() },
+    { name: 'Refresh Dashboard', icon: 'bi-arrow-clockwise', shortcut: 'Ctrl+R', action: () => location.reload() },
+    { name: 'Open Notifications', icon: 'bi-bell', shortcut: 'Ctrl+N', action: () => toggleNotificationCenter() },
+    { name: 'Show Keyboard Shortcuts', icon: 'bi-keyboard', shortcut: '?', action: () => showHelpModal() },
+    { name: 'View Changelog', icon: 'bi-clock-history', shortcut: 'Ctrl+L', action: () => showChangelog() },
+    { name: 'About Dashboard', icon: 'bi-info-circle', shortcut: 'Ctrl+H', action: () => showAboutModal() },
+    { name: 'Go to Config Page', icon: 'bi-gear', shortcut: '', action: () => window.location.href = '/config' },
+    { name: 'Refresh Statistics', icon: 'bi-graph-up', shortcut: '', action: () => loadStatistics() },
+    { name: 'Reset Dashboard Layout', icon: 'bi-arrow-counterclockwise', shortcut: '', action: () => resetDashboardLayout() },
+    { name: 'Show Hidden Modules', icon: 'bi-eye', shortcut: '', action: () => showHiddenModules() },
+    { name: 'Logout', icon: 'bi-box-arrow-right', shortcut: '', action: () => logout() }
+];
+
+let selectedCommandIndex = 0;
+
+// Global keyboard shortcut handler
+document.addEventListener('keydown', function(e) {
+    // Ctrl+K - Command Palette
+    if (e.ctrlKey && e.key === 'k') {
+        e.preventDefault();
+        openCommandPalette();
+        return;
+    }
+    
+    // Ctrl+D - Toggle Dark Mode
+    if (e.ctrlKey && e.key === 'd') {
+        e.preventDefault();
+        toggleTheme();
+        return;
+    }
+    
+    // Ctrl+R - Refresh (allow default but show notification)
+    if (e.ctrlKey && e.key === 'r') {
+        // Let browser handle refresh
+        return;
+    }
+    
+    // Ctrl+N - Open Notifications
+    if (e.ctrlKey && e.key === 'n') {
+        e.preventDefault();
+        toggleNotificationCenter();
+        return;
+    }
+    
+    // Ctrl+L - Changelog
+    if (e.ctrlKey && e.key === 'l') {
+        e.preventDefault();
+        showChangelog();
+        return;
+    }
+    
+    // Ctrl+H - About
+    if (e.ctrlKey && e.key === 'h') {
+        e.preventDefault();
+        showAboutModal();
+        return;
+    }
+    
+    // ? - Show Help (when not in input field)
+    if (e.key === '?' && !['INPUT', 'TEXTAREA'].includes(e.target.tagName)) {
+        e.preventDefault();
+        showHelpModal();
+        return;
+    }
+    
+    // Escape - Close all modals
+    if (e.key === 'Escape') {
+        closeCommandPalette();
+        closeHelpModal();
+        closeAboutModal();
+        closeChangelogModal();
+        closeIntroModal();
+        if (notificationCenterOpen) {
+            toggleNotificationCenter();
+        }
+        return;
+    }
+    
+    // Arrow keys in command palette
+    if (document.getElementById('command-palette-overlay').classList.contains('show')) {
+        if (e.key === 'ArrowDown') {
+            e.preventDefault();
+            selectedCommandIndex = Math.min(selectedCommandIndex + 1, commands.length - 1);
+            updateCommandSelection();
+        } else if (e.key === 'ArrowUp') {
+            e.preventDefault();
+            selectedCommandIndex = Math.max(selectedCommandIndex - 1, 0);
+            updateCommandSelection();
+        } else if (e.key === 'Enter') {
+            e.preventDefault();
+            executeSelectedCommand();
+        }
+    }
+});
+
+function openCommandPalette() {
+    const overlay = document.getElementById('command-palette-overlay');
+    const input = document.getElementById('command-palette-input');
+    overlay.classList.add('show');
+    input.value = '';
+    input.focus();
+    selectedCommandIndex = 0;
+    renderCommands(commands);
+}
+
+function closeCommandPalette() {
+    const overlay = document.getElementById('command-palette-overlay');
+    overlay.classList.remove('show');
+}
+
+function renderCommands(commandList) {
+    const results = document.getElementById('command-palette-results');
+    
+    if (commandList.length === 0) {
+        results.innerHTML = '<div class="command-palette-empty">No commands found</div>';
+        return;
+    }
+    
+    results.innerHTML = commandList.map((cmd, index) => `
+        <div class="command-palette-item ${index === selectedCommandIndex ? 'selected' : ''}" 
+             onclick="executeCommand(${index})" 
+             data-index="${index}">
+            <i class="bi ${cmd.icon}"></i>
+            <span class="command-name">${cmd.name}</span>
+            ${cmd.shortcut ? `<span class="command-shortcut">${cmd.shortcut}</span>` : ''}
+        </div>
+    `).join('');
+}
+
+function updateCommandSelection() {
+    document.querySelectorAll('.command-palette-item').forEach((item, index) => {
+        if (index === selectedCommandIndex) {
+            item.classList.add('selected');
+            item.scrollIntoView({ block: 'nearest' });
+        } else {
+            item.classList.remove('selected');
+        }
+    });
+}
+
+function executeCommand(index) {
+    if (commands[index]) {
+        closeCommandPalette();
+        commands[index].action();
+    }
+}
+
+function executeSelectedCommand() {
+    executeCommand(selectedCommandIndex);
+}
+
+// Command palette search
+document.getElementById('command-palette-input').addEventListener('input', function(e) {
+    const query = e.target.value.toLowerCase();
+    const filtered = commands.filter(cmd => 
+        cmd.name.toLowerCase().includes(query) || 
+        cmd.shortcut.toLowerCase().includes(query)
+    );
+    selectedCommandIndex = 0;
+    renderCommands(filtered);
+});
+
+// Help Modal Functions
+function showHelpModal() {
+    document.getElementById('help-modal-overlay').classList.add('show');
+}
+
+function closeHelpModal() {
+    document.getElementById('help-modal-overlay').classList.remove('show');
+}
+
+// About Modal Functions
+function showAboutModal() {
+    document.getElementById('about-modal-overlay').classList.add('show');
+}
+
+function closeAboutModal() {
+    document.getElementById('about-modal-overlay').classList.remove('show');
+}
+
+// Changelog Functions
+async function showChangelog() {
+    const overlay = document.getElementById('changelog-modal-overlay');
+    const content = document.getElementById('changelog-content');
+    
+    overlay.classList.add('show');
+    
+    try {
+        const response = await fetch('/CHANGELOG.md');
+        if (response.ok) {
+            let markdown = await response.text();
+            // Simple markdown to HTML conversion
+            content.innerHTML = markdownToHtml(markdown);
+        } else {
+            content.innerHTML = '<p class="text-danger">Failed to load changelog.</p>';
+        }
+    } catch (err) {
+        content.innerHTML = '<p class="text-danger">Error loading changelog: ' + err.message + '</p>';
+    }
+}
+
+function closeChangelogModal() {
+    document.getElementById('changelog-modal-overlay').classList.remove('show');
+}
+
+function markdownToHtml(markdown) {
+    return markdown
+        .replace(/^### (.+)$/gm, '<h5 class="mt-3">$1</h5>')
+        .replace(/^## (.+)$/gm, '<h4 class="mt-4">$1</h4>')
+        .replace(/^# (.+)$/gm, '<h3 class="mt-4">$1</h3>')
+        .replace(/\*\*(.+?)\*\*/g, '<strong>$1</strong>')
+        .replace(/\*(.+?)\*/g, '<em>$1</em>')
+        .replace(/^- (.+)$/gm, '<li>$1</li>')
+        .replace(/(<li>.*<\/li>\n?)+/g, '<ul>$&</ul>')
+        .replace(/\n\n/g, '</p><p>')
+        .replace(/^(?!<[h|u|l])/gm, '<p>')
+        .replace(/(?<![>])$/gm, '</p>')
+        .replace(/<p><\/p>/g, '')
+        .replace(/\[([^\]]+)\]\(([^)]+)\)/g, '<a href="$2" target="_blank">$1</a>');
+}
+
+// Intro Modal Functions
+function checkShowIntro() {
+    const dontShow = localStorage.getItem('dontShowIntro');
+    if (!dontShow) {
+        setTimeout(() => {
+            document.getElementById('intro-modal-overlay').classList.add('show');
+        }, 1000);
+    }
+}
+
+function closeIntroModal() {
+    const dontShow = document.getElementById('dont-show-intro').checked;
+    if (dontShow) {
+        localStorage.setItem('dontShowIntro', 'true');
+    }
+    document.getElementById('intro-modal-overlay').classList.remove('show');
+}
+
+// Mobile Collapsible Cards
+function initMobileCollapsible() {
+    if (window.innerWidth <= 768) {
+        document.querySelectorAll('.dashboard-module .card-header, .config-module .card-header').forEach(header => {
+            // Only add click handler once
+            if (!header.dataset.collapsibleInit) {
+                header.dataset.collapsibleInit = 'true';
+                header.addEventListener('click', function(e) {
+                    // Don't collapse if clicking on a button or input
+                    if (e.target.tagName === 'BUTTON' || e.target.tagName === 'INPUT' || 
+                        e.target.closest('button') || e.target.closest('.drag-handle') || 
+                        e.target.closest('.hide-toggle')) {
+                        return;
+                    }
+                    const module = this.closest('.dashboard-module, .config-module');
+                    if (module) {
+                        module.classList.toggle('collapsed');
+                    }
+                });
+            }
+        });
+    }
+}
+
+// Re-init on resize
+let resizeTimer;
+window.addEventListener('resize', function() {
+    clearTimeout(resizeTimer);
+    resizeTimer = setTimeout(function() {
+        initMobileCollapsible();
+    }, 250);
+});
+
+// Initialize mobile features on load
+document.addEventListener('DOMContentLoaded', function() {
+    initMobileCollapsible();
+});
+
+// Note: Service control functions (startService, stopService, restartService, serviceAction, updateServiceStatus)
+// are already defined earlier in this file.
+
+// Export implementations to window for inline handlers
+(function(){
+    const exportNames = [
+        'promptLogin','logout','resetDashboardLayout','addCustomWidget','editCustomWidget','removeCustomWidget',
+        'saveCustomWidgets','loadCustomWidgets','initSidebarResizer','initDragAndDrop','saveDashboardLayout','loadDashboardLayout',
+        'showNotification','toggleNotificationCenter','markAllNotificationsRead','clearAllNotifications',
+        'revealPublicIP','hidePublicIP','extractPublicIP','copyPublicIP',
+        'loadDuplicates','loadWatchedFolders','refreshRecentFiles','copyServiceName','copyToClipboard','deleteRow',
+        'toggleHideModule','saveSettings','addCategoryRow','saveConfiguration','addCustomRouteRow','addTagRouteRow',
+        'devResetToSetup','initResizableTables','initMobileCollapsible','updateServiceStatus',
+        'startService','stopService','restartService','serviceAction','showHiddenModules','loadDeveloperMode',
+        'updateSidebarMetrics','updateSidebarStats','openStatsWindow','streamLog'
+    ];
+    exportNames.forEach(function(name){
+        try {
+            if (typeof window[name] !== 'function' && typeof eval(name) === 'function') {
+                window[name] = eval(name);
+            }
+        } catch(e) {}
+    });
+})();
+
+// Bind UI events to real implementations (rewire from inline handlers)
+document.addEventListener('DOMContentLoaded', function(){
+    const byId = (id)=>document.getElementById(id);
+    const bind = (id, handler)=>{ const el = byId(id); if(el && typeof handler === 'function') el.addEventListener('click', handler); };
+
+    // Auth & main controls
+    bind('login-btn', window.promptLogin);
+    bind('login-btn-sidebar', window.promptLogin);
+    bind('logout-btn', window.logout);
+    bind('logout-btn-sidebar', window.logout);
+    bind('btn-show-hidden', window.showHiddenModules);
+    bind('btn-reset-layout', window.resetDashboardLayout);
+    bind('btn-add-widget', window.addCustomWidget);
+    bind('reset-layout-btn', window.resetDashboardLayout);
+    bind('show-hidden-btn', window.showHiddenModules);
+    bind('dev-reset-btn', window.devResetToSetup);
+    bind('dev-reset-btn-sidebar', window.devResetToSetup);
+    
+    // Service controls
+    bind('btn-start-service', window.startService);
+    bind('btn-stop-service', window.stopService);
+    bind('btn-restart-service', window.restartService);
+    bind('service-name-btn', window.copyServiceName);
+    
+    // Module actions
+    bind('btn-duplicates-refresh', window.loadDuplicates);
+    bind('btn-recent-refresh', window.refreshRecentFiles);
+    bind('btn-save-settings', window.saveSettings);
+    bind('btn-add-category', window.addCategoryRow);
+    bind('btn-save-config', window.saveConfiguration);
+    bind('btn-add-custom-route', window.addCustomRouteRow);
+    bind('btn-save-custom-routes', window.saveConfiguration);
+    bind('btn-add-tag-route', window.addTagRouteRow);
+    bind('btn-save-tag-routes', window.saveConfiguration);
+    
+    // Event delegation for hide toggles (data-module attribute)
+    document.addEventListener('click', function(e){
+        const toggle = e.target.closest('.hide-toggle');
+        if(toggle && toggle.dataset.module && typeof window.toggleHideModule === 'function'){
+            window.toggleHideModule(toggle.dataset.module);
+        }
+        
+        // Delete row buttons (onclick="deleteRow(this)")
+        if(e.target.matches('button') && e.target.textContent.trim() === 'Delete' && typeof window.deleteRow === 'function'){
+            window.deleteRow(e.target);
+        }
+        
+        // Copy-value spans with copyToClipboard
+        const copySpan = e.target.closest('.copy-value');
+        if(copySpan && typeof window.copyToClipboard === 'function'){
+            const text = copySpan.textContent.trim();
+            window.copyToClipboard(text, copySpan);
+        }
+    });
+    
+    // Public IP hover/out events
+    const publicIpSpan = byId('public-ip-display');
+    if(publicIpSpan){
+        publicIpSpan.addEventListener('mouseover', window.revealPublicIP);
+        publicIpSpan.addEventListener('mouseout', window.hidePublicIP);
+        publicIpSpan.addEventListener('click', function(){ if(typeof window.copyPublicIP === 'function') window.copyPublicIP(this); });
+    }
+    
+    // Extract public IP iframe onload
+    const ipFrame = byId('ipchicken-frame');
+    if(ipFrame && typeof window.extractPublicIP === 'function'){
+        ipFrame.addEventListener('load', window.extractPublicIP);
+    }
+    
+    // Load persisted theme on page load
+    if (typeof restorePersistedTheme === 'function') {
+        restorePersistedTheme();
+    }
+});
+
+// ==================== THEME PERSISTENCE ====================
+// Theme persistence system using localStorage with server-side backup
+
+const THEME_STORAGE_KEY = 'dashboard_theme_v1';
+const THEME_SYNC_INTERVAL = 30000; // Sync every 30 seconds
+
+/**
+ * Save theme to localStorage immediately
+ * Queue for server sync in background
+ */
+function persistThemeLocally(theme) {
+    if (!theme) return;
+    
+    try {
+        // Save to localStorage for instant availability
+        const themeData = {
+            timestamp: Date.now(),
+            theme: theme,
+            version: 1
+        };
+        localStorage.setItem(THEME_STORAGE_KEY, JSON.stringify(themeData));
+        
+        // Queue for server sync
+        scheduleThemeSync(theme);
+    } catch (e) {
+        console.warn('Failed to save theme to localStorage:', e);
+    }
+}
+
+/**
+ * Retrieve theme from localStorage
+ */
+function getPersistedTheme() {
+    try {
+        const stored = localStorage.getItem(THEME_STORAGE_KEY);
+        if (!stored) return null;
+        
+        const data = JSON.parse(stored);
+        if (data && data.theme) {
+            return data.theme;
+        }
+    } catch (e) {
+        console.warn('Failed to read theme from localStorage:', e);
+    }
+    return null;
+}
+
+/**
+ * Schedule theme sync to server
+ * Batches requests to avoid excessive API calls
+ */
+let themeSyncTimeout = null;
+function scheduleThemeSync(theme) {
+    if (themeSyncTimeout) {
+        clearTimeout(themeSyncTimeout);
+    }
+    
+    themeSyncTimeout = setTimeout(() => {
+        syncThemeToServer(theme);
+    }, 2000); // Wait 2 seconds for additional changes
+}
+
+/**
+ * Sync current theme to server
+ */
+function syncThemeToServer(theme) {
+    if (!theme || !__authHeader) return; // Don't sync if not authenticated
+    
+    fetch('/api/dashboard/branding', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json', ...getAuthHeaders()},
+        body: JSON.stringify(theme)
+    })
+    .then(r => r.json().then(j => ({ok: r.ok, j})))
+    .then(({ok, j}) => {
+        if (!ok) {
+            console.warn('Failed to sync theme to server:', j.error);
+        }
+    })
+    .catch(e => console.warn('Error syncing theme to server:', e));
+}
+
+/**
+ * Load theme from server (for first-time page load or after login)
+ */
+function loadThemeFromServer() {
+    if (!__authHeader) {
+        // User not authenticated, use localStorage only
+        return;
+    }
+    
+    return fetch('/api/dashboard/branding', {headers: getAuthHeaders()})
+        .then(r => r.ok ? r.json() : null)
+        .then(serverTheme => {
+            if (serverTheme) {
+                // Save server theme to localStorage
+                persistThemeLocally(serverTheme);
+                // Load the logo from the theme
+                loadDashboardLogo(serverTheme);
+                return serverTheme;
+            }
+            return null;
+        })
+        .catch(e => {
+            console.warn('Error loading theme from server:', e);
+            return null;
+        });
+}
+
+/**
+ * Load custom branding logo from theme configuration
+ */
+function loadDashboardLogo(theme) {
+    const logoImg = document.getElementById('dashboard-logo');
+    if (!logoImg) return;
+    
+    if (theme && theme.logo) {
+        // Use custom logo from theme
+        logoImg.src = theme.logo;
+        logoImg.alt = theme.title || 'Dashboard Logo';
+        logoImg.style.opacity = '1';
+    } else {
+        // Use default placeholder icon
+        logoImg.style.opacity = '0.5';
+    }
+}
+
+/**
+ * Update dashboard logo when theme is changed (called from theme update functions)
+ */
+function updateDashboardLogo(theme) {
+    loadDashboardLogo(theme);
+}
+
+/**
+ * Restore persisted theme on page load
+ * Strategy:
+ * 1. Check localStorage first (fastest, works offline)
+ * 2. If authenticated, try to load from server (might have updated on another device)
+ * 3. If both fail, use defaults
+ */
+async function restorePersistedTheme() {
+    try {
+        // Get theme from localStorage immediately
+        const localTheme = getPersistedTheme();
+        
+        if (localTheme) {
+            // Apply localStorage theme immediately (no delay)
+            if (typeof applyThemeStyles === 'function') {
+                applyThemeStyles(localTheme);
+            }
+            // Load logo from local theme
+            if (typeof loadDashboardLogo === 'function') {
+                loadDashboardLogo(localTheme);
+            }
+        }
+        
+        // If authenticated, try to load server theme in background
+        if (__authHeader) {
+            const serverTheme = await loadThemeFromServer();
+            if (serverTheme) {
+                // Update UI if server theme is different
+                updateThemeFormFields(serverTheme);
+                if (typeof applyThemeStyles === 'function') {
+                    applyThemeStyles(serverTheme);
+                }
+            }
+        }
+    } catch (e) {
+        console.warn('Error restoring persisted theme:', e);
+    }
+}
+
+/**
+ * Update theme form fields without re-loading from server
+ * (Used when theme is synced from another tab/device)
+ */
+function updateThemeFormFields(theme) {
+    if (!theme) return;
+    
+    try {
+        theme.colors = theme.colors || {};
+        theme.borderRadius = theme.borderRadius || '8px';
+        theme.fontSize = theme.fontSize || '100%';
+        theme.shadow = theme.shadow || 'normal';
+        
+        // Update form fields if they exist (might be on different page)
+        const titleEl = document.getElementById('brand-title');
+        if (titleEl && theme.title) titleEl.value = theme.title;
+        
+        const logoEl = document.getElementById('brand-logo');
+        if (logoEl && theme.logo) logoEl.value = theme.logo;
+        
+        const nameEl = document.getElementById('brand-theme-name');
+        if (nameEl && theme.themeName) nameEl.value = theme.themeName;
+        
+        const primaryEl = document.getElementById('brand-color-primary');
+        if (primaryEl) {
+            primaryEl.value = theme.colors.primary || '#0d6efd';
+            if (typeof updateColorSwatchBackground === 'function') {
+                updateColorSwatchBackground(primaryEl);
+            }
+        }
+        
+        const secondaryEl = document.getElementById('brand-color-secondary');
+        if (secondaryEl) {
+            secondaryEl.value = theme.colors.secondary || '#6c757d';
+            if (typeof updateColorSwatchBackground === 'function') {
+                updateColorSwatchBackground(secondaryEl);
+            }
+        }
+        
+        const successEl = document.getElementById('brand-color-success');
+        if (successEl) {
+            successEl.value = theme.colors.success || '#198754';
+            if (typeof updateColorSwatchBackground === 'function') {
+                updateColorSwatchBackground(successEl);
+            }
+        }
+        
+        const dangerEl = document.getElementById('brand-color-danger');
+        if (dangerEl) {
+            dangerEl.value = theme.colors.danger || '#dc3545';
+            if (typeof updateColorSwatchBackground === 'function') {
+                updateColorSwatchBackground(dangerEl);
+            }
+        }
+        
+        const warningEl = document.getElementById('brand-color-warning');
+        if (warningEl) {
+            warningEl.value = theme.colors.warning || '#ffc107';
+            if (typeof updateColorSwatchBackground === 'function') {
+                updateColorSwatchBackground(warningEl);
+            }
+        }
+        
+        const infoEl = document.getElementById('brand-color-info');
+        if (infoEl) {
+            infoEl.value = theme.colors.info || '#0dcaf0';
+            if (typeof updateColorSwatchBackground === 'function') {
+                updateColorSwatchBackground(infoEl);
+            }
+        }
+        
+        const radiusEl = document.getElementById('brand-border-radius');
+        if (radiusEl) radiusEl.value = theme.borderRadius;
+        
+        const fontEl = document.getElementById('brand-font-size');
+        if (fontEl) fontEl.value = theme.fontSize;
+        
+        const shadowEl = document.getElementById('brand-shadow');
+        if (shadowEl) shadowEl.value = theme.shadow;
+        
+        const cssEl = document.getElementById('brand-css');
+        if (cssEl && theme.css) cssEl.value = theme.css;
+    } catch (e) {
+        console.warn('Error updating theme form fields:', e);
+    }
+}
+
+/**
+ * Override saveBranding to also persist locally
+ * (This extends the existing saveBranding function)
+ */
+const originalSaveBranding = window.saveBranding;
+if (typeof originalSaveBranding === 'function') {
+    window.saveBranding = function() {
+        // Call original save
+        originalSaveBranding.call(this);
+        
+        // Also persist to localStorage after a brief delay
+        setTimeout(() => {
+            const theme = getThemeObject ? getThemeObject() : null;
+            if (theme) {
+                persistThemeLocally(theme);
+            }
+        }, 500);
+    };
+}
+
+/**
+ * Clear persisted theme
+ */
+function clearPersistedTheme() {
+    try {
+        localStorage.removeItem(THEME_STORAGE_KEY);
+    } catch (e) {
+        console.warn('Failed to clear persisted theme:', e);
+    }
+}
+
+/**
+ * Export current persisted theme data
+ */
+function exportPersistedTheme() {
+    const theme = getPersistedTheme();
+    if (!theme) {
+        console.warn('No persisted theme found');
+        return null;
+    }
+    return theme;
+}
+
+/**
+ * Sync theme across browser tabs
+ * Listens for localStorage changes from other tabs
+ */
+window.addEventListener('storage', function(e) {
+    if (e.key === THEME_STORAGE_KEY && e.newValue) {
+        try {
+            const data = JSON.parse(e.newValue);
+            if (data && data.theme) {
+                console.log('Theme updated from another tab');
+                updateThemeFormFields(data.theme);
+                if (typeof applyThemeStyles === 'function') {
+                    applyThemeStyles(data.theme);
+                }
+            }
+        } catch (err) {
+            console.warn('Error syncing theme from another tab:', err);
+        }
+    }
+});
+
+// ==================== THEME STYLING FUNCTIONS ====================
+// These functions apply theme colors to all dashboard elements
+
+/**
+ * Calculate if a color is light or dark for text contrast
+ */
+function isLightColor(hex) {
+  if (!hex || typeof hex !== 'string') return true;
+  const cleanHex = hex.replace('#', '').trim();
+  if (!/^[0-9A-Fa-f]{6}$/.test(cleanHex)) return true;
+  
+  const num = parseInt(cleanHex, 16);
+  const r = (num >> 16) & 255;
+  const g = (num >> 8) & 255;
+  const b = num & 255;
+  
+  // Calculate luminance using relative luminance formula
+  const luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255;
+  return luminance > 0.5;
+}
+
+/**
+ * Get high contrast text color (white or dark gray) based on background
+ */
+function getContrastText(bgHex) {
+  return isLightColor(bgHex) ? '#1a1a1a' : '#ffffff';
+}
+
+/**
+ * Adjust color brightness
+ */
+function adjustColor(hex, percent) {
+  if (!hex || typeof hex !== 'string') return '#0d6efd';
+  const cleanHex = hex.replace('#', '').trim();
+  if (!/^[0-9A-Fa-f]{6}$/.test(cleanHex)) return hex;
+  
+  const num = parseInt(cleanHex, 16);
+  const amt = Math.round(2.55 * percent);
+  const R = Math.max(0, Math.min(255, (num >> 16) + amt));
+  const G = Math.max(0, Math.min(255, ((num >> 8) & 0x00FF) + amt));
+  const B = Math.max(0, Math.min(255, (num & 0x0000FF) + amt));
+  return '#' + (0x1000000 + (R << 16) + (G << 8) + B).toString(16).slice(1);
+}
+
+/**
+ * Apply theme styles to the entire dashboard
+ */
+function applyThemeStyles(theme) {
+  if (!theme) theme = {};
+  if (!theme.colors) theme.colors = {};
+  if (!theme.borderRadius) theme.borderRadius = '8px';
+  if (!theme.fontSize) theme.fontSize = '100%';
+  if (!theme.shadow) theme.shadow = 'normal';
+  
+  let style = document.getElementById('custom-theme-css');
+  if (!style) {
+    style = document.createElement('style');
+    style.id = 'custom-theme-css';
+    style.setAttribute('data-priority', 'high');
+    document.head.appendChild(style);
+  }
+  
+  const shadowMap = {
+    none: 'none',
+    light: '0 1px 3px rgba(0,0,0,0.1)',
+    normal: '0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.24)',
+    strong: '0 10px 40px rgba(0,0,0,0.3)'
+  };
+  
+  const primary = theme.colors.primary || '#0d6efd';
+  const secondary = theme.colors.secondary || '#6c757d';
+  const success = theme.colors.success || '#198754';
+  const danger = theme.colors.danger || '#dc3545';
+  const warning = theme.colors.warning || '#ffc107';
+  const info = theme.colors.info || '#0dcaf0';
+  
+  // Calculate text colors for high contrast
+  const primaryText = getContrastText(primary);
+  const secondaryText = getContrastText(secondary);
+  const successText = getContrastText(success);
+  const dangerText = getContrastText(danger);
+  const warningText = getContrastText(warning);
+  const infoText = getContrastText(info);
+  
+  // Calculate light background color (95% lighter version of primary)
+  const bgLight = adjustColor(primary, 85);
+  const bgLightText = adjustColor(primary, -60);
+  const bgDark = adjustColor(primary, -90);
+  
+  let css = `:root {
+    --bs-primary: ${primary} !important;
+    --bs-secondary: ${secondary} !important;
+    --bs-success: ${success} !important;
+    --bs-danger: ${danger} !important;
+    --bs-warning: ${warning} !important;
+    --bs-info: ${info} !important;
+    --bs-light: ${bgLight} !important;
+    --bs-dark: ${bgDark} !important;
+    --bs-primary-text: ${primaryText} !important;
+    --bs-secondary-text: ${secondaryText} !important;
+    --bs-success-text: ${successText} !important;
+    --bs-danger-text: ${dangerText} !important;
+    --bs-warning-text: ${warningText} !important;
+    --bs-info-text: ${infoText} !important;
+  }
+  
+  /* Basic elements */
+  .card { border-radius: ${theme.borderRadius} !important; box-shadow: ${shadowMap[theme.shadow] || shadowMap.normal} !important; }
+  body { font-size: ${theme.fontSize} !important; }
+  .bg-light { background-color: ${bgLight} !important; }
+  .bg-light-text { color: ${bgLightText} !important; }
+  .text-light { color: ${adjustColor(primary, -80)} !important; }
+  
+  /* Primary button and elements */
+  .btn-primary { background-color: ${primary} !important; border-color: ${primary} !important; color: ${primaryText} !important; }
+  .btn-primary:hover { background-color: ${adjustColor(primary, -20)} !important; border-color: ${adjustColor(primary, -20)} !important; color: ${primaryText} !important; }
+  .btn-primary:focus { color: ${primaryText} !important; }
+  .btn-primary:active { color: ${primaryText} !important; }
+  .btn-outline-primary { color: ${primary} !important; border-color: ${primary} !important; }
+  .btn-outline-primary:hover { background-color: ${primary} !important; color: ${primaryText} !important; border-color: ${primary} !important; }
+  
+  /* Secondary button and elements */
+  .btn-secondary { background-color: ${secondary} !important; border-color: ${secondary} !important; color: ${secondaryText} !important; }
+  .btn-secondary:hover { background-color: ${adjustColor(secondary, -20)} !important; border-color: ${adjustColor(secondary, -20)} !important; color: ${secondaryText} !important; }
+  .btn-outline-secondary { color: ${secondary} !important; border-color: ${secondary} !important; }
+  .btn-outline-secondary:hover { background-color: ${secondary} !important; color: ${secondaryText} !important; border-color: ${secondary} !important; }
+  
+  /* Success button and elements */
+  .btn-success { background-color: ${success} !important; border-color: ${success} !important; color: ${successText} !important; }
+  .btn-success:hover { background-color: ${adjustColor(success, -20)} !important; border-color: ${adjustColor(success, -20)} !important; color: ${successText} !important; }
+  .btn-outline-success { color: ${success} !important; border-color: ${success} !important; }
+  .btn-outline-success:hover { background-color: ${success} !important; color: ${successText} !important; border-color: ${success} !important; }
+  
+  /* Danger button and elements */
+  .btn-danger { background-color: ${danger} !important; border-color: ${danger} !important; color: ${dangerText} !important; }
+  .btn-danger:hover { background-color: ${adjustColor(danger, -20)} !important; border-color: ${adjustColor(danger, -20)} !important; color: ${dangerText} !important; }
+  .btn-outline-danger { color: ${danger} !important; border-color: ${danger} !important; }
+  .btn-outline-danger:hover { background-color: ${danger} !important; color: ${dangerText} !important; border-color: ${danger} !important; }
+  
+  /* Warning button and elements */
+  .btn-warning { background-color: ${warning} !important; border-color: ${warning} !important; color: ${warningText} !important; }
+  .btn-warning:hover { background-color: ${adjustColor(warning, -20)} !important; border-color: ${adjustColor(warning, -20)} !important; color: ${warningText} !important; }
+  .btn-outline-warning { color: ${warning} !important; border-color: ${warning} !important; }
+  .btn-outline-warning:hover { background-color: ${warning} !important; color: ${warningText} !important; border-color: ${warning} !important; }
+  
+  /* Info button and elements */
+  .btn-info { background-color: ${info} !important; border-color: ${info} !important; color: ${infoText} !important; }
+  .btn-info:hover { background-color: ${adjustColor(info, -20)} !important; border-color: ${adjustColor(info, -20)} !important; color: ${infoText} !important; }
+  .btn-outline-info { color: ${info} !important; border-color: ${info} !important; }
+  .btn-outline-info:hover { background-color: ${info} !important; color: ${infoText} !important; border-color: ${info} !important; }
+  
+  /* Badge colors */
+  .badge-primary { background-color: ${primary} !important; color: ${primaryText} !important; }
+  .badge-secondary { background-color: ${secondary} !important; color: ${secondaryText} !important; }
+  .badge-success { background-color: ${success} !important; color: ${successText} !important; }
+  .badge-danger { background-color: ${danger} !important; color: ${dangerText} !important; }
+  .badge-warning { background-color: ${warning} !important; color: ${warningText} !important; }
+  .badge-info { background-color: ${info} !important; color: ${infoText} !important; }
+  
+  /* Alert colors */
+  .alert-primary { background-color: ${adjustColor(primary, 90)} !important; border-color: ${primary} !important; color: ${adjustColor(primary, -40)} !important; }
+  .alert-secondary { background-color: ${adjustColor(secondary, 85)} !important; border-color: ${secondary} !important; color: ${adjustColor(secondary, -40)} !important; }
+  .alert-success { background-color: ${adjustColor(success, 85)} !important; border-color: ${success} !important; color: ${adjustColor(success, -40)} !important; }
+  .alert-danger { background-color: ${adjustColor(danger, 85)} !important; border-color: ${danger} !important; color: ${adjustColor(danger, -40)} !important; }
+  .alert-warning { background-color: ${adjustColor(warning, 85)} !important; border-color: ${warning} !important; color: ${adjustColor(warning, -40)} !important; }
+  .alert-info { background-color: ${adjustColor(info, 85)} !important; border-color: ${info} !important; color: ${adjustColor(info, -40)} !important; }
+  
+  /* Card headers */
+  .card-header { background-color: ${primary} !important; color: ${primaryText} !important; border-color: ${primary} !important; }
+  .card-header .btn { color: ${primaryText} !important; }
+  .card-header a { color: ${primaryText} !important; text-decoration: underline; }
+  
+  /* Links and text */
+  a { color: ${primary} !important; }
+  a:hover { color: ${adjustColor(primary, -20)} !important; }
+  .text-primary { color: ${primary} !important; }
+  .text-secondary { color: ${secondary} !important; }
+  .text-success { color: ${success} !important; }
+  .text-danger { color: ${danger} !important; }
+  .text-warning { color: ${warning} !important; }
+  .text-info { color: ${info} !important; }
+  
+  /* Backgrounds with text */
+  .bg-primary { background-color: ${primary} !important; color: ${primaryText} !important; }
+  .bg-secondary { background-color: ${secondary} !important; color: ${secondaryText} !important; }
+  .bg-success { background-color: ${success} !important; color: ${successText} !important; }
+  .bg-danger { background-color: ${danger} !important; color: ${dangerText} !important; }
+  .bg-warning { background-color: ${warning} !important; color: ${warningText} !important; }
+  .bg-info { background-color: ${info} !important; color: ${infoText} !important; }
+  
+  /* Borders */
+  .border { border-color: ${adjustColor(secondary, -30)} !important; }
+  .border-primary { border-color: ${primary} !important; }
+  .border-secondary { border-color: ${secondary} !important; }
+  .border-success { border-color: ${success} !important; }
+  .border-danger { border-color: ${danger} !important; }
+  .border-warning { border-color: ${warning} !important; }
+  .border-info { border-color: ${info} !important; }
+  
+  /* Progress bars */
+  .progress-bar { background-color: ${primary} !important; }
+  .bg-success .progress-bar { background-color: ${success} !important; }
+  .bg-danger .progress-bar { background-color: ${danger} !important; }
+  .bg-warning .progress-bar { background-color: ${warning} !important; }
+  .bg-info .progress-bar { background-color: ${info} !important; }
+  
+  /* Table elements */
+  .table-primary { background-color: ${adjustColor(primary, 85)} !important; }
+  .table-secondary { background-color: ${adjustColor(secondary, 85)} !important; }
+  .table-success { background-color: ${adjustColor(success, 85)} !important; }
+  .table-danger { background-color: ${adjustColor(danger, 85)} !important; }
+  .table-warning { background-color: ${adjustColor(warning, 85)} !important; }
+  .table-info { background-color: ${adjustColor(info, 85)} !important; }
+  .table-hover tbody tr:hover { background-color: ${adjustColor(primary, 90)} !important; }
+  
+  /* Form elements */
+  .form-control:focus { border-color: ${primary} !important; box-shadow: 0 0 0 0.2rem ${adjustColor(primary, 85)} !important; }
+  .form-control-color { border-color: ${primary} !important; }
+  .form-check-input:checked { background-color: ${primary} !important; border-color: ${primary} !important; }
+  .form-check-input:focus { border-color: ${primary} !important; box-shadow: 0 0 0 0.2rem ${adjustColor(primary, 85)} !important; }
+  
+  /* Status indicators */
+  .status-active { color: ${success} !important; }
+  .status-inactive { color: ${danger} !important; }
+  .status-pending { color: ${warning} !important; }
+  .status-info { color: ${info} !important; }
+  
+  /* List group */
+  .list-group-item-primary { background-color: ${adjustColor(primary, 90)} !important; color: ${primary} !important; }
+  .list-group-item-primary.active { background-color: ${primary} !important; color: ${primaryText} !important; border-color: ${primary} !important; }
+  .list-group-item-success { background-color: ${adjustColor(success, 90)} !important; color: ${success} !important; }
+  .list-group-item-success.active { background-color: ${success} !important; color: ${successText} !important; border-color: ${success} !important; }
+  
+  /* Navbar and tabs */
+  .nav-tabs .nav-link.active { border-color: ${primary} !important; color: ${primary} !important; }
+  .nav-pills .nav-link.active { background-color: ${primary} !important; color: ${primaryText} !important; }
+  
+  /* Breadcrumb */
+  .breadcrumb { background-color: ${bgLight} !important; }
+  .breadcrumb .active { color: ${primary} !important; }
+  
+  /* Pagination */
+  .page-link { color: ${primary} !important; }
+  .page-link:hover { background-color: ${bgLight} !important; }
+  .page-item.active .page-link { background-color: ${primary} !important; border-color: ${primary} !important; color: ${primaryText} !important; }
+  
+  /* Spinners and loaders */
+  .spinner-border { border-color: ${bgLight} !important; border-right-color: ${primary} !important; }
+  .spinner-grow { background-color: ${primary} !important; }
+  `;
+  
+  if (theme.css) {
+    css += '\n' + theme.css;
+  }
+  
+  style.textContent = css;
+  
+  // Update dashboard logo when theme is applied
+  if (typeof updateDashboardLogo === 'function') {
+    updateDashboardLogo(theme);
+  }
+}
@@ -0,0 +1,141 @@
+import pytest
+
+from OrganizerDashboard.auth import auth
+
+
+class _CountingManager:
+    def __init__(self, valid):
+        self.valid = valid
+        self.calls = 0
+
+    def authenticate(self, username, password):
+        self.calls += 1
+        return (username, password) == self.valid
+
+
+@pytest.fixture()
+def manager(monkeypatch):
+    mgr = _CountingManager(('admin', 'secret'))
+    monkeypatch.setattr(auth, '_auth_manager', mgr)
+    auth.invalidate_auth_cache()
+    yield mgr
+    auth.invalidate_auth_cache()
+
+
+def test_check_auth_caches_verification(manager):
+    assert auth.check_auth('admin', 'secret') is True
+    assert auth.check_auth('admin', 'secret') is True
+    assert manager.calls == 1
+    assert auth.check_auth('admin', 'wrong') is False
+    assert manager.calls == 2
+
+
+def test_invalidate_auth_cache_forces_reverify(manager):
+    assert auth.check_auth('admin', 'secret') is True
+    manager.valid = ('admin', 'rotated')
+    auth.invalidate_auth_cache()
+    assert auth.check_auth('admin', 'secret') is False
+    assert manager.calls == 2
+
+
+def test_verified_password_skips_kdf_after_ttl(manager, monkeypatch):
+    assert auth.check_auth('admin', 'secret') is True
+    # Expire the TTL entries but keep the per-user HMAC of the verified password
+    monkeypatch.setattr(auth, '_auth_cache', {})
+    assert auth.check_auth('admin', 'secret') is True
+    assert manager.calls == 1
+    assert auth.check_auth('admin', 'other') is False
+    assert manager.calls == 2
+
+
+def test_verified_password_expires(manager, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(auth.time, 'monotonic', lambda: clock[0])
+    assert auth.check_auth('admin', 'secret') is True
+    # Password revoked outside the dashboard (LDAP/Windows), no invalidation
+    manager.valid = ('admin', 'rotated')
+    clock[0] += auth._AUTH_CACHE_TTL + 1
+    assert auth.check_auth('admin', 'secret') is True
+    assert manager.calls == 1
+    clock[0] += auth._VERIFIED_MAC_TTL
+    assert auth.check_auth('admin', 'secret') is False
+    assert manager.calls == 2
+
+
+def test_parse_basic_header():
+    import base64
+    token = base64.b64encode(b'admin:pa:ss').decode()
+    assert auth._parse_basic(f'Basic {token}') == ('admin', 'pa:ss')
+    assert auth._parse_basic(f'basic {token}') == ('admin', 'pa:ss')
+    assert auth._parse_basic('Bearer abc') is None
+    assert auth._parse_basic('Basic !!notbase64') is None
+    assert auth._parse_basic('Basic ' + base64.b64encode(b'nocolon').decode()) is None
+
+
+def test_invalidate_auth_cache_drops_parsed_headers():
+    import base64
+    auth._parse_basic('Basic ' + base64.b64encode(b'admin:old').decode())
+    assert auth._parse_basic.cache_info().currsize > 0
+    auth.invalidate_auth_cache()
+    assert auth._parse_basic.cache_info().currsize == 0
+
+
+def test_basic_login_session_is_not_remembered(monkeypatch):
+    calls = []
+    monkeypatch.setattr(auth, 'login_user', lambda user, **kwargs: calls.append(kwargs))
+    auth._establish_session('admin')
+    assert calls == [{'remember': False}]
+
+
+def test_rate_limit_rejects_excess_requests_per_client():
+    from flask import Flask
+    app = Flask(__name__)
+
+    @app.route('/guarded')
+    @auth.rate_limit(2, 60)
+    def guarded():
+        return 'ok'
+
+    client = app.test_client()
+    assert client.get('/guarded').status_code == 200
+    assert client.get('/guarded').status_code == 200
+    resp = client.get('/guarded')
+    assert resp.status_code == 429
+    assert int(resp.headers['Retry-After']) >= 1
+    # Another client address has its own budget
+    assert client.get('/guarded', environ_base={'REMOTE_ADDR': '10.0.0.2'}).status_code == 200
+
+
+def test_rate_limit_drops_idle_client_buckets(monkeypatch):
+    from flask import Flask
+    app = Flask(__name__)
+
+    @app.route('/guarded')
+    @auth.rate_limit(2, 60)
+    def guarded():
+        return 'ok'
+
+    clock = [1000.0]
+    monkeypatch.setattr(auth.time, 'monotonic', lambda: clock[0])
+    client = app.test_client()
+    for i in range(5):
+        assert client.get('/guarded', environ_base={'REMOTE_ADDR': f'10.0.0.{i}'}).status_code == 200
+    buckets = app.extensions['rate_limits']
+    assert len(buckets) == 5
+    clock[0] += 61
+    assert client.get('/guarded').status_code == 200
+    assert list(buckets) == [('guarded', '127.0.0.1')]
+
+
+def test_bcrypt_cost_ignores_non_numeric_env(monkeypatch):
+    monkeypatch.setenv('BCRYPT_COST', 'high')
+    assert auth._bcrypt_cost() == 10
+    monkeypatch.setenv('BCRYPT_COST', '2')
+    assert auth._bcrypt_cost() == 4
+
+
+def test_verify_password_accepts_hash_of_any_cost():
+    import bcrypt
+    hashed = bcrypt.hashpw(b'pw', bcrypt.gensalt(rounds=4))
+    assert auth.verify_password('pw', hashed)
+    assert not auth.verify_password('nope', hashed)
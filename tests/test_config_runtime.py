@@ -0,0 +1,188 @@
+import json
+import os
+
+import pytest
+
+from OrganizerDashboard import config_runtime
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_get_config_reloads_in_place_on_external_edit(tmp_path, monkeypatch):
+    cfg_path = tmp_path / 'organizer_config.json'
+    dash_path = tmp_path / 'dashboard_config.json'
+    cfg_path.write_text(json.dumps({"logs_dir": "a"}), encoding='utf-8')
+    monkeypatch.setattr(config_runtime, '_mtimes', {})
+    config_runtime.initialize(str(cfg_path), str(dash_path), {"watch_folder": "w"}, {"users": []})
+
+    cfg = config_runtime.get_config()
+    assert cfg == {"watch_folder": "w", "logs_dir": "a"}
+
+    cfg_path.write_text(json.dumps({"logs_dir": "b"}), encoding='utf-8')
+    _bump_mtime(cfg_path)
+    assert config_runtime.get_config() is cfg
+    assert cfg == {"watch_folder": "w", "logs_dir": "b"}
+
+
+def test_dashboard_reloads_update_the_live_dict(tmp_path, monkeypatch):
+    cfg_path = tmp_path / 'organizer_config.json'
+    dash_path = tmp_path / 'dashboard_config.json'
+    dash_path.write_text(json.dumps({"users": [{"username": "a"}], "layout": {}}), encoding='utf-8')
+    monkeypatch.setattr(config_runtime, '_mtimes', {})
+    config_runtime.initialize(str(cfg_path), str(dash_path), {}, {"roles": {}})
+    dash = config_runtime.get_dashboard_config()
+
+    dash_path.write_text(json.dumps({"users": []}), encoding='utf-8')
+    _bump_mtime(dash_path)
+    assert config_runtime.get_dashboard_config() is dash
+    assert dash == {"users": [], "roles": {}}
+
+    dash_path.write_text(json.dumps({"users": [{"username": "b"}]}), encoding='utf-8')
+    assert config_runtime.reload_dashboard_config() is dash
+    assert dash == {"users": [{"username": "b"}], "roles": {}}
+
+
+def test_write_json_is_atomic_and_not_reparsed(tmp_path, monkeypatch):
+    cfg_path = tmp_path / 'organizer_config.json'
+    monkeypatch.setattr(config_runtime, '_mtimes', {})
+    config_runtime.initialize(str(cfg_path), str(tmp_path / 'dash.json'), {}, {})
+    cfg = config_runtime.get_config()
+    cfg["x"] = 1
+    config_runtime.save_config()
+    assert json.loads(cfg_path.read_text(encoding='utf-8')) == {"x": 1}
+    assert os.listdir(tmp_path) == ['organizer_config.json']
+    assert not config_runtime._changed_on_disk(str(cfg_path))
+
+
+def test_read_json_parses_mapped_file(tmp_path):
+    path = tmp_path / 'cfg.json'
+    path.write_text(json.dumps({"routes": {"Images": ["jpg"]}}), encoding='utf-8')
+    assert config_runtime.read_json(str(path)) == {"routes": {"Images": ["jpg"]}}
+    empty = tmp_path / 'empty.json'
+    empty.write_bytes(b'')
+    with pytest.raises(ValueError):
+        config_runtime.read_json(str(empty))
+
+
+def test_deferred_saves_write_each_file_once(tmp_path, monkeypatch):
+    cfg_path = tmp_path / 'organizer_config.json'
+    monkeypatch.setattr(config_runtime, '_mtimes', {})
+    config_runtime.initialize(str(cfg_path), str(tmp_path / 'dash.json'), {}, {})
+    writes = []
+    real_write = config_runtime.write_json
+    monkeypatch.setattr(config_runtime, 'write_json', lambda p, d: (writes.append(p), real_write(p, d)))
+
+    cfg = config_runtime.get_config()
+    with config_runtime.deferred_saves():
+        cfg["dashboard_pass_hash"] = "h"
+        config_runtime.save_config()
+        cfg["dashboard_user"] = "admin"
+        config_runtime.save_config()
+        config_runtime.save_dashboard_config()
+        assert writes == []
+    assert writes == [str(cfg_path), str(tmp_path / 'dash.json')]
+    assert json.loads(cfg_path.read_text(encoding='utf-8')) == {"dashboard_pass_hash": "h", "dashboard_user": "admin"}
+
+
+def test_write_json_async_keeps_latest_snapshot(tmp_path):
+    path = str(tmp_path / 'organizer_config.json')
+    data = {"watch_folder": "a"}
+    config_runtime.write_json_async(path, data)
+    data["watch_folder"] = "b"
+    config_runtime.write_json_async(path, data)
+    # Later in-memory edits don't leak into a queued snapshot
+    data["watch_folder"] = "c"
+    assert config_runtime.flush_writes(timeout=5)
+    assert json.loads(open(path, encoding='utf-8').read()) == {"watch_folder": "b"}
+    assert os.listdir(tmp_path) == ['organizer_config.json']
+
+
+def test_concurrent_writes_use_separate_temp_files(tmp_path):
+    import threading
+    path = str(tmp_path / 'organizer_config.json')
+    errors = []
+
+    def save(n):
+        for i in range(50):
+            try:
+                config_runtime.write_json(path, {"writer": n, "i": i})
+            except OSError as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert os.listdir(tmp_path) == ['organizer_config.json']
+
+
+def test_write_json_skips_unchanged_content(tmp_path, monkeypatch):
+    path = tmp_path / 'organizer_config.json'
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(config_runtime.os, 'replace', lambda src, dst: replaced.append(dst) or real_replace(src, dst))
+    config_runtime.write_json(str(path), {"logs_dir": "C:/logs"})
+    config_runtime.write_json(str(path), {"logs_dir": "C:/logs"})
+    assert len(replaced) == 1
+
+    # Edited by someone else since: the save goes through
+    path.write_text('{}', encoding='utf-8')
+    _bump_mtime(path)
+    config_runtime.write_json(str(path), {"logs_dir": "C:/logs"})
+    assert len(replaced) == 2
+    assert json.loads(path.read_text(encoding='utf-8')) == {"logs_dir": "C:/logs"}
+
+
+def test_live_config_does_not_share_nested_defaults(tmp_path, monkeypatch):
+    cfg_path = tmp_path / 'organizer_config.json'
+    cfg_path.write_text(json.dumps({"logs_dir": "a"}), encoding='utf-8')
+    monkeypatch.setattr(config_runtime, '_mtimes', {})
+    defaults = {"routes": {"Images": ["jpg"]}, "logs_dir": "d"}
+    config_runtime.initialize(str(cfg_path), str(tmp_path / 'dash.json'), defaults, {})
+
+    config_runtime.get_config()["routes"]["Images"].append("png")
+    assert defaults["routes"]["Images"] == ["jpg"]
+
+    # Same after an external edit brings the defaults back in
+    cfg_path.write_text(json.dumps({"logs_dir": "b"}), encoding='utf-8')
+    _bump_mtime(cfg_path)
+    config_runtime.get_config()["routes"]["Images"].append("gif")
+    assert defaults["routes"]["Images"] == ["jpg"]
+
+
+def test_dashboard_version_tracks_loads_and_saves(tmp_path, monkeypatch):
+    dash_path = tmp_path / 'dash.json'
+    dash_path.write_text(json.dumps({"users": []}), encoding='utf-8')
+    monkeypatch.setattr(config_runtime, '_mtimes', {})
+    config_runtime.initialize(str(tmp_path / 'cfg.json'), str(dash_path), {}, {})
+    v = config_runtime.get_dashboard_version()
+    config_runtime.get_dashboard_config()
+    assert config_runtime.get_dashboard_version() == v
+
+    config_runtime.save_dashboard_config()
+    assert config_runtime.get_dashboard_version() > v
+    v = config_runtime.get_dashboard_version()
+
+    dash_path.write_text(json.dumps({"users": [{"username": "a"}]}), encoding='utf-8')
+    _bump_mtime(dash_path)
+    config_runtime.get_dashboard_config()
+    assert config_runtime.get_dashboard_version() > v
+
+
+def test_save_dashboard_config_create_only(tmp_path, monkeypatch):
+    dash_path = tmp_path / 'dash.json'
+    monkeypatch.setattr(config_runtime, '_mtimes', {})
+    config_runtime.initialize(str(tmp_path / 'cfg.json'), str(dash_path), {}, {"users": []})
+    config_runtime.save_dashboard_config(create_only=True)
+    assert json.loads(dash_path.read_text(encoding='utf-8')) == {"users": []}
+
+    dash_path.write_text('{"users": ["kept"]}', encoding='utf-8')
+    with pytest.raises(FileExistsError):
+        config_runtime.save_dashboard_config(create_only=True)
+    assert dash_path.read_text(encoding='utf-8') == '{"users": ["kept"]}'
+    assert sorted(os.listdir(tmp_path)) == ['dash.json']
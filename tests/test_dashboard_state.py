@@ -0,0 +1,18 @@
+from OrganizerDashboard.routes import dashboard_state
+
+
+def test_dashboard_state_merges_sections(monkeypatch):
+    monkeypatch.setattr(dashboard_state, 'collect_metrics', lambda: {"ram_percent": 10})
+    monkeypatch.setattr(dashboard_state, 'network_payload', lambda: {"upload_rate_b": 0})
+    monkeypatch.setattr(dashboard_state, 'get_drives', lambda: [{"device": "C:"}])
+    monkeypatch.setattr(dashboard_state, 'get_top_processes', lambda: [])
+
+    dashboard_state.collect_dashboard_state.cache_clear()
+    try:
+        state = dashboard_state.collect_dashboard_state()
+        assert state == {"ram_percent": 10, "network": {"upload_rate_b": 0},
+                         "drives": [{"device": "C:"}], "tasks": []}
+        # Polls within the TTL share the snapshot (and its encoded body)
+        assert dashboard_state.collect_dashboard_state() is state
+    finally:
+        dashboard_state.collect_dashboard_state.cache_clear()
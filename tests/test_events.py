@@ -0,0 +1,29 @@
+from OrganizerDashboard.routes import events
+
+
+def test_metrics_events_sends_changes_and_keepalives(monkeypatch):
+    snapshots = iter([{"cpu": 1}, {"cpu": 1}, {"cpu": 2}])
+    monkeypatch.setattr(events, 'collect_metrics', lambda: next(snapshots))
+    monkeypatch.setattr(events.time, 'sleep', lambda s: None)
+
+    gen = events._metrics_events()
+    assert next(gen) == 'event: metrics\ndata: {"cpu":1}\n\n'
+    assert next(gen) == ': keep-alive\n\n'
+    assert next(gen) == 'event: metrics\ndata: {"cpu":2}\n\n'
+
+
+def test_sse_response_caps_open_streams(monkeypatch):
+    import threading
+    from flask import Flask
+    from OrganizerDashboard.helpers import helpers
+    monkeypatch.setattr(helpers, '_stream_slots', threading.BoundedSemaphore(1))
+
+    with Flask(__name__).test_request_context():
+        first = helpers.sse_response(iter(["data: a\n\n"]))
+        assert first.mimetype == 'text/event-stream'
+        busy = helpers.sse_response(iter([]))
+        assert busy.status_code == 503
+        assert busy.headers['Retry-After'] == '10'
+        # Closing the first stream frees its slot
+        first.close()
+        assert helpers.sse_response(iter([])).status_code == 200
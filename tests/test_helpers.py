@@ -0,0 +1,475 @@
+import os
+import json
+
+from OrganizerDashboard.helpers import helpers
+
+
+def test_load_dashboard_json_reparses_only_on_mtime_change(tmp_path, monkeypatch):
+    path = tmp_path / 'downloads_dashboard.json'
+    path.write_text(json.dumps({"moved": 1}), encoding='utf-8')
+    monkeypatch.setattr(helpers, 'DASHBOARD_JSON', str(path))
+    monkeypatch.setattr(helpers, '_dashboard_json_cache', {"mtime_ns": None, "data": {}})
+
+    first = helpers.load_dashboard_json()
+    assert first == {"moved": 1}
+    # Same mtime -> same cached object
+    assert helpers.load_dashboard_json() is first
+
+    path.write_text(json.dumps({"moved": 2}), encoding='utf-8')
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert helpers.load_dashboard_json() == {"moved": 2}
+
+
+def test_load_dashboard_json_missing_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(helpers, 'DASHBOARD_JSON', str(tmp_path / 'missing.json'))
+    assert helpers.load_dashboard_json() == {}
+
+
+def test_ojsonify_returns_json_response():
+    resp = helpers.ojsonify({"cpu": 1.5, "name": "x"}, status=201)
+    assert resp.status_code == 201
+    assert resp.mimetype == 'application/json'
+    assert json.loads(resp.get_data()) == {"cpu": 1.5, "name": "x"}
+
+
+def test_sampler_first_get_samples_synchronously():
+    from OrganizerDashboard.helpers.samplers import Sampler
+    calls = []
+    s = Sampler("test", lambda: calls.append(1) or len(calls), interval=3600)
+    assert s.get() == 1
+    assert s.get() == 1
+    assert s._thread is not None and s._thread.daemon
+
+
+def test_sampler_start_samples_in_background_and_get_waits():
+    import threading
+    from OrganizerDashboard.helpers.samplers import Sampler
+    release = threading.Event()
+    s = Sampler("test-bg", lambda: release.wait() and 7, interval=3600)
+    s.start()
+    assert s._thread is not None and s._value is None
+    release.set()
+    assert s.get() == 7
+
+
+def test_sampler_backs_off_while_unchanged(monkeypatch):
+    from OrganizerDashboard.helpers import samplers
+    values = iter([1, 1, 1, 1, 2, 2])
+    sleeps = []
+
+    def sleep(seconds):
+        if len(sleeps) == 6:
+            raise StopIteration
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(samplers.time, 'sleep', sleep)
+    s = samplers.Sampler("test-adaptive", lambda: next(values), interval=10, max_interval=40)
+    try:
+        s._run(sample_first=True)
+    except StopIteration:
+        pass
+    assert sleeps == [10, 20, 40, 40, 10, 20]
+
+
+def test_last_n_lines_normalized(tmp_path):
+    log = tmp_path / 'organizer_stdout.log'
+    log.write_text(''.join(f'line {i}\r\n' for i in range(10)), encoding='utf-8')
+    assert helpers.last_n_lines_normalized(str(log), 3) == 'line 7\nline 8\nline 9'
+    assert helpers.last_n_lines_normalized(str(tmp_path / 'nope.log')) == '(log file not found)'
+
+
+def test_compiled_template_is_cached_per_app(tmp_path):
+    from flask import Flask
+    (tmp_path / 'page.html').write_text('hi {{ name }}', encoding='utf-8')
+    app = Flask(__name__, template_folder=str(tmp_path))
+    with app.app_context():
+        tmpl = helpers.compiled_template('page.html')
+        assert helpers.compiled_template('page.html') is tmpl
+        assert tmpl.render(name='x') == 'hi x'
+
+
+def test_precompile_templates_fills_cache(tmp_path, monkeypatch):
+    from flask import Flask
+    (tmp_path / 'page.html').write_text('hi', encoding='utf-8')
+    (tmp_path / 'notes.txt').write_text('{{ broken', encoding='utf-8')
+    app = Flask(__name__, template_folder=str(tmp_path))
+    monkeypatch.setattr(helpers.threading.Thread, 'start', lambda self: self.run())
+    helpers.precompile_templates(app)
+    assert list(app.extensions["compiled_templates"]) == ['page.html']
+    with app.app_context():
+        assert helpers.compiled_template('page.html') is app.extensions["compiled_templates"]['page.html']
+
+
+def test_strip_indent_extension(tmp_path):
+    from flask import Flask
+    (tmp_path / 'page.html').write_text('<ul>\n    {% for i in items %}\n    <li>{{ i }}</li>\n    {% endfor %}\n</ul>', encoding='utf-8')
+    (tmp_path / 'form.html').write_text('<textarea>\n    keep</textarea>', encoding='utf-8')
+    app = Flask(__name__, template_folder=str(tmp_path))
+    app.jinja_env.add_extension(helpers.StripIndentExtension)
+    assert app.jinja_env.get_template('page.html').render(items=[1]) == '<ul>\n\n<li>1</li>\n\n</ul>'
+    assert app.jinja_env.get_template('form.html').render() == '<textarea>\n    keep</textarea>'
+
+
+def test_read_last_lines_reads_backwards_across_blocks(tmp_path):
+    path = tmp_path / 'big.log'
+    path.write_text(''.join(f'line {i}\n' for i in range(5000)), encoding='utf-8')
+    assert helpers.read_last_lines(str(path), 3, block=64) == ['line 4997', 'line 4998', 'line 4999']
+    assert helpers.read_last_lines(str(path), 0) == []
+    # Growing window: far more lines than one small block still come back intact
+    assert helpers.read_last_lines(str(path), 1000, block=64) == [f'line {i}' for i in range(4000, 5000)]
+
+
+def test_read_from_offset_returns_only_new_bytes(tmp_path):
+    path = tmp_path / 'out.log'
+    path.write_bytes(b'one\n')
+    text, end = helpers.read_from_offset(str(path), 0)
+    assert (text, end) == ('one\n', 4)
+    with open(path, 'ab') as f:
+        f.write(b'two\n')
+    assert helpers.read_from_offset(str(path), end) == ('two\n', 8)
+    # Truncated file -> restart from the beginning
+    path.write_bytes(b'x\n')
+    assert helpers.read_from_offset(str(path), 8) == ('x\n', 2)
+
+
+def test_sample_top_processes_returns_top_k_sorted():
+    from OrganizerDashboard.helpers import samplers
+    top = samplers._sample_top_processes()
+    assert len(top) <= samplers.TOP_PROCESSES
+    cpus = [p["cpu"] for p in top]
+    assert cpus == sorted(cpus, reverse=True)
+
+
+def test_proc_stat_ranking_parses_ticks(monkeypatch):
+    import io
+    from OrganizerDashboard.helpers import samplers
+    # comm with spaces and a ')' must not shift the utime/stime fields
+    stats = {
+        '/proc/10/stat': b'10 (python (a) b) S 1 10 10 0 -1 4194304 0 0 0 0 100 50 0 0 20 0 1 0\n',
+        '/proc/11/stat': b'11 (idle) S 1 11 11 0 -1 4194304 0 0 0 0 7 3 0 0 20 0 1 0\n',
+    }
+    ticks = {'/proc/10/stat': 0}
+
+    class Entry:
+        def __init__(self, name):
+            self.name = name
+
+    class Entries(list):
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    def fake_open(path, mode='r'):
+        data = stats[path]
+        if path == '/proc/10/stat':
+            data = data.replace(b' 100 50 ', f' {100 + ticks[path]} 50 '.encode())
+        return io.BytesIO(data)
+
+    clock = [1000.0]
+    monkeypatch.setattr(samplers.os, 'scandir', lambda path: Entries([Entry('10'), Entry('11'), Entry('self')]))
+    monkeypatch.setattr(samplers, 'open', fake_open, raising=False)
+    monkeypatch.setattr(samplers.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(samplers, '_CLK_TCK', 100)
+    monkeypatch.setattr(samplers, '_proc_prev', {"ticks": {}, "ts": None})
+
+    assert sorted(samplers._proc_stat_ranking()) == [(0.0, 10), (0.0, 11)]
+    ticks['/proc/10/stat'] = 50  # half a second of CPU over one second
+    clock[0] += 1.0
+    assert dict((pid, cpu) for cpu, pid in samplers._proc_stat_ranking()) == {10: 50.0, 11: 0.0}
+
+
+def test_public_ip_refresh_keeps_last_value(monkeypatch):
+    calls = []
+
+    class _Resp:
+        status_code = 200
+        text = '203.0.113.7\n'
+
+    class _Session:
+        def get(self, url, timeout):
+            calls.append(url)
+            if len(calls) > 1:
+                raise OSError('offline')
+            return _Resp()
+
+    monkeypatch.setattr(helpers, 'http_session', lambda: _Session())
+    monkeypatch.setattr(helpers, '_public_ip', {"value": None})
+    monkeypatch.setattr(helpers, 'start_public_ip_refresher', lambda: None)
+    # Reads never hit the network themselves
+    assert helpers.get_public_ip() == 'Unavailable'
+    assert calls == []
+    helpers._refresh_public_ip()
+    assert helpers.get_public_ip() == '203.0.113.7'
+    # A failed refresh falls back to the last known address
+    helpers._refresh_public_ip()
+    assert helpers.get_public_ip() == '203.0.113.7'
+    assert len(calls) == 2
+
+
+def test_skip_partition_only_for_empty_removable_media():
+    from collections import namedtuple
+    from OrganizerDashboard.helpers import samplers
+    Part = namedtuple('Part', 'device mountpoint fstype opts')
+    assert samplers._skip_partition(Part('D:\\', 'D:\\', '', 'cdrom'))
+    assert not samplers._skip_partition(Part('E:\\', 'E:\\', 'FAT32', 'rw,removable'))
+    assert not samplers._skip_partition(Part('/dev/sda1', '/', 'ext4', 'rw,relatime'))
+    assert samplers._skip_partition(Part('/dev/loop3', '/snap/core/1', 'squashfs', 'ro'))
+
+
+def test_drive_sampler_reuses_partition_list(monkeypatch):
+    from collections import namedtuple
+    from OrganizerDashboard.helpers import samplers
+    Part = namedtuple('Part', 'device mountpoint fstype opts')
+    Usage = namedtuple('Usage', 'total used free percent')
+    enumerations = []
+
+    def partitions(all=False):
+        enumerations.append(1)
+        return [Part('/dev/sda1', '/', 'ext4', 'rw')]
+
+    monkeypatch.setattr(samplers, '_partitions', {"list": None, "expires": 0.0})
+    monkeypatch.setattr(samplers.psutil, 'disk_partitions', partitions)
+    monkeypatch.setattr(samplers.psutil, 'disk_usage', lambda m: Usage(100, 40, 60, 40.0))
+    assert samplers._sample_drives()[0]["percent"] == 40.0
+    samplers._sample_drives()
+    assert len(enumerations) == 1
+
+
+def test_drive_sampler_leaves_out_hung_mounts(monkeypatch):
+    import threading
+    from collections import namedtuple
+    from OrganizerDashboard.helpers import samplers
+    Usage = namedtuple('Usage', 'total used free percent')
+    release = threading.Event()
+
+    def disk_usage(mountpoint):
+        if mountpoint == '/mnt/nfs':
+            release.wait()
+        return Usage(100, 40, 60, 40.0)
+
+    monkeypatch.setattr(samplers, 'DISK_USAGE_TIMEOUT', 0.05)
+    monkeypatch.setattr(samplers, '_pending_usage', {})
+    monkeypatch.setattr(samplers, '_mounted_partitions', lambda: [('srv:/x', '/mnt/nfs'), ('/dev/sda1', '/')])
+    monkeypatch.setattr(samplers.psutil, 'disk_usage', disk_usage)
+    try:
+        assert [d["mountpoint"] for d in samplers._sample_drives()] == ['/']
+        # Still hung: the earlier call is awaited again rather than a new one queued
+        pending = samplers._pending_usage['/mnt/nfs']
+        samplers._sample_drives()
+        assert samplers._pending_usage['/mnt/nfs'] is pending
+    finally:
+        release.set()
+    assert [d["mountpoint"] for d in samplers._sample_drives()] == ['/mnt/nfs', '/']
+
+
+def test_ttl_cache_reuses_result_until_expiry(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(helpers.time, 'monotonic', lambda: clock[0])
+    calls = []
+
+    @helpers.ttl_cache(2.0)
+    def probe():
+        calls.append(1)
+        return len(calls)
+
+    assert probe() == 1
+    clock[0] += 1.5
+    assert probe() == 1
+    clock[0] += 1.0
+    assert probe() == 2
+    probe.cache_clear()
+    assert probe() == 3
+
+
+def test_ttl_cache_collapses_concurrent_callers():
+    import threading
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    @helpers.ttl_cache(60.0)
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return 'payload'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow())) for _ in range(4)]
+    threads[0].start()
+    started.wait()
+    for t in threads[1:]:
+        t.start()
+    release.set()
+    for t in threads:
+        t.join()
+    assert results == ['payload'] * 4
+    assert len(calls) == 1
+
+
+def test_orjson_provider_matches_default_output():
+    from datetime import datetime, timezone
+    from flask import Flask
+    from flask.json.provider import DefaultJSONProvider
+    app = Flask(__name__)
+    app.json = helpers.OrjsonProvider(app)
+    default = DefaultJSONProvider(app)
+    obj = {"b": 1, "a": [1.5, None, "x"], "when": datetime(2024, 1, 2, tzinfo=timezone.utc)}
+    assert app.json.dumps(obj) == default.dumps(obj, separators=(',', ':'))
+    # Too wide for orjson: handled by the stdlib path
+    assert app.json.dumps({"n": 2 ** 70}) == '{"n": 1180591620717411303424}'
+    with app.app_context():
+        resp = app.json.response({"ok": True})
+    assert resp.mimetype == 'application/json'
+    assert json.loads(resp.get_data()) == {"ok": True}
+    assert app.json.loads(b'{"x": [1]}') == {"x": [1]}
+
+
+def test_revalidatable_answers_matching_etag_with_304():
+    from flask import Flask
+    app = Flask(__name__)
+
+    @app.route('/info')
+    def info():
+        return helpers.revalidatable(helpers.ojsonify({"hostname": "box"}))
+
+    client = app.test_client()
+    first = client.get('/info')
+    assert first.status_code == 200
+    assert first.cache_control.max_age == 60
+    etag = first.headers['ETag']
+    again = client.get('/info', headers={'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.get_data() == b''
+
+
+def test_find_organizer_proc_revalidates_cached_process(monkeypatch):
+    import contextlib
+
+    class FakeProc:
+        def __init__(self, name, cmdline, running=True):
+            self.info = {'name': name, 'cmdline': cmdline}
+            self.running = running
+
+        def oneshot(self):
+            return contextlib.nullcontext()
+
+        def is_running(self):
+            return self.running
+
+        def name(self):
+            return self.info['name']
+
+        def cmdline(self):
+            return self.info['cmdline']
+
+    organizer = FakeProc('python.exe', ['python', 'C:/app/Organizer.py'])
+    scans = []
+
+    def process_iter(attrs):
+        scans.append(attrs)
+        return iter([FakeProc('explorer.exe', []), organizer])
+
+    monkeypatch.setattr(helpers.psutil, 'process_iter', process_iter)
+    monkeypatch.setattr(helpers, '_organizer_proc', {"proc": None})
+    helpers.find_organizer_proc.cache_clear()
+    assert helpers.find_organizer_proc() is organizer
+    helpers.find_organizer_proc.cache_clear()
+    assert helpers.find_organizer_proc() is organizer
+    assert len(scans) == 1
+
+    # Organizer exited: the next call rescans
+    organizer.running = False
+    helpers.find_organizer_proc.cache_clear()
+    helpers.find_organizer_proc()
+    assert len(scans) == 2
+    helpers.find_organizer_proc.cache_clear()
+
+
+def test_ojsonify_snapshot_encodes_each_snapshot_once(monkeypatch):
+    from types import SimpleNamespace
+    from flask import Flask
+    calls = []
+    fake_orjson = SimpleNamespace(dumps=lambda obj: calls.append(obj) or json.dumps(obj).encode())
+    monkeypatch.setattr(helpers, 'orjson', fake_orjson)
+    monkeypatch.setattr(helpers, '_snapshot_bodies', {})
+    snapshot = [{"pid": 1, "cpu": 2.5}]
+    with Flask(__name__).app_context():
+        first = helpers.ojsonify_snapshot('tasks', snapshot)
+        second = helpers.ojsonify_snapshot('tasks', snapshot)
+        helpers.ojsonify_snapshot('tasks', [{"pid": 2, "cpu": 1.0}])
+    assert first.get_data() == second.get_data()
+    assert len(calls) == 2
+
+
+def test_iter_last_n_lines_normalized_sends_chunks(tmp_path):
+    log = tmp_path / 'organizer_stdout.log'
+    log.write_text(''.join(f'line {i}\r\n' for i in range(100)), encoding='utf-8')
+    chunks = list(helpers.iter_last_n_lines_normalized(str(log), 30, chunk_size=64))
+    assert 1 < len(chunks) < 30
+    assert ''.join(chunks) == '\n'.join(f'line {i}' for i in range(70, 100))
+
+
+def test_find_organizer_proc_asks_service_manager_first(monkeypatch):
+    import contextlib
+    import sys
+    from types import SimpleNamespace
+
+    class FakeProc:
+        def __init__(self, pid, name, cmdline, children=()):
+            self.pid = pid
+            self._name = name
+            self._cmdline = cmdline
+            self._children = list(children)
+
+        def oneshot(self):
+            return contextlib.nullcontext()
+
+        def name(self):
+            return self._name
+
+        def cmdline(self):
+            return self._cmdline
+
+        def children(self, recursive=False):
+            return self._children
+
+    organizer = FakeProc(20, 'python.exe', ['python', 'Organizer.py'])
+    nssm = FakeProc(10, 'nssm.exe', ['nssm.exe'], children=[organizer])
+    procs = {10: nssm}
+    monkeypatch.setattr(helpers.psutil, 'win_service_get', lambda name: SimpleNamespace(pid=lambda: 10), raising=False)
+    monkeypatch.setattr(helpers.psutil, 'Process', lambda pid: procs[pid])
+
+    def process_iter(attrs):
+        raise AssertionError('fell back to a full process scan')
+
+    monkeypatch.setattr(helpers.psutil, 'process_iter', process_iter)
+    monkeypatch.setitem(sys.modules, '__main__', SimpleNamespace(SERVICE_NAME='DownloadsOrganizer'))
+    monkeypatch.setattr(helpers, '_organizer_proc', {"proc": None})
+    helpers.find_organizer_proc.cache_clear()
+    try:
+        assert helpers.find_organizer_proc() is organizer
+    finally:
+        helpers.find_organizer_proc.cache_clear()
+
+
+def test_service_running_queries_scm_in_process(monkeypatch):
+    import sys
+    from types import SimpleNamespace
+    monkeypatch.setattr(helpers.sys, 'platform', 'win32')
+    monkeypatch.setitem(sys.modules, '__main__', SimpleNamespace(SERVICE_NAME='DownloadsOrganizer'))
+    monkeypatch.setattr(helpers.psutil, 'win_service_get',
+                        lambda name: SimpleNamespace(status=lambda: 'running'), raising=False)
+
+    def check_output(*args, **kwargs):
+        raise AssertionError('spawned sc')
+
+    monkeypatch.setattr(helpers.subprocess, 'check_output', check_output)
+    helpers.service_running.cache_clear()
+    try:
+        assert helpers.service_running() is True
+    finally:
+        helpers.service_running.cache_clear()
@@ -0,0 +1,95 @@
+from OrganizerDashboard.helpers import log_tail
+
+
+def test_tailer_publishes_complete_lines_to_all_subscribers(tmp_path):
+    path = tmp_path / 'organizer_stdout.log'
+    path.write_bytes(b'old line\n')
+    tailer = log_tail.LogTailer(str(path))
+    a = tailer.subscribe()
+    b = tailer.subscribe()
+    try:
+        with open(path, 'ab') as f:
+            f.write(b'first\nsecond\npart')
+        tailer.poll()
+        with open(path, 'ab') as f:
+            f.write(b'ial\r\n')
+        tailer.poll()
+        for q in (a, b):
+            assert [q.get(timeout=1) for _ in range(3)] == ['first', 'second', 'partial']
+            assert q.empty()
+        # Truncation restarts from the top of the file
+        path.write_bytes(b'fresh\n')
+        tailer.poll()
+        assert a.get(timeout=1) == 'fresh'
+    finally:
+        tailer.unsubscribe(a)
+        tailer.unsubscribe(b)
+    assert tailer._observer is None
+
+
+def test_stream_sends_keepalive_when_quiet(tmp_path, monkeypatch):
+    path = tmp_path / 'organizer_stderr.log'
+    path.write_bytes(b'')
+    monkeypatch.setattr(log_tail, 'HEARTBEAT', 0.01)
+    monkeypatch.setattr(log_tail, '_tailers', {})
+    gen = log_tail.stream(str(path))
+    assert next(gen) == ': keep-alive\n\n'
+    path.write_bytes(b'hello\n')
+    frames = [next(gen) for _ in range(2)]
+    assert 'data: hello\n\n' in frames
+    gen.close()
+    assert log_tail.get_tailer(str(path))._observer is None
+
+
+def test_tailer_polls_when_log_folder_is_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_tail, 'POLL_MIN', 0.01)
+    monkeypatch.setattr(log_tail, 'POLL_MAX', 0.05)
+    path = tmp_path / 'logs' / 'organizer_stdout.log'
+    tailer = log_tail.LogTailer(str(path))
+    q = tailer.subscribe()
+    try:
+        assert isinstance(tailer._observer, log_tail._Poller)
+        path.parent.mkdir()
+        path.write_bytes(b'started\n')
+        assert q.get(timeout=2) == 'started'
+    finally:
+        tailer.unsubscribe(q)
+
+
+def test_poller_backs_off_while_idle(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_tail, 'POLL_MIN', 0.1)
+    monkeypatch.setattr(log_tail, 'POLL_MAX', 0.4)
+    waits = []
+
+    class Tailer:
+        results = iter([False, False, False, False, True, False])
+
+        def poll(self):
+            return next(self.results)
+
+    poller = log_tail._Poller(Tailer())
+
+    def wait(interval):
+        waits.append(interval)
+        return len(waits) > 6
+
+    monkeypatch.setattr(poller._stopped, 'wait', wait)
+    poller.run()
+    assert waits == [0.1, 0.2, 0.4, 0.4, 0.4, 0.1, 0.2]
+
+
+def test_stream_coalesces_queued_lines_into_one_event(tmp_path, monkeypatch):
+    path = tmp_path / 'organizer_stdout.log'
+    path.write_bytes(b'')
+    monkeypatch.setattr(log_tail, 'HEARTBEAT', 0.01)
+    monkeypatch.setattr(log_tail, 'Observer', None)
+    monkeypatch.setattr(log_tail, 'POLL_MIN', 60)
+    monkeypatch.setattr(log_tail, '_tailers', {})
+    gen = log_tail.stream(str(path))
+    try:
+        assert next(gen) == ': keep-alive\n\n'
+        path.write_bytes(b'one\ntwo\nthree\n')
+        log_tail.get_tailer(str(path)).poll()
+        assert next(gen) == 'data: one\ndata: two\ndata: three\n\n'
+    finally:
+        gen.close()
@@ -0,0 +1,32 @@
+from OrganizerDashboard.helpers import samplers
+from OrganizerDashboard.routes import metrics
+
+
+class _FakeProc:
+    def __init__(self, pid):
+        self.pid = pid
+
+    def memory_info(self):
+        class _Mem:
+            rss = 64 * 1024 * 1024
+        return _Mem()
+
+    def cpu_percent(self, interval=None):
+        raise AssertionError('metrics should not probe the process CPU itself')
+
+
+def test_service_cpu_comes_from_tasks_sampler(monkeypatch):
+    monkeypatch.setattr(samplers, '_cpu_by_pid', {"map": {42: 12.5}})
+    monkeypatch.setattr(samplers.tasks_sampler, 'get', lambda: [])
+    monkeypatch.setattr(metrics, 'service_running', lambda: True)
+    monkeypatch.setattr(metrics, 'find_organizer_proc', lambda: _FakeProc(42))
+    monkeypatch.setattr(metrics, 'get_cpu_percent', lambda: 30.0)
+    metrics.collect_metrics.cache_clear()
+    try:
+        payload = metrics.collect_metrics()
+    finally:
+        metrics.collect_metrics.cache_clear()
+    assert payload["service_cpu_percent"] == 12.5
+    assert payload["service_memory_mb"] == 64.0
+    # Not measured yet: reported as idle rather than blocking to measure
+    assert samplers.get_process_cpu_percent(7) == 0.0
@@ -1,3 +1,4 @@
+import os
 import pytest
 from OrganizerDashboard import __init__ as pkg
 import OrganizerDashboard as od_main
@@ -59,3 +60,64 @@ def test_duplicates_endpoint_exists(client):
 def test_notifications_api_exists(client):
     resp = client.get("/api/notifications", follow_redirects=True)
     assert resp.status_code in (200, 401, 403)
+
+
+def test_static_urls_carry_cached_version(app, monkeypatch):
+    from flask import url_for
+    with app.test_request_context():
+        url = url_for('static', filename='js/dashboard.js')
+        assert '?v=' in url
+        # Resolved once; later renders don't stat the file again
+        def no_stat(*args, **kwargs):
+            raise AssertionError('stat called')
+        monkeypatch.setattr(os, 'stat', no_stat)
+        assert url_for('static', filename='js/dashboard.js') == url
+
+
+def test_create_app_reuses_built_app(app):
+    # The factory bridge re-executes OrganizerDashboard.py; later calls skip it
+    assert od_main.create_app() is app
+
+
+def test_entry_module_is_executed_once(app):
+    import sys
+    entry = sys.modules['OrganizerDashboard_entry']
+    assert od_main._entry_module() is entry
+
+
+def test_templates_reuse_built_static_urls(app, monkeypatch):
+    import flask
+    template_url_for = app.jinja_env.globals['url_for']
+    with app.test_request_context():
+        url = template_url_for('static', filename='js/dashboard.js')
+        assert url == flask.url_for('static', filename='js/dashboard.js')
+        monkeypatch.setattr(app, 'url_for', lambda *a, **k: pytest.fail('URL rebuilt'))
+        assert template_url_for('static', filename='js/dashboard.js') == url
+
+
+def test_role_edit_through_route_reaches_load_user(app, client, monkeypatch):
+    import base64
+    import sys
+    monkeypatch.setitem(app.config, 'WTF_CSRF_ENABLED', False)
+    headers = {'Authorization': 'Basic ' + base64.b64encode(b'admin:StrongPassw0rd!').decode()}
+    load_user = sys.modules['OrganizerDashboard_entry'].load_user
+    try:
+        resp = client.post('/api/dashboard/users', json={'username': 'smoke_user', 'role': 'viewer'}, headers=headers)
+        assert resp.status_code == 200
+        assert load_user('smoke_user').role == 'viewer'
+        resp = client.post('/api/dashboard/users', json={'username': 'smoke_user', 'role': 'operator'}, headers=headers)
+        assert resp.status_code == 200
+        assert load_user('smoke_user').role == 'operator'
+    finally:
+        client.delete('/api/dashboard/users/smoke_user', headers=headers)
+    assert load_user('smoke_user').role == 'viewer'
+
+
+def test_reset_app_cache_rebuilds_app(app):
+    import sys
+    old_entry = sys.modules['OrganizerDashboard_entry']
+    od_main.reset_app_cache()
+    rebuilt = od_main.create_app()
+    assert rebuilt is not app
+    assert sys.modules['OrganizerDashboard_entry'] is not old_entry
+    assert od_main.create_app() is rebuilt
@@ -0,0 +1,45 @@
+import gzip
+
+from flask import Flask
+
+from OrganizerDashboard.helpers import static_assets
+
+
+def test_static_assets_served_precompressed(tmp_path):
+    body = b'function f() { return 1; }\n' * 200
+    (tmp_path / 'app.js').write_bytes(body)
+    app = Flask(__name__, static_folder=str(tmp_path), static_url_path='/static')
+    static_assets.install(app)
+    client = app.test_client()
+
+    resp = client.get('/static/app.js', headers={'Accept-Encoding': 'gzip'})
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in resp.headers['Vary']
+    assert gzip.decompress(resp.data) == body
+
+    again = client.get('/static/app.js', headers={'Accept-Encoding': 'gzip', 'If-None-Match': resp.headers['ETag']})
+    assert again.status_code == 304
+
+    plain = client.get('/static/app.js', headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.data == body
+    plain.close()
+
+
+def test_compress_response_fallback_gzips_pages():
+    page = '<p>hello</p>\n' * 200
+    app = Flask(__name__)
+    app.after_request(static_assets.compress_response)
+
+    @app.route('/')
+    def index():
+        return page
+
+    client = app.test_client()
+    resp = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(resp.data) == page.encode()
+
+    plain = client.get('/', headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.get_data(as_text=True) == page
@@ -0,0 +1,22 @@
+"""WSGI entry point for running the dashboard under a production server.
+
+Example (Linux/macOS):
+
+    gunicorn -k gevent -w 1 --worker-connections 1000 wsgi:app
+
+Samplers, response caches and rate limits are per process, so run a single
+worker and let gevent provide the concurrency.
+
+Set DASHBOARD_GEVENT=1 to monkey-patch the stdlib before anything else is
+imported, so subprocess, socket and sleep calls made by psutil/requests yield
+to other greenlets instead of blocking the worker.
+"""
+import os
+
+if os.environ.get("DASHBOARD_GEVENT") == "1":
+    from gevent import monkey
+    monkey.patch_all()
+
+from OrganizerDashboard import create_app
+
+app = create_app()